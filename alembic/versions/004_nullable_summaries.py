@@ -0,0 +1,30 @@
+"""Allow NULL Chinese summaries on ProcessedNews for lazy generation.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-11-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Make summary_pro and summary_sci nullable."""
+    op.alter_column('processed_news', 'summary_pro', existing_type=sa.Text(), nullable=True)
+    op.alter_column('processed_news', 'summary_sci', existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    """Restore NOT NULL on summary_pro and summary_sci."""
+    # Rows still waiting for lazy summaries get empty ones
+    op.execute("UPDATE processed_news SET summary_pro = '' WHERE summary_pro IS NULL")
+    op.execute("UPDATE processed_news SET summary_sci = '' WHERE summary_sci IS NULL")
+    op.alter_column('processed_news', 'summary_sci', existing_type=sa.Text(), nullable=False)
+    op.alter_column('processed_news', 'summary_pro', existing_type=sa.Text(), nullable=False)
@@ -0,0 +1,84 @@
+"""Store RawNews content simhash as signed BIGINT plus indexed 16-bit bands.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-11-12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+BANDS = 4
+BAND_BITS = 16
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _band_values(simhash: int) -> dict:
+    """Signed BIGINT and band values for an unsigned 64-bit simhash."""
+    values = {"simhash_signed": simhash - (1 << 64) if simhash >= (1 << 63) else simhash}
+    for band in range(BANDS):
+        values[f"simhash_band_{band}"] = (simhash >> (band * BAND_BITS)) & ((1 << BAND_BITS) - 1)
+    return values
+
+
+def upgrade() -> None:
+    """Add simhash_signed and simhash_band_0..3, then backfill from content_simhash."""
+    op.add_column(
+        'raw_news',
+        sa.Column('simhash_signed', sa.BigInteger(), nullable=True, comment='Content simhash as signed 64-bit integer')
+    )
+    for band in range(BANDS):
+        op.add_column(
+            'raw_news',
+            sa.Column(
+                f'simhash_band_{band}',
+                sa.Integer(),
+                nullable=True,
+                comment=f'Simhash bits {band * BAND_BITS}-{(band + 1) * BAND_BITS - 1}',
+            )
+        )
+        op.create_index(f'ix_raw_news_simhash_band_{band}', 'raw_news', [f'simhash_band_{band}'])
+
+    # Backfill existing rows in batches
+    connection = op.get_bind()
+    update = sa.text(
+        "UPDATE raw_news SET simhash_signed = :simhash_signed, "
+        + ", ".join(f"simhash_band_{band} = :simhash_band_{band}" for band in range(BANDS))
+        + " WHERE id = :id"
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, content_simhash FROM raw_news "
+                "WHERE content_simhash IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        params = []
+        for row_id, content_simhash in rows:
+            try:
+                simhash = int(content_simhash)
+            except (TypeError, ValueError):
+                continue
+            if simhash:
+                params.append({"id": row_id, **_band_values(simhash)})
+        if params:
+            connection.execute(update, params)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Remove simhash_signed and simhash_band_0..3."""
+    for band in reversed(range(BANDS)):
+        op.drop_index(f'ix_raw_news_simhash_band_{band}', table_name='raw_news')
+        op.drop_column('raw_news', f'simhash_band_{band}')
+    op.drop_column('raw_news', 'simhash_signed')
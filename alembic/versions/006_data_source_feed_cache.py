@@ -0,0 +1,38 @@
+"""Add conditional fetch cache columns to data_sources.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-11-13
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add feed_etag, feed_last_modified and feed_body_hash to data_sources."""
+    op.add_column(
+        'data_sources',
+        sa.Column('feed_etag', sa.String(512), nullable=True, comment='ETag of the last stored feed fetch')
+    )
+    op.add_column(
+        'data_sources',
+        sa.Column('feed_last_modified', sa.String(128), nullable=True, comment='Last-Modified of the last stored feed fetch')
+    )
+    op.add_column(
+        'data_sources',
+        sa.Column('feed_body_hash', sa.String(64), nullable=True, comment='SHA-256 of the last stored feed body')
+    )
+
+
+def downgrade() -> None:
+    """Remove the conditional fetch cache columns."""
+    op.drop_column('data_sources', 'feed_body_hash')
+    op.drop_column('data_sources', 'feed_last_modified')
+    op.drop_column('data_sources', 'feed_etag')
@@ -30,8 +30,8 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config import get_settings
-from src.models import RawNews, ProcessedNews
-from src.services.ai import ScoringService
+from src.models import ProcessedNews
+from src.services.ai import ScoringService, ScoringQueue
 from src.database.connection import get_session
 
 async def main():
@@ -47,21 +47,21 @@ async def main():
     print("=" * 80)
     print()
 
+    queue = None
+    unscored = []
+
     try:
-        # [1] 获取未评分的文章
-        print("[1] 查询未评分的文章...")
+        # [1] 领取未评分的文章 (带租约；进程崩溃后租约过期会被下一次运行自动回收)
+        print("[1] 领取未评分的文章...")
 
-        unscored = session.query(RawNews).filter(
-            ~RawNews.id.in_(
-                session.query(ProcessedNews.raw_news_id)
-            )
-        ).order_by(RawNews.published_at.desc()).limit(max_count).all()
+        queue = ScoringQueue(session)
+        unscored = queue.claim(max_count)
 
         if not unscored:
             print("    没有未评分的文章")
             return 0
 
-        print(f"    找到 {len(unscored)} 条未评分的文章")
+        print(f"    领取 {len(unscored)} 条未评分的文章")
         print()
 
         # [2] 初始化评分服务
@@ -71,7 +71,7 @@ async def main():
         print()
 
         # [3] 开始评分 (并行处理)
-        print("[3] 开始评分 (并行处理，10个并发)...")
+        print(f"[3] 开始评分 (并行处理，最多{settings.ai_max_concurrency}个并发，自适应限流)...")
         print(f"    时间: {datetime.now().isoformat()}")
         print()
 
@@ -79,54 +79,56 @@ async def main():
         failed_count = 0
         total_cost = 0.0
 
-        # 并行处理函数
-        async def process_article(idx, article):
-            """处理单篇文章"""
-            try:
-                # 显示进度
-                title_preview = article.title[:40] + "..." if len(article.title) > 40 else article.title
-                print(f"  [{idx:3}/{len(unscored)}] {title_preview}")
-
-                # 调用评分服务
-                result = await service.score_news(article)
-
-                # 提取字段 (使用正确的嵌套结构)
-                score = result.scoring.score
-                cost = result.metadata.cost
-
-                # 保存到数据库 (调用服务的保存方法)
-                await service.save_to_database(article, result)
-
-                print(f"           ✓ 分数: {score}/100, 成本: ${cost:.4f}")
-                return {"status": "success", "cost": cost}
-
-            except Exception as e:
-                error_msg = str(e)[:50]
-                print(f"           ✗ [ERROR] {error_msg}")
-                return {"status": "failed", "error": str(e)}
-
-        # 使用信号量控制并发数
-        semaphore = asyncio.Semaphore(10)  # 最多10个并发
-
-        async def process_with_limit(idx, article):
-            """使用信号量限制并发"""
-            async with semaphore:
-                return await process_article(idx, article)
+        # 流式评分：完成的文章按批保存 (每批一个事务)，批次中途崩溃最多丢失一批未保存的结果
+        # (同时处理的文章数由 AI_MAX_CONCURRENCY 控制，API 并发由服务内的自适应限流器控制)
+        save_batch_size = 20
+        pending_saves = []
+
+        async def flush_saves():
+            nonlocal scored_count, failed_count, total_cost
+            saved, save_errors = await service.save_batch_to_database(pending_saves)
+            scored_count += len(saved)
+            total_cost += sum(record.cost for record in saved)
+            failed_count += len(save_errors)
+            claimed_by_id = {article.id: article for article, _ in pending_saves}
+            for error in save_errors:
+                print(f"           ✗ [ERROR] 保存失败 ({error['raw_news_id']}): {error['error'][:50]}")
+                queue.fail(claimed_by_id[error["raw_news_id"]], error["error"])
+            pending_saves.clear()
+
+        # 近似重复文章：复用已评分相似文章的结果，不调用 LLM
+        candidates, reused = service.find_reusable(unscored)
+        if reused:
+            await service.save_reused_to_database(reused)
+            print(f"    复用 {len(reused)} 条近似重复文章的评分结果 (未调用 LLM)")
+            print()
+
+        # 本地预评分：明显低于发布阈值的文章直接保存轻量记录，不调用 LLM
+        to_score, prescored = service.prescreen(candidates)
+        if prescored:
+            await service.save_prescored_to_database(prescored)
+            print(f"    预评分跳过 {len(prescored)} 条低相关文章 (未调用 LLM)")
+            print()
+
+        async for event in service.batch_score_stream(to_score):
+            article = event.raw_news
+            title_preview = article.title[:40] + "..." if len(article.title) > 40 else article.title
+            print(f"  [{event.completed:3}/{event.total}] {title_preview}")
+
+            if not event.ok:
+                failed_count += 1
+                print(f"           ✗ [ERROR] {str(event.error)[:50]}")
+                # 指数退避后重试，多次失败后标记为 failed
+                queue.fail(article, str(event.error))
+                continue
 
-        # 并行处理所有文章
-        tasks = [process_with_limit(idx, article) for idx, article in enumerate(unscored, 1)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            print(f"           ✓ 分数: {event.result.scoring.score}/100, 成本: ${event.result.metadata.cost:.4f}")
+            pending_saves.append((article, event.result))
+            if len(pending_saves) >= save_batch_size:
+                await flush_saves()
 
-        # 统计结果
-        for result in results:
-            if isinstance(result, Exception):
-                failed_count += 1
-            elif isinstance(result, dict):
-                if result["status"] == "success":
-                    scored_count += 1
-                    total_cost += result["cost"]
-                else:
-                    failed_count += 1
+        if pending_saves:
+            await flush_saves()
 
         print()
         print("=" * 80)
@@ -134,6 +136,8 @@ async def main():
         print("=" * 80)
         print()
         print(f"  成功: {scored_count}/{len(unscored)}")
+        print(f"  复用结果: {len(reused)}/{len(unscored)}")
+        print(f"  预评分跳过: {len(prescored)}/{len(unscored)}")
         print(f"  失败: {failed_count}/{len(unscored)}")
         print(f"  成功率: {100*scored_count//max(1, len(unscored))}%")
         print()
@@ -199,6 +203,10 @@ async def main():
         print(f"\nERROR: {e}")
         import traceback
         traceback.print_exc()
+        # 归还未完成的领取，下一次运行可立即继续
+        if queue and unscored:
+            session.rollback()
+            queue.release(unscored)
         return 1
 
     finally:
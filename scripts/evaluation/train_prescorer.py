@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Train Pre-Scorer - 训练本地预评分模型
+
+功能：
+  - 从 processed_news 读取历史 LLM 评分 (排除预评分器自己生成的记录)
+  - 按时间顺序切分 80/20，在较新的 20% 上报告各跳过阈值的精确率/召回率
+  - 在全部数据上重新训练并保存模型 (默认路径: PRESCORER_MODEL_PATH)
+
+使用方法：
+  python scripts/evaluation/train_prescorer.py [--output PATH] [--min-samples N]
+
+启用：
+  PRESCORER_ENABLED=true
+  PRESCORER_SKIP_PROBABILITY=0.05  (根据报告中的 missed 列选择)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+import io
+
+# 设置标准输出编码为 UTF-8 (Windows 兼容)
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+from src.models import RawNews, ProcessedNews
+from src.services.ai import PreScorer, prescorer_text
+from src.database.connection import get_session
+
+
+def load_history(session):
+    """Load (text, score, category) for LLM-scored articles, oldest first."""
+    rows = (
+        session.query(RawNews.title, RawNews.content, ProcessedNews.score,
+                      ProcessedNews.category, ProcessedNews.ai_models_used)
+        .join(ProcessedNews, ProcessedNews.raw_news_id == RawNews.id)
+        .order_by(RawNews.published_at.asc())
+        .all()
+    )
+    return [
+        (prescorer_text(title, content), score, category)
+        for title, content, score, category, models in rows
+        if "prescorer" not in (models or [])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the local pre-scorer")
+    parser.add_argument("--output", help="Model path (default: PRESCORER_MODEL_PATH)")
+    parser.add_argument("--min-samples", type=int, default=200,
+                        help="Minimum scored articles required")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    output = args.output or settings.prescorer_model_path
+    session = get_session()
+
+    print("\n" + "=" * 80)
+    print("DeepDive Tracking - Train Pre-Scorer")
+    print("=" * 80)
+    print()
+
+    try:
+        history = load_history(session)
+    finally:
+        session.close()
+
+    print(f"[1] 历史评分文章: {len(history)} 条")
+    if len(history) < args.min_samples:
+        print(f"    样本不足 (至少需要 {args.min_samples} 条)，请先积累更多 LLM 评分")
+        return 1
+
+    texts, scores, categories = (list(column) for column in zip(*history))
+
+    # [2] 时间顺序切分：用旧文章训练，在新文章上评估 (模拟上线后的效果)
+    split = int(len(history) * 0.8)
+    model = PreScorer().fit(texts[:split], scores[:split], categories[:split])
+    report = model.evaluate(texts[split:], scores[split:])
+
+    held_out = len(texts) - split
+    publishable = sum(score >= model.threshold for score in scores[split:])
+    print(f"[2] 评估集: {held_out} 条 (其中 {publishable} 条 >= {model.threshold:.0f} 分)")
+    print()
+    print(f"  {'cutoff':>8} {'skipped':>8} {'skip%':>7} {'precision':>10} {'recall':>8} {'missed':>7}")
+    for row in report:
+        print(
+            f"  {row['cutoff']:>8.2f} {row['skipped']:>8} {row['skip_rate']:>7.1%} "
+            f"{row['precision']:>10.1%} {row['recall']:>8.1%} {row['missed']:>7}"
+        )
+    print()
+    print("  skip% = 节省的 LLM 调用比例；missed = 会被误跳过的可发布文章数")
+    print()
+
+    # [3] 全量重新训练并保存
+    model = PreScorer().fit(texts, scores, categories)
+    model.save(output)
+    print(f"[3] 模型已保存: {output} (训练样本 {model.trained_on} 条)")
+    print(f"    当前跳过阈值 PRESCORER_SKIP_PROBABILITY={settings.prescorer_skip_probability}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -188,8 +188,10 @@ class DailyWorkflow:
             print("\n[WARN] 采集失败，但继续处理已有的新闻...")
 
         # Step 2: AI 评分 (评分200篇以确保多样性)
+        # 多个 worker 通过数据库租约协作，评分耗时受 LLM 延迟限制，并行可大幅缩短
+        # 按价值排序 (来源优先级 × 新鲜度 × 预评分)，并在 20 分钟超时前留出余量停止派发新批次
         if not self.run_command(
-            "python scripts/evaluation/score_collected_news.py 200",
+            "python -m src.cli score-worker --workers 4 --max-articles 200 --deadline-seconds 1080",
             "评分",
             "对采集的新闻进行 AI 智能评分 (200篇，确保来源多样性)"
         ):
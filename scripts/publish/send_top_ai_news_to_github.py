@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.services.channels.github.github_publisher import GitHubPublisher
 from src.services.selection import DiversityAwareSelector
+from src.services.ai import ScoringService
 from src.config.settings import get_settings
 from src.models import ProcessedNews, RawNews
 from sqlalchemy import desc
@@ -97,6 +98,21 @@ async def main():
             # Access the relationship while session is still open
             _ = news.raw_news
 
+        # Lazy mode: generate the summary the digest renders before closing
+        if settings.ai_lazy_summaries and top_news:
+            try:
+                generated = await ScoringService(settings, session).ensure_summaries_many(
+                    top_news, ["professional"]
+                )
+                print(f"[OK] Generated {generated} summaries on demand")
+            except Exception as e:
+                print(f"[WARNING] Lazy summary generation failed: {e}")
+            # The commit (or rollback) expired the rows; reload them before closing
+            for news in top_news:
+                session.refresh(news)
+                if news.raw_news:
+                    session.refresh(news.raw_news)
+
         session.close()
 
         if not selected_candidates:
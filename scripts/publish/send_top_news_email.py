@@ -21,6 +21,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from src.services.channels.email.email_publisher import EmailPublisher
+from src.services.ai import ScoringService
 from src.config.settings import get_settings
 from src.models import ProcessedNews, RawNews
 from src.database.connection import get_session
@@ -419,6 +420,23 @@ async def main():
             logger.info(f"  [{idx}] {title} (Score: {score}, Published: {published})")
             print(f"    [{idx}] Score:{score:3.0f} | {published} | {title[:50]}")
 
+        # Lazy mode: generate the summaries the email renders (zh + en professional)
+        if settings.ai_lazy_summaries:
+            try:
+                service = ScoringService(settings, session)
+                generated = await service.ensure_summaries_many(
+                    top_news, ["professional", "professional_en"]
+                )
+                logger.info(f"Generated {generated} lazy summaries")
+                print(f"  Generated {generated} summaries on demand")
+            except Exception as e:
+                logger.warning(f"Lazy summary generation failed: {e}")
+            # The commit (or rollback) expired the rows; reload them before closing
+            for news in top_news:
+                session.refresh(news)
+                if news.raw_news:
+                    session.refresh(news.raw_news)
+
         print("  Status: PASS")
 
     except Exception as e:
@@ -18,7 +18,7 @@ import sys
 import os
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 import io
 import json
 
@@ -139,8 +139,9 @@ for various industries including education, healthcare, and scientific research.
 
     try:
         # 创建 mock 响应
-        with patch("src.services.ai.scoring_service.OpenAI"):
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
             service.client = Mock()
+            service.client.chat.completions.create = AsyncMock()
 
             # Mock 评分响应
             mock_scoring = Mock()
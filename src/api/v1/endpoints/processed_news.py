@@ -1,5 +1,6 @@
 """API endpoints for processed news."""
 
+import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -16,6 +17,8 @@ from src.models import ProcessedNews, RawNews
 from src.services.ai import ScoringService
 from src.config.settings import Settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/processed-news", tags=["processed_news"], include_in_schema=True)
 
 
@@ -102,9 +105,13 @@ async def list_processed_news(
 async def get_processed_news(
     news_id: int,
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> ProcessedNewsResponse:
     """Get a specific processed news item.
 
+    With AI_LAZY_SUMMARIES, summaries not generated yet are generated (and
+    stored) on this request.
+
     Args:
         news_id: ID of the processed news
 
@@ -119,6 +126,14 @@ async def get_processed_news(
             detail=f"Processed news {news_id} not found"
         )
 
+    if settings.ai_lazy_summaries and not (item.summary_pro and item.summary_sci):
+        try:
+            service = ScoringService(settings, db)
+            await service.ensure_summaries(item, ["professional", "scientific"])
+        except Exception as e:
+            # Serve the article without summaries rather than fail the request
+            logger.warning(f"Lazy summaries for processed news {news_id} failed: {e}")
+
     return ProcessedNewsResponse.model_validate(item)
 
 
@@ -217,6 +232,16 @@ async def batch_process_news(
             skip_errors=request.skip_errors
         )
 
+        # Persist in bulk: one transaction per batch instead of 3 commits per article
+        raw_news_by_id = {raw_news.id: raw_news for raw_news in unprocessed}
+        saved, save_errors = await scoring_service.save_batch_to_database(
+            [(raw_news_by_id[r.raw_news_id], r) for r in results]
+        )
+        if save_errors:
+            saved_ids = {record.raw_news_id for record in saved}
+            results = [r for r in results if r.raw_news_id in saved_ids]
+            errors = errors + save_errors
+
         # Calculate totals
         total_cost = sum(r.metadata.cost for r in results)
         avg_time = (
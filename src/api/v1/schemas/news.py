@@ -51,8 +51,8 @@ class ProcessedNewsResponse(BaseModel):
     score: float = Field(..., description="AI score (0-100)")
     category: str = Field(..., description="Content category")
     confidence: Optional[float] = Field(None, description="Classification confidence")
-    summary_pro: str = Field(..., description="Professional summary")
-    summary_sci: str = Field(..., description="Scientific summary")
+    summary_pro: Optional[str] = Field(None, description="Professional summary (None until generated in lazy mode)")
+    summary_sci: Optional[str] = Field(None, description="Scientific summary (None until generated in lazy mode)")
     keywords: List[str] = Field(default=[], description="Keywords")
     sentiment: Optional[str] = Field(None, description="Sentiment analysis")
     version: int = Field(1, description="Version number")
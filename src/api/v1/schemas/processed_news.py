@@ -11,7 +11,7 @@ class ProcessedNewsResponse(BaseModel):
     id: int = Field(description="Record ID")
     raw_news_id: int = Field(description="Related raw news ID")
     score: float = Field(description="News importance score (0-100)")
-    score_breakdown: Optional[Dict[str, str]] = Field(
+    score_breakdown: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Score breakdown details"
     )
@@ -23,8 +23,14 @@ class ProcessedNewsResponse(BaseModel):
     confidence: Optional[float] = Field(
         description="Classification confidence (0-1)"
     )
-    summary_pro: str = Field(description="Professional summary")
-    summary_sci: str = Field(description="Scientific summary for general audience")
+    summary_pro: Optional[str] = Field(
+        default=None,
+        description="Professional summary (None until generated in lazy mode)"
+    )
+    summary_sci: Optional[str] = Field(
+        default=None,
+        description="Scientific summary for general audience (None until generated in lazy mode)"
+    )
     keywords: Optional[List[str]] = Field(description="Extracted keywords")
     quality_score: Optional[float] = Field(description="Quality score of processing")
     created_at: datetime = Field(description="Creation timestamp")
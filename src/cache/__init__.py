@@ -0,0 +1,9 @@
+"""Local caches."""
+
+from src.cache.response_cache import ResponseCache, content_hash, normalize_text
+
+__all__ = [
+    "ResponseCache",
+    "content_hash",
+    "normalize_text",
+]
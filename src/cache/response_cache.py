@@ -0,0 +1,227 @@
+"""Persistent content-addressed cache for LLM responses.
+
+Backed by a local SQLite file so cached responses survive process restarts
+(re-runs of scoring scripts, crash retries) without any external service.
+Entries expire after a TTL and the least recently used entries are evicted
+once the store grows past its size budget.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normalize text for cache keys (collapse whitespace, strip).
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join((text or "").split())
+
+
+def content_hash(title: Optional[str], content: Optional[str]) -> str:
+    """Hash normalized title + content.
+
+    Articles cross-posted with identical text share the same hash even if
+    their whitespace differs.
+
+    Args:
+        title: Article title
+        content: Article content
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = normalize_text(title) + "\n" + normalize_text(content)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed LLM response cache with TTL and size-based eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = 30 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """Open (or create) the cache store.
+
+        Args:
+            path: SQLite file path (":memory:" for a process-local cache)
+            ttl_seconds: Entry lifetime in seconds
+            max_bytes: Total payload size budget before LRU eviction
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at "
+            "ON llm_responses (accessed_at)"
+        )
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from the parts that determine an LLM response.
+
+        Args:
+            **parts: Key components (provider, model, template version, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding of the parts
+        """
+        canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached JSON value, or None on miss or expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, size, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones, until under budget.
+
+        Evicts down to 90% of the budget so that a full cache does not evict
+        on every single write. Caller must hold the lock.
+        """
+        self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()[0]
+
+        target = int(self.max_bytes * 0.9)
+        if self._total_bytes <= target:
+            return
+
+        freed = 0
+        doomed = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_responses ORDER BY accessed_at"
+        ):
+            doomed.append((key,))
+            freed += size
+            if self._total_bytes - freed <= target:
+                break
+
+        self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", doomed)
+        self._total_bytes -= freed
+        logger.debug(f"Evicted {len(doomed)} LLM cache entries ({freed} bytes)")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes, hits and misses
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        return {
+            "entries": entries,
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
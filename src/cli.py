@@ -0,0 +1,88 @@
+"""Command-line entry point (`deepdive <command>`)."""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from typing import Optional
+
+
+def _score_worker(args: argparse.Namespace) -> int:
+    """Run scoring workers until the queue is drained (or forever with --poll)."""
+    from src.config import get_settings
+    from src.database.connection import get_session
+    from src.tasks.score_worker import run_score_workers
+
+    settings = get_settings()
+
+    async def run() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        # Cloud Run sends SIGTERM before shutdown: stop claiming, finish the batch
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:  # Windows
+                pass
+
+        stats = await run_score_workers(
+            settings,
+            get_session,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            max_articles=args.max_articles,
+            exit_when_idle=not args.poll,
+            poll_interval=args.poll_interval,
+            stop=stop,
+            deadline_seconds=args.deadline_seconds,
+        )
+        scored = sum(s.scored for s in stats)
+        failed = sum(s.failed for s in stats)
+        # Fail only if nothing could be scored at all
+        return 1 if failed and not scored else 0
+
+    return asyncio.run(run())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="deepdive", description="DeepDive Tracking CLI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    worker = subparsers.add_parser(
+        "score-worker",
+        help="Score queued raw news with N async workers (safe to run on many nodes)",
+    )
+    worker.add_argument("--workers", type=int, default=4, help="Workers in this process")
+    worker.add_argument("--batch-size", type=int, default=10, help="Articles claimed per batch")
+    worker.add_argument(
+        "--max-articles", type=int, default=None,
+        help="Stop after claiming this many articles in this process",
+    )
+    worker.add_argument(
+        "--poll", action="store_true",
+        help="Keep polling for new articles instead of exiting when the queue is empty",
+    )
+    worker.add_argument("--poll-interval", type=float, default=30.0, help="Seconds between polls")
+    worker.add_argument(
+        "--deadline-seconds", type=float, default=None,
+        help="Stop dispatching new batches so all work finishes within this many seconds",
+    )
+    worker.set_defaults(func=_score_worker)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -55,6 +55,50 @@ class Settings(BaseSettings):
 
     # AI Provider Selection: "openai" or "grok"
     ai_provider: str = "grok"  # Default to Grok to avoid OpenAI bias
+    # Score + all summaries in a single request (1 round trip instead of 5)
+    ai_combined_scoring: bool = False
+    # Score only; generate summaries on demand once an article is selected
+    # for publishing or requested through the API
+    ai_lazy_summaries: bool = False
+    # Token budget for article content in each prompt (0 = send content verbatim)
+    ai_content_max_tokens: int = 0
+
+    # AI Rate Limiting (adaptive concurrency, per-provider budgets; None = unlimited)
+    ai_max_concurrency: int = 10
+    ai_rate_limit_retries: int = 2
+    xai_requests_per_minute: Optional[int] = None
+    xai_tokens_per_minute: Optional[int] = None
+    openai_requests_per_minute: Optional[int] = None
+    openai_tokens_per_minute: Optional[int] = None
+
+    # AI Provider Routing (grok + openai; weight 0 = fallback/hedge target only)
+    ai_load_balancing: bool = False
+    xai_weight: float = 1.0
+    openai_weight: float = 1.0
+    ai_hedged_requests: bool = False
+    ai_hedge_min_delay_seconds: float = 2.0
+    ai_circuit_failure_rate: float = 0.5
+    ai_circuit_latency_seconds: Optional[float] = None
+    ai_circuit_open_seconds: float = 30.0
+
+    # Scoring scheduler (value = source priority x freshness x pre-score)
+    scheduler_recency_half_life_hours: float = 24.0
+
+    # Local pre-scorer (skip LLM calls when P(score >= 60) is below the cutoff)
+    prescorer_enabled: bool = False
+    prescorer_model_path: str = "data/models/prescorer.pkl"
+    prescorer_skip_probability: float = 0.05
+
+    # Result reuse (clone the result of a near-duplicate already scored by the LLM)
+    ai_result_reuse: bool = False
+    ai_result_reuse_max_distance: int = 3  # Simhash Hamming distance
+    ai_result_reuse_window_days: int = 14
+
+    # LLM Response Cache (local SQLite file, keyed on provider/model/prompt/content; opt-in)
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = "data/cache/llm_responses.sqlite3"
+    llm_cache_ttl_seconds: int = 30 * 24 * 3600
+    llm_cache_max_bytes: int = 256 * 1024 * 1024
 
     # Web Crawling
     request_timeout: int = 30
@@ -62,6 +106,12 @@ class Settings(BaseSettings):
     user_agent: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     )
+    http_limit_per_host: int = 4
+    http_max_response_bytes: int = 10 * 1024 * 1024
+    http_dns_cache_seconds: int = 300
+    # Worker processes for feed/HTML parsing and language detection
+    # (0 = event loop's thread pool)
+    collection_process_workers: int = 0
 
     # Content Processing
     min_content_length: int = 100
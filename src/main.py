@@ -151,9 +151,66 @@ def create_app() -> FastAPI:
                     except Exception as add_e:
                         logger.warning(f"Could not add summary_sci_en: {add_e}")
 
+            # Step 3: Apply migration 004 - nullable Chinese summaries (lazy generation)
+            # DROP NOT NULL is a no-op on columns that are already nullable
+            for column in ("summary_pro", "summary_sci"):
+                try:
+                    with _engine.begin() as connection:
+                        connection.execute(
+                            text(f"ALTER TABLE processed_news ALTER COLUMN {column} DROP NOT NULL")
+                        )
+                except Exception as alter_e:
+                    logger.warning(f"Could not make {column} nullable: {alter_e}")
+
+            # Step 4: Apply migration 005 - integer simhash and band columns
+            try:
+                with _engine.begin() as connection:
+                    connection.execute(
+                        text("ALTER TABLE raw_news ADD COLUMN IF NOT EXISTS simhash_signed BIGINT NULL")
+                    )
+                    for band in range(4):
+                        connection.execute(
+                            text(f"ALTER TABLE raw_news ADD COLUMN IF NOT EXISTS simhash_band_{band} INTEGER NULL")
+                        )
+                        connection.execute(
+                            text(f"CREATE INDEX IF NOT EXISTS ix_raw_news_simhash_band_{band} "
+                                 f"ON raw_news (simhash_band_{band})")
+                        )
+                    # Backfill from the unsigned decimal string
+                    result = connection.execute(text(
+                        "UPDATE raw_news SET "
+                        "simhash_signed = (CASE WHEN content_simhash::numeric >= 9223372036854775808 "
+                        "THEN content_simhash::numeric - 18446744073709551616 "
+                        "ELSE content_simhash::numeric END)::bigint, "
+                        "simhash_band_0 = mod(content_simhash::numeric, 65536)::int, "
+                        "simhash_band_1 = mod(div(content_simhash::numeric, 65536), 65536)::int, "
+                        "simhash_band_2 = mod(div(content_simhash::numeric, 4294967296), 65536)::int, "
+                        "simhash_band_3 = div(content_simhash::numeric, 281474976710656)::int "
+                        "WHERE simhash_signed IS NULL AND content_simhash ~ '^[0-9]+$' "
+                        "AND content_simhash <> '0'"
+                    ))
+                    logger.info(f"Simhash band columns ready ({result.rowcount} rows backfilled)")
+            except Exception as band_e:
+                logger.warning(f"Could not add simhash band columns: {band_e}")
+
+            # Step 5: Apply migration 006 - conditional fetch cache columns
+            try:
+                with _engine.begin() as connection:
+                    for column, column_type in (
+                        ("feed_etag", "VARCHAR(512)"),
+                        ("feed_last_modified", "VARCHAR(128)"),
+                        ("feed_body_hash", "VARCHAR(64)"),
+                    ):
+                        connection.execute(
+                            text(f"ALTER TABLE data_sources ADD COLUMN IF NOT EXISTS {column} {column_type} NULL")
+                        )
+                logger.info("Feed cache columns ready")
+            except Exception as cache_e:
+                logger.warning(f"Could not add feed cache columns: {cache_e}")
+
             logger.info("Database initialization completed successfully")
 
-            # Step 3: Initialize data sources
+            # Step 6: Initialize data sources
             logger.info("Initializing data sources...")
             from src.services.setup.data_source_manager import initialize_data_sources
 
@@ -675,7 +732,7 @@ def create_app() -> FastAPI:
                     results.append({
                         "title": news.title[:60],
                         "score": result.scoring.score,
-                        "summary_pro": result.summaries.summary_pro[:50] if result.summaries.summary_pro else None,
+                        "summary_pro": result.summaries.summary_pro[:50] if result.summaries else None,
                         "cost": result.metadata.cost
                     })
                 except Exception as e:
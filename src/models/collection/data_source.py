@@ -41,6 +41,11 @@ class DataSource(BaseModel, Base):
     error_count: Mapped[int] = mapped_column(Integer, default=0)
     consecutive_failures: Mapped[int] = mapped_column(Integer, default=0)
 
+    # Conditional fetch cache (feed validators from the last stored fetch)
+    feed_etag: Mapped[Optional[str]] = mapped_column(String(512))
+    feed_last_modified: Mapped[Optional[str]] = mapped_column(String(128))
+    feed_body_hash: Mapped[Optional[str]] = mapped_column(String(64))
+
     # Capabilities
     supports_pagination: Mapped[bool] = mapped_column(Boolean, default=False)
     supports_filter: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -19,6 +19,11 @@ class RawNews(BaseModel, Base):
     language: Mapped[str] = mapped_column(String(10), default="en")
     hash: Mapped[str] = mapped_column(String(64), unique=False, nullable=False, index=True)  # Allow duplicates for tracking, keep index for performance
     content_simhash: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True, comment="Content simhash for similarity detection (stored as string to support unsigned 64-bit)")
+    simhash_signed: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True, comment="Content simhash as signed 64-bit integer")
+    simhash_band_0: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Simhash bits 0-15")
+    simhash_band_1: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Simhash bits 16-31")
+    simhash_band_2: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Simhash bits 32-47")
+    simhash_band_3: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True, comment="Simhash bits 48-63")
     author: Mapped[Optional[str]] = mapped_column(String(255))
     source_name: Mapped[Optional[str]] = mapped_column(String(255))
     published_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -29,9 +29,10 @@ class ProcessedNews(BaseModel, Base):
     sub_categories: Mapped[Optional[List[str]]] = mapped_column(JSON, default=[])
     confidence: Mapped[Optional[float]] = mapped_column(Float)
 
-    # Content generation - Chinese versions
-    summary_pro: Mapped[str] = mapped_column(Text, nullable=False)
-    summary_sci: Mapped[str] = mapped_column(Text, nullable=False)
+    # Content generation - Chinese versions (None until generated when
+    # AI_LAZY_SUMMARIES is on)
+    summary_pro: Mapped[Optional[str]] = mapped_column(Text)
+    summary_sci: Mapped[Optional[str]] = mapped_column(Text)
 
     # Content generation - English versions
     summary_pro_en: Mapped[Optional[str]] = mapped_column(Text)
@@ -1,29 +1,52 @@
 """AI services module for scoring, classification, and content generation."""
 
-from src.services.ai.scoring_service import ScoringService
+from src.services.ai.scoring_service import ScoringService, BatchScoreEvent, ensure_publishable_summaries
+from src.services.ai.scoring_queue import ScoringQueue
+from src.services.ai.scoring_scheduler import ScoringScheduler
+from src.services.ai.provider_router import ProviderRouter, CircuitBreaker
+from src.services.ai.content_compactor import ContentCompactor, CompactionResult, count_tokens
+from src.services.ai.prescorer import PreScorer, PreScore, prescorer_text
+from src.services.ai.result_reuse import ReuseMatch
 from src.services.ai.models import (
     ScoringResponse,
     SummaryResponse,
     ProcessingMetadata,
     FullScoringResult,
+    CombinedScoringResponse,
     CategoryEnum,
 )
 from src.services.ai.prompt_templates import (
     get_scoring_prompt,
     get_summary_prompt,
+    get_combined_prompt,
     SCORING_SYSTEM_PROMPT,
     CATEGORIES,
 )
 
 __all__ = [
     "ScoringService",
+    "BatchScoreEvent",
+    "ensure_publishable_summaries",
+    "ScoringQueue",
+    "ScoringScheduler",
+    "ProviderRouter",
+    "CircuitBreaker",
+    "ContentCompactor",
+    "CompactionResult",
+    "count_tokens",
+    "PreScorer",
+    "PreScore",
+    "prescorer_text",
+    "ReuseMatch",
     "ScoringResponse",
     "SummaryResponse",
     "ProcessingMetadata",
     "FullScoringResult",
+    "CombinedScoringResponse",
     "CategoryEnum",
     "get_scoring_prompt",
     "get_summary_prompt",
+    "get_combined_prompt",
     "SCORING_SYSTEM_PROMPT",
     "CATEGORIES",
 ]
@@ -0,0 +1,308 @@
+"""Token-budgeted compaction of article content before prompt construction.
+
+Extracted article bodies can run to tens of thousands of characters and the
+same body is sent to every scoring and summary call. Content within the
+per-call token budget is left untouched; longer content has boilerplate
+stripped, then keeps the lead paragraphs and the highest-information
+sentences that fit the budget, in their original order.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import tiktoken
+except ImportError:
+    # tiktoken is part of the optional "ai" extra; fall back to an estimate
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Encoding used by GPT-4-class models; Grok's tokenizer counts similarly
+TOKENIZER_ENCODING = "cl100k_base"
+
+# Marker inserted where sentences were dropped
+GAP_MARKER = "[...]"
+
+# Whole lines that are page chrome: navigation labels and calls to action
+CHROME_LABELS = [
+    r"advertisement|sponsored( content)?|ad",
+    r"(share|tweet|email|print)( this( article| story| post)?)?",
+    r"share (on|via) (twitter|facebook|linkedin|x|weibo|wechat)",
+    r"(read more|related( articles| stories| posts)?|recommended( for you)?|see also|more stories)[:.]?",
+    r"(subscribe( now)?|sign up)( (to|for) (our|the)( (free|daily|weekly))? newsletters?)?[.!]?",
+    r"(click here|follow us)( on| to)? .{0,40}",
+    r"download (our|the) app.{0,40}",
+    r"((privacy policy|cookie (policy|settings)|terms of (use|service)|contact us)\s*[|·•]?\s*)+",
+    r"we use cookies.{0,160}",
+    r"(相关阅读|推荐阅读|延伸阅读|点击(这里|查看|阅读)(原文|全文|更多)?)[:：]?",
+    r"(欢迎)?(订阅|关注)(我们|本号|公众号)[。！!]?",
+    r"(扫码|扫描二维码|长按(识别)?二维码).{0,40}",
+]
+_CHROME_LABEL_RE = re.compile("|".join(f"(?:{p})" for p in CHROME_LABELS), re.IGNORECASE)
+
+# Whole lines that open like chrome (credits, bylines, notices). Real
+# sentences can open the same way, so these never apply to the title or lead.
+BOILERPLATE_PATTERNS = [
+    r"(©|copyright\b).{0,120}|.{0,120}\ball rights reserved\.?",
+    r"(photo|image|video)( credit)?:.{0,160}|.{0,80}(getty images|reuters|ap photo)\)?",
+    r"(版权所有|转载请注明|免责声明|责任编辑|原标题|来源)[:：\s].{0,120}|(版权所有|转载请注明出处)[。]?",
+]
+_BOILERPLATE_RE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# Boilerplate lines are short; longer lines are always article text
+MAX_BOILERPLATE_CHARS = 200
+
+# A "." inside a token (3.5, GPT-4.5, e.g.) does not end a sentence
+_SENTENCE_RE = re.compile(r"(?:[^.!?。！？\n]|[.!?](?=[^\s\"'”’)]))+(?:[.!?。！？]+[\"'”’)]*|$)")
+_TERM_RE = re.compile(r"[A-Za-z][A-Za-z0-9\-+.]*[A-Za-z0-9+]|[A-Za-z]|\d+(?:\.\d+)?%?|[\u4e00-\u9fff]{2}")
+_CJK_RE = re.compile(r"[\u3000-\u303f\u4e00-\u9fff\uff00-\uffef]")
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the local tokenizer (estimated without tiktoken).
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+    if tiktoken is not None:
+        return len(_encoding().encode(text, disallowed_special=()))
+    # ~1 token per CJK character, ~4 characters per token otherwise
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def strip_boilerplate(content: str, title: Optional[str] = None) -> str:
+    """Remove page chrome, repeated lines and excess whitespace.
+
+    A line is dropped only when the whole line is chrome. The title and the
+    lead (first line that is not a chrome label) are always kept.
+
+    Args:
+        content: Extracted article text
+        title: Article title
+
+    Returns:
+        Cleaned text with paragraphs separated by blank lines
+    """
+    protected = {_normalize_line(title or "").lower()}
+    seen = set()
+    paragraphs = []
+    for line in content.splitlines():
+        line = _normalize_line(line)
+        if not line:
+            continue
+        key = line.lower()
+        if len(line) <= MAX_BOILERPLATE_CHARS:
+            if _CHROME_LABEL_RE.fullmatch(line):
+                continue
+            if paragraphs and key not in protected and _BOILERPLATE_RE.fullmatch(line):
+                continue
+        if key in seen:
+            continue
+        seen.add(key)
+        paragraphs.append(line)
+    return "\n\n".join(paragraphs)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens.
+
+    Args:
+        text: Text to cut
+        max_tokens: Token limit
+
+    Returns:
+        Leading part of the text
+    """
+    if max_tokens <= 0:
+        return ""
+    if tiktoken is not None:
+        tokens = _encoding().encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # A cut inside a multi-byte character decodes to U+FFFD
+        return _encoding().decode(tokens[:max_tokens]).rstrip("\ufffd")
+    # Shrink by the estimate until it fits
+    while count_tokens(text) > max_tokens:
+        text = text[:min(len(text) * max_tokens // count_tokens(text), len(text) - 1)]
+    return text
+
+
+def _normalize_line(line: str) -> str:
+    return re.sub(r"\s+", " ", line).strip()
+
+
+def _terms(text: str) -> list[str]:
+    return [term.lower() for term in _TERM_RE.findall(text)]
+
+
+@dataclass
+class CompactionResult:
+    """Compacted content and its token accounting."""
+
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        """Tokens removed from every prompt that includes the content."""
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def compacted(self) -> bool:
+        """Whether any content was removed."""
+        return self.saved_tokens > 0
+
+
+class ContentCompactor:
+    """Shrinks article content to a token budget, keeping the most informative parts."""
+
+    def __init__(self, max_tokens: int = 2000, lead_paragraphs: int = 2, lead_share: float = 0.5):
+        """Initialize compactor.
+
+        Args:
+            max_tokens: Token budget for the content part of each prompt
+            lead_paragraphs: Opening paragraphs kept before sentence selection
+            lead_share: Share of the budget the lead paragraphs may use
+        """
+        self.max_tokens = max_tokens
+        self.lead_paragraphs = lead_paragraphs
+        self.lead_share = lead_share
+
+    def compact(self, title: Optional[str], content: Optional[str]) -> CompactionResult:
+        """Compact article content to the token budget.
+
+        Content that already fits is returned unchanged.
+
+        Args:
+            title: Article title (its terms raise sentence scores)
+            content: Article content
+
+        Returns:
+            Compaction result
+        """
+        content = content or ""
+        original_tokens = count_tokens(content)
+        if original_tokens <= self.max_tokens:
+            # Within budget: send the article exactly as extracted
+            return CompactionResult(content, original_tokens, original_tokens)
+
+        text = strip_boilerplate(content, title)
+        lead = next((line for line in map(_normalize_line, content.splitlines()) if line), "")
+        if len(text) < len(lead):
+            # Everything looked like chrome; the original is safer than nothing
+            text = "\n\n".join(filter(None, map(_normalize_line, content.splitlines())))
+        tokens = count_tokens(text)
+        if tokens > self.max_tokens:
+            text = self._select(title or "", text)
+            tokens = count_tokens(text)
+
+        return CompactionResult(text, original_tokens, tokens)
+
+    def _select(self, title: str, text: str) -> str:
+        """Keep lead paragraphs plus the best-scoring sentences within budget."""
+        paragraphs = text.split("\n\n")
+
+        # (paragraph index, sentence) for every sentence, in document order
+        sentences = [
+            (p_index, sentence.strip())
+            for p_index, paragraph in enumerate(paragraphs)
+            for sentence in _SENTENCE_RE.findall(paragraph)
+            if sentence.strip()
+        ]
+        # Charge every sentence for a possible gap marker and separators so
+        # the assembled text stays within budget
+        overhead = count_tokens(GAP_MARKER) + 2
+        costs = [count_tokens(sentence) + overhead for _, sentence in sentences]
+
+        budget = self.max_tokens
+        keep = set()
+        used = 0
+
+        # Lead paragraphs first: news puts who/what/when up front
+        lead_budget = budget * self.lead_share
+        for index, (p_index, _) in enumerate(sentences):
+            if p_index >= self.lead_paragraphs or used + costs[index] > lead_budget:
+                break
+            keep.add(index)
+            used += costs[index]
+
+        # Then the remaining sentences by information density
+        scores = self._score_sentences(title, [sentence for _, sentence in sentences])
+        ranked = sorted(
+            (index for index in range(len(sentences)) if index not in keep),
+            key=lambda index: -scores[index],
+        )
+        for index in ranked:
+            if used + costs[index] <= budget:
+                keep.add(index)
+                used += costs[index]
+
+        if not keep and sentences:
+            # Nothing fits whole: keep as much of the first sentence as fits
+            p_index, sentence = sentences[0]
+            sentences[0] = (p_index, truncate_to_tokens(sentence, budget - overhead))
+            keep.add(0)
+
+        return self._assemble(sentences, keep)
+
+    @staticmethod
+    def _score_sentences(title: str, sentences: list[str]) -> list[float]:
+        """Score sentences by IDF-weighted terms, title overlap and figures."""
+        term_lists = [_terms(sentence) for sentence in sentences]
+        document_frequency = Counter(term for terms in term_lists for term in set(terms))
+        title_terms = set(_terms(title))
+        total = len(sentences)
+
+        scores = []
+        for terms in term_lists:
+            if not terms:
+                scores.append(0.0)
+                continue
+            unique = set(terms)
+            score = sum(math.log(1 + total / document_frequency[term]) for term in unique)
+            score += 2.0 * len(unique & title_terms)
+            score += sum(1.0 for term in unique if term[0].isdigit())
+            # Normalize so long sentences do not win on length alone
+            scores.append(score / math.sqrt(len(terms)))
+        return scores
+
+    @staticmethod
+    def _assemble(sentences: list[tuple[int, str]], keep: set) -> str:
+        """Join kept sentences in order, marking gaps and paragraph breaks."""
+        parts = []
+        current_paragraph = None
+        skipped = False
+        for index, (p_index, sentence) in enumerate(sentences):
+            if index not in keep:
+                skipped = True
+                continue
+            if skipped and parts:
+                parts.append(f" {GAP_MARKER} " if p_index == current_paragraph else f"\n\n{GAP_MARKER}\n\n")
+            elif current_paragraph is not None and p_index != current_paragraph:
+                parts.append("\n\n")
+            elif parts:
+                parts.append(" ")
+            parts.append(sentence)
+            current_paragraph = p_index
+            skipped = False
+        if skipped and parts:
+            parts.append(f"\n\n{GAP_MARKER}")
+        return "".join(parts)
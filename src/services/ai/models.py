@@ -1,6 +1,6 @@
 """Data models for AI scoring service."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -118,17 +118,84 @@ class SummaryResponse(BaseModel):
         description="Scientific summary for general audience (English, max 30 words)"
     )
 
+    @classmethod
+    def validate_field(cls, name: str, value: Any) -> Optional[str]:
+        """Validate a single summary field against its constraints.
+
+        Args:
+            name: Summary field name (e.g. "summary_pro")
+            value: Candidate summary value
+
+        Returns:
+            The validated summary, or None if it fails validation
+        """
+        try:
+            validated = cls.__pydantic_validator__.validate_assignment(
+                cls.model_construct(), name, value
+            )
+        except ValidationError:
+            return None
+        return getattr(validated, name)
+
+
+class CombinedScoringResponse(ScoringResponse):
+    """Response from the single-call scoring + summaries API.
+
+    Extends the scoring fields with the four summaries so that one request
+    can populate a complete FullScoringResult. Summary fields are kept
+    unconstrained here and validated one by one, so that a single bad
+    summary does not invalidate the whole response.
+    """
+
+    summary_pro: Optional[str] = Field(default=None, description="Professional summary (Chinese)")
+    summary_sci: Optional[str] = Field(default=None, description="Scientific summary (Chinese)")
+    summary_pro_en: Optional[str] = Field(default=None, description="Professional summary (English)")
+    summary_sci_en: Optional[str] = Field(default=None, description="Scientific summary (English)")
+
+    def to_scoring(self) -> ScoringResponse:
+        """Return the scoring part of the response."""
+        return ScoringResponse(**self.model_dump(include=set(ScoringResponse.model_fields)))
+
+    def valid_summaries(self) -> Dict[str, str]:
+        """Return the summaries that pass SummaryResponse validation.
+
+        Returns:
+            Mapping of summary field name to validated summary text
+        """
+        summaries = {}
+        for name in SummaryResponse.model_fields:
+            value = SummaryResponse.validate_field(name, getattr(self, name))
+            if value is not None:
+                summaries[name] = value
+        return summaries
+
 
 class ProcessingMetadata(BaseModel):
     """Metadata about processing."""
 
     ai_models_used: List[str] = Field(default_factory=list, description="AI models used")
+    providers: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Provider that answered each operation"
+    )
     processing_time_ms: int = Field(description="Processing time in milliseconds")
     cost: float = Field(description="API cost in USD")
     cost_breakdown: Dict[str, float] = Field(
         default_factory=dict,
         description="Cost breakdown by operation"
     )
+    cache_hits: List[str] = Field(
+        default_factory=list,
+        description="Operations served from the response cache (zero cost)"
+    )
+    content_tokens: Optional[int] = Field(
+        default=None,
+        description="Tokens of article content sent per prompt (after compaction)"
+    )
+    content_tokens_saved: int = Field(
+        default=0,
+        description="Content tokens removed from each prompt by compaction"
+    )
 
     class Config:
         """Pydantic config."""
@@ -151,7 +218,10 @@ class FullScoringResult(BaseModel):
 
     raw_news_id: int = Field(description="ID of the raw news")
     scoring: ScoringResponse = Field(description="Scoring result")
-    summaries: SummaryResponse = Field(description="Summaries")
+    summaries: Optional[SummaryResponse] = Field(
+        default=None,
+        description="Summaries (None when they are generated lazily)"
+    )
     metadata: ProcessingMetadata = Field(description="Processing metadata")
     quality_score: Optional[float] = Field(
         default=None,
@@ -0,0 +1,210 @@
+"""Cheap local pre-scorer that predicts whether an article is worth LLM scoring.
+
+Hashed character n-gram TF-IDF features feed three linear models trained on
+processed_news history:
+
+- a classifier for P(score >= publish threshold), which decides skipping
+- a regressor for the expected score
+- a category classifier
+
+The last two fill the lightweight record saved for skipped articles. Character
+n-grams work for both Chinese and English text without a tokenizer.
+"""
+
+import logging
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.linear_model import LogisticRegression, Ridge
+except ImportError:
+    # scikit-learn is part of the optional "ai" extra
+    np = None
+    HashingVectorizer = None
+
+logger = logging.getLogger(__name__)
+
+# Characters of content used as features (titles are always included)
+MAX_CONTENT_CHARS = 2000
+
+
+@dataclass
+class PreScore:
+    """Pre-scorer prediction for one article."""
+
+    probability: float  # P(score >= threshold)
+    predicted_score: float
+    category: str
+
+
+def prescorer_text(title: Optional[str], content: Optional[str]) -> str:
+    """Build the feature text for an article (title weighted twice).
+
+    Args:
+        title: Article title
+        content: Article content
+
+    Returns:
+        Text fed to the vectorizer
+    """
+    title = title or ""
+    return f"{title}\n{title}\n{(content or '')[:MAX_CONTENT_CHARS]}"
+
+
+class PreScorer:
+    """Hashed TF-IDF + linear models trained on historical LLM scores."""
+
+    def __init__(self, threshold: float = 60.0, n_features: int = 2 ** 18):
+        """Initialize an untrained pre-scorer.
+
+        Args:
+            threshold: Publish threshold the classifier predicts against
+            n_features: Hashing space size
+
+        Raises:
+            ImportError: If scikit-learn is not installed
+        """
+        if HashingVectorizer is None:
+            raise ImportError(
+                "scikit-learn is required for the pre-scorer "
+                "(pip install deepdive-tracking[ai])"
+            )
+
+        self.threshold = threshold
+        self.vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=(2, 4),
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+        self.tfidf = TfidfTransformer(sublinear_tf=True)
+        self.classifier = LogisticRegression(max_iter=1000, class_weight="balanced")
+        self.regressor = Ridge(alpha=1.0)
+        self.category_classifier: Optional[LogisticRegression] = None
+        self.default_category = "company_news"
+        self.trained_on = 0
+
+    def _features(self, texts: Sequence[str], fit: bool = False):
+        counts = self.vectorizer.transform(texts)
+        return self.tfidf.fit_transform(counts) if fit else self.tfidf.transform(counts)
+
+    def fit(
+        self, texts: Sequence[str], scores: Sequence[float], categories: Sequence[str]
+    ) -> "PreScorer":
+        """Train on historical articles.
+
+        Args:
+            texts: Feature texts (see prescorer_text)
+            scores: LLM scores (0-100)
+            categories: LLM categories
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the history does not contain both classes
+        """
+        features = self._features(texts, fit=True)
+        scores = np.asarray(scores, dtype=float)
+        labels = scores >= self.threshold
+
+        if labels.all() or not labels.any():
+            raise ValueError(
+                f"Training data needs articles both above and below {self.threshold}"
+            )
+
+        self.classifier.fit(features, labels)
+        self.regressor.fit(features, scores)
+
+        unique_categories = sorted(set(categories))
+        self.default_category = max(unique_categories, key=list(categories).count)
+        if len(unique_categories) > 1:
+            self.category_classifier = LogisticRegression(max_iter=1000)
+            self.category_classifier.fit(features, list(categories))
+
+        self.trained_on = len(texts)
+        return self
+
+    def predict_proba(self, texts: Sequence[str]):
+        """Probability that each article scores at or above the threshold."""
+        return self.classifier.predict_proba(self._features(texts))[:, 1]
+
+    def predict(self, texts: Sequence[str]) -> list[PreScore]:
+        """Predict probability, score and category for each article.
+
+        Args:
+            texts: Feature texts (see prescorer_text)
+
+        Returns:
+            One PreScore per text
+        """
+        features = self._features(texts)
+        probabilities = self.classifier.predict_proba(features)[:, 1]
+        predicted_scores = np.clip(self.regressor.predict(features), 0, 100)
+        if self.category_classifier is not None:
+            categories = self.category_classifier.predict(features)
+        else:
+            categories = [self.default_category] * len(texts)
+
+        return [
+            PreScore(float(p), float(s), str(c))
+            for p, s, c in zip(probabilities, predicted_scores, categories)
+        ]
+
+    def evaluate(
+        self,
+        texts: Sequence[str],
+        scores: Sequence[float],
+        cutoffs: Sequence[float] = (0.02, 0.05, 0.1, 0.2, 0.3),
+    ) -> list[dict]:
+        """Report what skipping at each probability cutoff would do.
+
+        An article is skipped when P(score >= threshold) < cutoff.
+
+        Args:
+            texts: Held-out feature texts
+            scores: Their actual LLM scores
+            cutoffs: Skip probability cutoffs to report
+
+        Returns:
+            One row per cutoff with skip_rate (share of LLM calls saved),
+            precision (share of skipped articles that really were below the
+            threshold), recall (share of below-threshold articles skipped) and
+            missed (publishable articles that would have been skipped)
+        """
+        probabilities = self.predict_proba(texts)
+        below = np.asarray(scores, dtype=float) < self.threshold
+
+        report = []
+        for cutoff in cutoffs:
+            skipped = probabilities < cutoff
+            true_skips = int((skipped & below).sum())
+            report.append({
+                "cutoff": cutoff,
+                "skipped": int(skipped.sum()),
+                "skip_rate": float(skipped.mean()) if len(skipped) else 0.0,
+                "precision": true_skips / skipped.sum() if skipped.any() else 1.0,
+                "recall": true_skips / below.sum() if below.any() else 0.0,
+                "missed": int((skipped & ~below).sum()),
+            })
+        return report
+
+    def save(self, path: str) -> None:
+        """Pickle the trained model to `path`."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> "PreScorer":
+        """Load a model saved with save() (only load files you trained)."""
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+        if not isinstance(model, PreScorer):
+            raise ValueError(f"{path} is not a PreScorer model")
+        return model
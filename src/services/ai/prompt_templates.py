@@ -2,6 +2,9 @@
 
 from typing import Dict, Any
 
+# Bump whenever a prompt below changes so cached LLM responses are not reused
+PROMPT_TEMPLATE_VERSION = "1"
+
 # 8大类别定义
 CATEGORIES = [
     "company_news",      # 公司新闻
@@ -15,27 +18,8 @@ CATEGORIES = [
 ]
 
 
-def get_scoring_prompt(title: str, content: str) -> str:
-    """Generate scoring and classification prompt.
-
-    Args:
-        title: News article title
-        content: News article content
-
-    Returns:
-        Formatted prompt for scoring
-    """
-    return f"""你是AI资讯评分专家。请分析以下AI相关新闻的重要性、影响力和价值。
-
-【新闻标题】
-{title}
-
-【新闻内容】
-{content}
-
-请按照以下要求进行分析，并返回JSON格式的结果：
-
-【评分规则】（0-100分）
+# 评分与分类规则（评分和合并模式共用）
+SCORING_RULES = """【评分规则】（0-100分）
 - 90-100分：行业重大突破、影响深远、改变格局（如GPT-4发布、BERT出现）
 - 70-89分：重要技术进展、新模型发布、重要融资（百万级以上）
 - 50-69分：中等重要性、应用案例、产品更新
@@ -50,23 +34,92 @@ def get_scoring_prompt(title: str, content: str) -> str:
 - policy：政策监管、法规、合规性、安全
 - market_trends：市场趋势、竞争格局、商业分析
 - expert_opinions：专家观点、分析评论、深度解读
-- learning_resources：教程、文档、学习资源、教育内容
+- learning_resources：教程、文档、学习资源、教育内容"""
 
-【返回格式】（必须是有效的JSON）
-{{
-    "score": <0-100整数>,
+SCORING_JSON_FIELDS = """    "score": <0-100整数>,
     "score_reasoning": "<为什么给这个分数，2-3句话>",
     "category": "<选择的分类>",
     "sub_categories": [<相关的次分类，可选，最多3个>],
     "confidence": <0-1之间的浮点数，表示分类置信度>,
     "key_points": [<新闻的3-5个关键要点，每个5-20字>],
     "keywords": [<5-8个关键词，按重要性排序>],
-    "entities": {{
+    "entities": {
         "companies": [<提及的公司名称，最多5个>],
         "technologies": [<提及的技术名称，最多5个>],
         "people": [<提及的人名，最多3个>]
-    }},
-    "impact_analysis": "<简要分析这条新闻的影响，1-2句话>"
+    },
+    "impact_analysis": "<简要分析这条新闻的影响，1-2句话>\""""
+
+
+def get_scoring_prompt(title: str, content: str) -> str:
+    """Generate scoring and classification prompt.
+
+    Args:
+        title: News article title
+        content: News article content
+
+    Returns:
+        Formatted prompt for scoring
+    """
+    return f"""你是AI资讯评分专家。请分析以下AI相关新闻的重要性、影响力和价值。
+
+【新闻标题】
+{title}
+
+【新闻内容】
+{content}
+
+请按照以下要求进行分析，并返回JSON格式的结果：
+
+{SCORING_RULES}
+
+【返回格式】（必须是有效的JSON）
+{{
+{SCORING_JSON_FIELDS}
+}}
+
+请确保返回的是完整、有效的JSON。"""
+
+
+def get_combined_prompt(title: str, content: str) -> str:
+    """Generate a single prompt for scoring plus all four summaries.
+
+    The article is sent once and the model returns the scoring fields
+    together with summary_pro, summary_sci, summary_pro_en and summary_sci_en.
+
+    Args:
+        title: News article title
+        content: News article content
+
+    Returns:
+        Formatted prompt for combined scoring and summarization
+    """
+    return f"""你是AI资讯评分专家。请分析以下AI相关新闻的重要性、影响力和价值，并生成四个版本的摘要。
+
+【新闻标题】
+{title}
+
+【新闻内容】
+{content}
+
+请按照以下要求进行分析，并返回JSON格式的结果：
+
+{SCORING_RULES}
+
+【摘要要求】
+- summary_pro：专业版纯中文摘要，面向技术决策者和AI从业者，50字以内，包含最关键的数据或指标
+- summary_sci：科普版纯中文摘要，面向非专业人士，通俗易懂，50字以内，强调现实意义
+- summary_pro_en：Professional English summary for tech decision-makers, MAXIMUM 30 words, keep key technical terms
+- summary_sci_en：Popular science English summary for non-technical readers, MAXIMUM 30 words, accessible language
+- 即使原文是英文，中文摘要也必须翻译为中文
+
+【返回格式】（必须是有效的JSON）
+{{
+{SCORING_JSON_FIELDS},
+    "summary_pro": "<50字以内的纯中文专业摘要>",
+    "summary_sci": "<50字以内的纯中文科普摘要>",
+    "summary_pro_en": "<professional summary in 30 words or less>",
+    "summary_sci_en": "<popular science summary in 30 words or less>"
 }}
 
 请确保返回的是完整、有效的JSON。"""
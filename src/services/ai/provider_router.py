@@ -0,0 +1,406 @@
+"""Routing of LLM calls across providers.
+
+The router picks a provider per call by weight, skips providers whose circuit
+breaker is open, falls back to the remaining providers when a call fails and,
+for latency-sensitive calls, sends a hedged duplicate to a second provider
+when the first has not answered within its observed p95 latency.
+
+Latency is measured from when a request is actually sent. Attempts that
+first wait in a local queue (such as a rate limiter slot) call
+request_queued() before waiting and request_sent() once the request goes
+out, so queueing neither feeds the latency percentiles and circuit
+breakers nor triggers hedges.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Latency samples kept per provider for percentiles and hedge delays
+LATENCY_SAMPLES = 200
+
+
+class AttemptTimer:
+    """Clock of one attempt, running from when its request was sent.
+
+    Attempts that never report queueing are timed from their start.
+    """
+
+    def __init__(self):
+        self.sent_at: Optional[float] = time.monotonic()
+        self.sent = asyncio.Event()
+        self.sent.set()
+
+    def queued(self) -> None:
+        """The attempt is waiting locally; stop the clock."""
+        self.sent_at = None
+        self.sent.clear()
+
+    def start(self) -> None:
+        """The request is being sent; (re)start the clock."""
+        self.sent_at = time.monotonic()
+        self.sent.set()
+
+    def elapsed(self) -> float:
+        """Seconds since the request was sent (0 while queued)."""
+        return time.monotonic() - self.sent_at if self.sent_at is not None else 0.0
+
+
+_attempt_timer: ContextVar[Optional[AttemptTimer]] = ContextVar("attempt_timer", default=None)
+
+
+def request_queued() -> None:
+    """Report that the current routed attempt is waiting in a local queue."""
+    timer = _attempt_timer.get()
+    if timer is not None:
+        timer.queued()
+
+
+def request_sent() -> None:
+    """Report that the current routed attempt is sending its request."""
+    timer = _attempt_timer.get()
+    if timer is not None:
+        timer.start()
+
+
+def _percentile(samples, q: float) -> Optional[float]:
+    """Nearest-rank percentile of `samples` (None when empty)."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker over a sliding window of recent calls.
+
+    The circuit opens when the error rate or the p95 latency of the last
+    `window_size` calls crosses its threshold. After `open_seconds` it goes
+    half-open: calls are let through again and the first result decides
+    whether it closes or opens for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        latency_threshold_seconds: Optional[float] = None,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+    ):
+        """Initialize breaker.
+
+        Args:
+            failure_rate_threshold: Error rate that opens the circuit
+            latency_threshold_seconds: p95 latency that opens the circuit
+                (None = latency is not considered)
+            window_size: Recent calls considered
+            min_calls: Calls required before the circuit can open
+            open_seconds: How long the circuit stays open
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+
+        self.state = self.CLOSED
+        self.opened_count = 0
+        self._opened_at = 0.0
+        # (success, latency seconds) per recent call
+        self._window: deque = deque(maxlen=window_size)
+
+    def allow(self) -> bool:
+        """Whether calls may currently be sent to the provider."""
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self.state = self.HALF_OPEN
+        return self.state != self.OPEN
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and its latency."""
+        if self.state == self.HALF_OPEN:
+            self._close()
+        self._window.append((True, latency))
+        self._evaluate()
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self.state == self.HALF_OPEN:
+            self._open("probe failed")
+            return
+        self._window.append((False, None))
+        self._evaluate()
+
+    def _evaluate(self) -> None:
+        if self.state != self.CLOSED or len(self._window) < self.min_calls:
+            return
+
+        failures = sum(1 for success, _ in self._window if not success)
+        error_rate = failures / len(self._window)
+        if error_rate >= self.failure_rate_threshold:
+            self._open(f"error rate {error_rate:.0%}")
+            return
+
+        if self.latency_threshold_seconds is not None:
+            p95 = _percentile([latency for success, latency in self._window if success], 0.95)
+            if p95 is not None and p95 > self.latency_threshold_seconds:
+                self._open(f"p95 latency {p95:.1f}s")
+
+    def _open(self, reason: str) -> None:
+        self.state = self.OPEN
+        self.opened_count += 1
+        self._opened_at = time.monotonic()
+        self._window.clear()
+        logger.warning(f"Circuit opened ({reason}), pausing for {self.open_seconds:.0f}s")
+
+    def _close(self) -> None:
+        self.state = self.CLOSED
+        self._window.clear()
+        logger.info("Circuit closed")
+
+
+class ProviderStats:
+    """Latency and outcome counters for one provider."""
+
+    def __init__(self):
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile in seconds over recent successful calls."""
+        return _percentile(self.latencies, q)
+
+
+class ProviderRouter:
+    """Weighted load balancing, circuit breaking and hedging across providers."""
+
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        hedge_min_delay_seconds: float = 2.0,
+        hedge_min_samples: int = 20,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize router.
+
+        Args:
+            weights: Provider name -> share of traffic. Providers with weight
+                0 only receive calls as a fallback or hedge target.
+            retry_on: Exceptions that count as provider failures and move the
+                call to the next provider; anything else propagates at once
+            hedge_min_delay_seconds: Lower bound on the hedge delay
+            hedge_min_samples: Latency samples required before hedging
+            breakers: Circuit breaker per provider (defaults created if omitted)
+            rng: Random source for weighted selection
+        """
+        if not weights:
+            raise ValueError("ProviderRouter needs at least one provider")
+
+        self.weights = dict(weights)
+        self.retry_on = retry_on
+        self.hedge_min_delay_seconds = hedge_min_delay_seconds
+        self.hedge_min_samples = hedge_min_samples
+        breakers = breakers or {}
+        self.breakers = {name: breakers.get(name) or CircuitBreaker() for name in self.weights}
+        self.provider_stats = {name: ProviderStats() for name in self.weights}
+        self.rng = rng or random.Random()
+        self.logger = logger
+
+    def candidates(self) -> list[str]:
+        """Providers to try for the next call, in order.
+
+        The first is drawn by weight among providers with a closed circuit;
+        the rest follow by descending weight. If every circuit is open, all
+        providers are returned anyway so work degrades rather than stops.
+
+        Returns:
+            Provider names
+        """
+        by_weight = sorted(self.weights, key=lambda name: -self.weights[name])
+        available = [name for name in by_weight if self.breakers[name].allow()]
+        if not available:
+            self.logger.warning("All provider circuits are open, trying them anyway")
+            return by_weight
+
+        weighted = [name for name in available if self.weights[name] > 0]
+        if len(weighted) > 1:
+            first = self.rng.choices(weighted, [self.weights[name] for name in weighted])[0]
+            available.remove(first)
+            available.insert(0, first)
+        return available
+
+    def hedge_delay(self, name: str) -> Optional[float]:
+        """Seconds to wait for `name` before hedging (None = not enough data)."""
+        stats = self.provider_stats[name]
+        if len(stats.latencies) < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay_seconds, stats.percentile(0.95))
+
+    async def call(
+        self, attempt: Callable[[str], Awaitable[T]], hedge: bool = False
+    ) -> T:
+        """Run `attempt(provider_name)` on the best provider, with fallback.
+
+        Args:
+            attempt: Performs the call against the named provider
+            hedge: Send a duplicate to a second provider if the first is slower
+                than its p95 latency; the first success wins
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            Exception: The last provider failure if every provider failed
+        """
+        _, result = await self.call_routed(attempt, hedge)
+        return result
+
+    async def call_routed(
+        self, attempt: Callable[[str], Awaitable[T]], hedge: bool = False
+    ) -> Tuple[str, T]:
+        """Like call, but also return which provider served the result.
+
+        Args:
+            attempt: Performs the call against the named provider
+            hedge: Hedge the call as in call()
+
+        Returns:
+            Tuple of (provider name, result of the first successful attempt)
+
+        Raises:
+            Exception: The last provider failure if every provider failed
+        """
+        order = self.candidates()
+        last_error: Optional[BaseException] = None
+
+        for position, name in enumerate(order):
+            try:
+                if hedge:
+                    backup = order[position + 1] if position + 1 < len(order) else name
+                    return await self._hedged(attempt, name, backup)
+                return name, await self._attempt(attempt, name)
+            except self.retry_on as e:
+                last_error = e
+                if position + 1 < len(order):
+                    self.logger.warning(
+                        f"{name} failed ({str(e)[:100]}), falling back to {order[position + 1]}"
+                    )
+
+        raise last_error
+
+    async def _attempt(
+        self,
+        attempt: Callable[[str], Awaitable[T]],
+        name: str,
+        timer: Optional[AttemptTimer] = None,
+    ) -> T:
+        """Run one attempt and record its outcome (cancellations are not recorded)."""
+        stats = self.provider_stats[name]
+        stats.requests += 1
+        timer = timer or AttemptTimer()
+        token = _attempt_timer.set(timer)
+        try:
+            result = await attempt(name)
+        except self.retry_on:
+            stats.failures += 1
+            self.breakers[name].record_failure()
+            raise
+        finally:
+            _attempt_timer.reset(token)
+
+        latency = timer.elapsed()
+        stats.successes += 1
+        stats.latencies.append(latency)
+        self.breakers[name].record_success(latency)
+        return result
+
+    async def _hedged(
+        self, attempt: Callable[[str], Awaitable[T]], primary: str, backup: str
+    ) -> Tuple[str, T]:
+        """Run on `primary`, adding a duplicate on `backup` after the hedge delay.
+
+        The delay counts from when the primary request was sent; while it
+        waits in a local queue no hedge is sent, as that would only add load
+        when already saturated.
+        """
+        delay = self.hedge_delay(primary)
+        if delay is None:
+            return primary, await self._attempt(attempt, primary)
+
+        timer = AttemptTimer()
+        first = asyncio.ensure_future(self._attempt(attempt, primary, timer))
+        pending = {first}
+        try:
+            while True:
+                if timer.sent_at is None:
+                    sent = asyncio.ensure_future(timer.sent.wait())
+                    await asyncio.wait({first, sent}, return_when=asyncio.FIRST_COMPLETED)
+                    sent.cancel()
+                remaining = delay - timer.elapsed()
+                done, _ = await asyncio.wait(pending, timeout=max(remaining, 0.0))
+                if done:
+                    return primary, first.result()
+                if timer.sent_at is not None and timer.elapsed() >= delay:
+                    break
+
+            self.provider_stats[backup].hedges += 1
+            self.logger.info(f"{primary} slower than {delay:.1f}s, hedging on {backup}")
+            second = asyncio.ensure_future(self._attempt(attempt, backup))
+            pending = {first, second}
+
+            errors = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.provider_stats[backup].hedge_wins += 1
+                            return backup, task.result()
+                        return primary, task.result()
+                    errors.append(task.exception())
+            raise errors[0]
+
+        finally:
+            # Cancel the loser and let it release its rate limiter slot
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """Return per-provider routing statistics."""
+        result = {}
+        for name, stats in self.provider_stats.items():
+            p50 = stats.percentile(0.5)
+            p95 = stats.percentile(0.95)
+            result[name] = {
+                "weight": self.weights[name],
+                "circuit": self.breakers[name].state,
+                "circuit_opened": self.breakers[name].opened_count,
+                "requests": stats.requests,
+                "successes": stats.successes,
+                "failures": stats.failures,
+                "error_rate": stats.failures / stats.requests if stats.requests else 0.0,
+                "p50_ms": round(p50 * 1000) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000) if p95 is not None else None,
+                "hedges": stats.hedges,
+                "hedge_wins": stats.hedge_wins,
+            }
+        return result
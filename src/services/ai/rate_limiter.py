@@ -0,0 +1,205 @@
+"""Adaptive (AIMD) rate limiting for LLM provider calls.
+
+Concurrency grows additively while calls succeed and is cut multiplicatively
+on 429s, so throughput settles just under the provider ceiling without manual
+tuning. Optional requests/min and tokens/min budgets keep bursts inside the
+provider's published limits.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60.0
+
+
+class RequestSlot:
+    """An in-flight request holding a limiter slot."""
+
+    def __init__(self, entry: list):
+        self._entry = entry
+
+    def record_tokens(self, tokens: int) -> None:
+        """Replace the reserved token estimate with the actual usage."""
+        self._entry[1] = tokens
+
+
+class AdaptiveRateLimiter:
+    """AIMD concurrency limiter with per-minute request and token budgets.
+
+    One instance tracks a single provider.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        default_backoff_seconds: float = 1.0,
+    ):
+        """Initialize limiter.
+
+        Args:
+            name: Provider name (for logging)
+            max_concurrency: Upper bound on in-flight requests
+            min_concurrency: Lower bound on in-flight requests
+            initial_concurrency: Starting limit (defaults to half of max)
+            requests_per_minute: Request budget per rolling minute (None = unlimited)
+            tokens_per_minute: Token budget per rolling minute (None = unlimited)
+            decrease_factor: Multiplier applied to the limit on a 429
+            default_backoff_seconds: Pause after a 429 without retry-after
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = float(
+            initial_concurrency or max(self.min_concurrency, self.max_concurrency // 2)
+        )
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.decrease_factor = decrease_factor
+        self.default_backoff_seconds = default_backoff_seconds
+
+        self.in_flight = 0
+        self.rate_limited_count = 0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        # [timestamp, tokens] per request started within the window
+        self._window: deque = deque()
+        self._cond: Optional[asyncio.Condition] = None
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self.limit)
+
+    def _condition(self) -> asyncio.Condition:
+        # Created lazily so the limiter can be built outside an event loop
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a request of `tokens` fits the budgets (0 = now)."""
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            self._window.popleft()
+
+        wait = max(0.0, self._blocked_until - now)
+
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            oldest = self._window[len(self._window) - self.requests_per_minute][0]
+            wait = max(wait, oldest + WINDOW_SECONDS - now)
+
+        if self.tokens_per_minute and self._window:
+            used = sum(entry[1] for entry in self._window)
+            if used + tokens > self.tokens_per_minute:
+                excess = used + tokens - self.tokens_per_minute
+                for timestamp, entry_tokens in self._window:
+                    excess -= entry_tokens
+                    if excess <= 0:
+                        wait = max(wait, timestamp + WINDOW_SECONDS - now)
+                        break
+                else:
+                    # Larger than the whole budget: run once the window is empty
+                    wait = max(wait, self._window[-1][0] + WINDOW_SECONDS - now)
+
+        return wait
+
+    async def acquire(self, estimated_tokens: int = 0) -> RequestSlot:
+        """Wait for a slot within the concurrency limit and budgets.
+
+        Args:
+            estimated_tokens: Tokens to reserve against the per-minute budget
+
+        Returns:
+            Slot to pass to release()
+        """
+        cond = self._condition()
+        async with cond:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(now, estimated_tokens)
+                if wait <= 0 and self.in_flight < self.concurrency:
+                    break
+                try:
+                    await asyncio.wait_for(cond.wait(), timeout=wait if wait > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+
+            self.in_flight += 1
+            entry = [now, estimated_tokens]
+            self._window.append(entry)
+            return RequestSlot(entry)
+
+    async def release(self, success: bool = True) -> None:
+        """Release a slot and grow the limit on success.
+
+        Args:
+            success: Whether the call completed without being rate limited
+        """
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            if success and self.limit < self.max_concurrency:
+                # Additive increase: roughly +1 per `limit` successful calls
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+            cond.notify_all()
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429.
+
+        Cuts the limit multiplicatively (at most once per backoff period, so
+        a burst of 429s from concurrent calls counts once) and pauses new
+        requests until retry-after has passed.
+
+        Args:
+            retry_after: Seconds the provider asked us to wait
+        """
+        now = time.monotonic()
+        backoff = retry_after if retry_after is not None else self.default_backoff_seconds
+        self.rate_limited_count += 1
+        self._blocked_until = max(self._blocked_until, now + backoff)
+
+        if now - self._last_decrease >= backoff:
+            self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+            self._last_decrease = now
+            logger.warning(
+                f"{self.name} rate limited, concurrency -> {self.concurrency}, "
+                f"pausing {backoff:.1f}s"
+            )
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[RequestSlot]:
+        """Context manager around acquire()/release().
+
+        The slot counts as a success unless the body raises.
+        """
+        request_slot = await self.acquire(estimated_tokens)
+        success = False
+        try:
+            yield request_slot
+            success = True
+        finally:
+            await self.release(success)
+
+    def stats(self) -> dict:
+        """Return limiter statistics."""
+        now = time.monotonic()
+        recent = [entry for entry in self._window if now - entry[0] < WINDOW_SECONDS]
+        return {
+            "provider": self.name,
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "requests_last_minute": len(recent),
+            "tokens_last_minute": sum(entry[1] for entry in recent),
+            "rate_limited": self.rate_limited_count,
+        }
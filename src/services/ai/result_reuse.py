@@ -0,0 +1,174 @@
+"""Reuse of scoring results for near-duplicate articles.
+
+Syndicated news is reposted across feeds with small edits. Collection drops
+copies within a Hamming distance of 3 seen in the last week; copies of older
+articles still reach the scoring queue. When such an article's content
+simhash is close to one that already has a full LLM result, the result is
+cloned instead of paying for a new scoring run.
+
+Reuse is opt-in (AI_RESULT_REUSE). Articles further apart than collection's
+duplicate threshold are often updated versions of a story, and cloning would
+give them the old summary, so the default distance stays at that threshold.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.models import ProcessedNews, RawNews
+from src.services.collection.simhash_index import SimhashIndex, from_signed64
+
+logger = logging.getLogger(__name__)
+
+# Simhash bits that may differ for a prior result to be reused: the distance
+# collection already treats as a duplicate. Raise it only once measured.
+DEFAULT_MAX_DISTANCE = 3
+
+
+@dataclass
+class ReuseMatch:
+    """An article whose scoring result can be cloned from a prior one."""
+
+    raw_news: RawNews
+    source: ProcessedNews
+    distance: int
+
+
+def parse_simhash(value) -> Optional[int]:
+    """Parse a stored simhash (string or int); None if missing or invalid."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def find_reusable(
+    session: Session,
+    raw_news_list: Sequence[RawNews],
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+    window_days: int = 14,
+) -> Tuple[list[RawNews], list[ReuseMatch]]:
+    """Split articles into those to score and those with a reusable neighbour.
+
+    Only full LLM results are reused: pre-scored records, records that are
+    themselves reuses and records older than the window are not candidates.
+    The nearest neighbour wins; ties go to the most recent result. Only the
+    IDs and fingerprints of the window are read; full records are loaded for
+    the matches alone.
+
+    Args:
+        session: Database session
+        raw_news_list: Articles about to be scored
+        max_distance: Maximum simhash Hamming distance for reuse
+        window_days: Only reuse results created within this many days
+
+    Returns:
+        Tuple of (articles to score, reuse matches)
+    """
+    fingerprints = {
+        raw_news.id: parse_simhash(raw_news.content_simhash) for raw_news in raw_news_list
+    }
+    if not any(fingerprints.values()):
+        return list(raw_news_list), []
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
+    candidates = (
+        session.query(ProcessedNews.id, RawNews.simhash_signed, RawNews.content_simhash)
+        .join(RawNews, ProcessedNews.raw_news_id == RawNews.id)
+        .filter(
+            RawNews.content_simhash.isnot(None),
+            ProcessedNews.created_at >= cutoff,
+            ProcessedNews.previous_id.is_(None),
+            or_(
+                ProcessedNews.quality_notes.is_(None),
+                ProcessedNews.quality_notes != "prescored",
+            ),
+        )
+        .order_by(ProcessedNews.created_at.desc())
+        .all()
+    )
+    # Most recent first, so the first of equally near neighbours wins
+    neighbours = SimhashIndex(max_distance=max_distance)
+    for processed_id, simhash_signed, simhash in candidates:
+        # Rows from before the integer columns only have the string form
+        fingerprint = from_signed64(simhash_signed) if simhash_signed is not None else parse_simhash(simhash)
+        if fingerprint:
+            neighbours.insert(fingerprint, processed_id)
+
+    to_score = []
+    nearest = {}
+    for raw_news in raw_news_list:
+        fingerprint = fingerprints[raw_news.id]
+        best = None
+        if fingerprint:
+            for processed_id, distance in neighbours.query(fingerprint):
+                if best is None or distance < best[1]:
+                    best = (processed_id, distance)
+        if best is None:
+            to_score.append(raw_news)
+        else:
+            nearest[raw_news.id] = best
+
+    sources = {}
+    if nearest:
+        source_ids = {processed_id for processed_id, _ in nearest.values()}
+        sources = {
+            processed_news.id: processed_news
+            for processed_news in session.query(ProcessedNews).filter(ProcessedNews.id.in_(source_ids))
+        }
+    matches = [
+        ReuseMatch(raw_news, sources[nearest[raw_news.id][0]], nearest[raw_news.id][1])
+        for raw_news in raw_news_list
+        if raw_news.id in nearest
+    ]
+
+    return to_score, matches
+
+
+def clone_processed_news(match: ReuseMatch) -> ProcessedNews:
+    """Build a ProcessedNews record for an article from its neighbour's result.
+
+    The clone links to its source through previous_id and costs nothing.
+
+    Args:
+        match: Reuse match
+
+    Returns:
+        New (unsaved) record
+    """
+    source = match.source
+    return ProcessedNews(
+        raw_news_id=match.raw_news.id,
+        score=source.score,
+        score_breakdown={
+            **(source.score_breakdown or {}),
+            "reused_from": source.id,
+            "simhash_distance": match.distance,
+        },
+        category=source.category,
+        sub_categories=source.sub_categories,
+        confidence=source.confidence,
+        summary_pro=source.summary_pro,
+        summary_sci=source.summary_sci,
+        summary_pro_en=source.summary_pro_en,
+        summary_sci_en=source.summary_sci_en,
+        keywords=source.keywords,
+        entities=source.entities,
+        tech_terms=source.tech_terms,
+        infrastructure_tags=source.infrastructure_tags,
+        company_mentions=source.company_mentions,
+        ai_models_used=source.ai_models_used,
+        processing_time_ms=0,
+        cost=0.0,
+        cost_breakdown={},
+        quality_score=source.quality_score,
+        quality_notes="reused",
+        version=1,
+        previous_id=source.id,
+    )
@@ -0,0 +1,218 @@
+"""Crash-safe scoring work queue on top of raw_news.status.
+
+State machine (per RawNews row):
+
+    raw --claim--> processing --save--> processed
+                       |
+                       +--fail--> raw (next_retry_at = now + backoff)
+                       |          ... or failed after max_retries
+                       +--lease expires--> reclaimed by the next claim
+
+While a row is `processing`, `next_retry_at` holds its lease expiry. A worker
+that dies leaves its rows leased; once the lease expires they are claimed
+again, so a restarted run resumes where the previous one stopped. Finished
+work is never rescored because saving marks the row `processed` in the same
+transaction as the ProcessedNews insert.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.models import DataSource, RawNews, ProcessedNews
+
+if TYPE_CHECKING:
+    from src.services.ai.scoring_scheduler import ScoringScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringQueue:
+    """Lease-based work queue of raw news awaiting scoring."""
+
+    def __init__(
+        self,
+        db_session: Session,
+        lease_seconds: int = 600,
+        max_retries: int = 3,
+        base_backoff_seconds: int = 60,
+        max_backoff_seconds: int = 3600,
+    ):
+        """Initialize queue.
+
+        Args:
+            db_session: SQLAlchemy session
+            lease_seconds: How long a claim is held before it can be reclaimed
+            max_retries: Failed attempts before an article is marked failed
+            base_backoff_seconds: Delay before the first retry (doubles per attempt)
+            max_backoff_seconds: Upper bound on the retry delay
+        """
+        self.db_session = db_session
+        self.lease_seconds = lease_seconds
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.logger = logger
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def _claimable(self, now: datetime):
+        """Filter for rows that are due for scoring or whose lease expired."""
+        return and_(
+            or_(
+                and_(
+                    RawNews.status == "raw",
+                    or_(RawNews.next_retry_at.is_(None), RawNews.next_retry_at <= now),
+                ),
+                and_(RawNews.status == "processing", RawNews.next_retry_at <= now),
+            ),
+            ~select(ProcessedNews.id)
+            .where(ProcessedNews.raw_news_id == RawNews.id)
+            .exists(),
+        )
+
+    def claim(
+        self, limit: int, scheduler: Optional["ScoringScheduler"] = None
+    ) -> list[RawNews]:
+        """Claim up to `limit` articles for scoring, best first.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers on
+        Postgres never claim the same rows (the clause is ignored on SQLite).
+        Rows whose lease expired are reclaimed; that counts as a failed
+        attempt so an article that keeps killing workers ends up `failed`.
+
+        Without a scheduler, candidates come from the database by source
+        priority and recency. With one, the newest `limit * candidate_factor`
+        candidates are fetched and ordered only by the scheduler's expected
+        value (priority, recency and pre-score), so the database sort does
+        not decide which articles get a chance.
+
+        Args:
+            limit: Maximum number of articles to claim
+            scheduler: Ranks candidates by expected value
+
+        Returns:
+            Claimed articles (status `processing`, leased until next_retry_at),
+            in the order they should be scored
+        """
+        now = self._now()
+        if scheduler:
+            fetch = limit * scheduler.candidate_factor
+            order = (RawNews.published_at.desc().nulls_last(), RawNews.id.desc())
+        else:
+            fetch = limit
+            order = (DataSource.priority.desc().nulls_last(), RawNews.published_at.desc().nulls_last())
+        candidates = self.db_session.execute(
+            select(RawNews, DataSource.priority)
+            .outerjoin(DataSource, DataSource.id == RawNews.source_id)
+            .where(self._claimable(now))
+            .order_by(*order)
+            .limit(fetch)
+            .with_for_update(skip_locked=True, of=RawNews)
+        ).all()
+
+        if scheduler:
+            rows = scheduler.rank([(raw_news, priority) for raw_news, priority in candidates])[:limit]
+        else:
+            rows = [raw_news for raw_news, _ in candidates]
+
+        claimed = []
+        lease_expiry = now + timedelta(seconds=self.lease_seconds)
+        for raw_news in rows:
+            if raw_news.status == "processing":
+                raw_news.retry_count = (raw_news.retry_count or 0) + 1
+                self.logger.warning(
+                    f"Reclaiming raw_news {raw_news.id} after expired lease "
+                    f"(attempt {raw_news.retry_count})"
+                )
+                if raw_news.retry_count >= self.max_retries:
+                    raw_news.status = "failed"
+                    raw_news.next_retry_at = None
+                    raw_news.error_message = "Lease expired too many times"
+                    continue
+
+            raw_news.status = "processing"
+            raw_news.next_retry_at = lease_expiry
+            claimed.append(raw_news)
+
+        self.db_session.commit()
+        self.logger.info(f"Claimed {len(claimed)} articles for scoring")
+        return claimed
+
+    def fail(self, raw_news: RawNews, error: str) -> None:
+        """Record a failed attempt and schedule a retry with exponential backoff.
+
+        Args:
+            raw_news: Claimed article
+            error: Error description
+        """
+        raw_news.retry_count = (raw_news.retry_count or 0) + 1
+        raw_news.error_message = str(error)[:2000]
+
+        if raw_news.retry_count >= self.max_retries:
+            raw_news.status = "failed"
+            raw_news.next_retry_at = None
+            self.logger.warning(
+                f"raw_news {raw_news.id} failed {raw_news.retry_count} times, giving up"
+            )
+        else:
+            delay = min(
+                self.max_backoff_seconds,
+                self.base_backoff_seconds * 2 ** (raw_news.retry_count - 1),
+            )
+            raw_news.status = "raw"
+            raw_news.next_retry_at = self._now() + timedelta(seconds=delay)
+            self.logger.info(
+                f"raw_news {raw_news.id} will be retried in {delay}s "
+                f"(attempt {raw_news.retry_count}/{self.max_retries})"
+            )
+
+        self.db_session.commit()
+
+    def release(self, raw_news_list: list[RawNews]) -> None:
+        """Return unfinished claims to the queue without counting an attempt.
+
+        Args:
+            raw_news_list: Claimed articles that were not processed
+        """
+        released = 0
+        for raw_news in raw_news_list:
+            if raw_news.status == "processing":
+                raw_news.status = "raw"
+                raw_news.next_retry_at = None
+                released += 1
+        self.db_session.commit()
+        if released:
+            self.logger.info(f"Released {released} unfinished claims")
+
+    def stats(self) -> dict:
+        """Return queue statistics.
+
+        Returns:
+            Dictionary with counts per status, articles due now and expired leases
+        """
+        now = self._now()
+        counts = dict(
+            self.db_session.execute(
+                select(RawNews.status, func.count()).group_by(RawNews.status)
+            ).all()
+        )
+        due = self.db_session.execute(
+            select(func.count()).select_from(RawNews).where(self._claimable(now))
+        ).scalar_one()
+        expired = self.db_session.execute(
+            select(func.count()).select_from(RawNews).where(
+                RawNews.status == "processing", RawNews.next_retry_at <= now
+            )
+        ).scalar_one()
+
+        return {
+            "by_status": counts,
+            "due": due,
+            "expired_leases": expired,
+        }
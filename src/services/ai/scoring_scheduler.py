@@ -0,0 +1,141 @@
+"""Deadline-aware, value-ordered scheduling of scoring work.
+
+Pending articles are ranked by expected value, the product of
+
+- source priority (DataSource.priority, 1-10)
+- freshness (exponential decay on published_at age)
+- the pre-scorer's P(score >= publish threshold) when a model is loaded
+
+so the daily digests get their best candidates scored first. Given a
+deadline, the scheduler stops dispatching new batches once the next one
+would not finish in time.
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Tuple
+
+from src.models import RawNews
+from src.services.ai.prescorer import PreScorer, prescorer_text
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringScheduler:
+    """Ranks pending articles by expected value and enforces a deadline."""
+
+    def __init__(
+        self,
+        prescorer: Optional[PreScorer] = None,
+        recency_half_life_hours: float = 24.0,
+        default_probability: float = 0.5,
+        candidate_factor: int = 5,
+        deadline: Optional[float] = None,
+        safety_margin_seconds: float = 30.0,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            prescorer: Local pre-scorer (None = every article gets
+                `default_probability`)
+            recency_half_life_hours: Age at which freshness halves
+            default_probability: P(publishable) assumed without a pre-scorer
+            candidate_factor: Candidates fetched per claimed article for ranking
+            deadline: time.monotonic() value by which all work must be done
+                (None = no deadline)
+            safety_margin_seconds: Time kept in reserve before the deadline
+        """
+        self.prescorer = prescorer
+        self.recency_half_life_hours = recency_half_life_hours
+        self.default_probability = default_probability
+        self.candidate_factor = max(1, candidate_factor)
+        self.deadline = deadline
+        self.safety_margin_seconds = safety_margin_seconds
+        # Smoothed seconds per batch, learned from completed batches
+        self.batch_seconds: Optional[float] = None
+        self.logger = logger
+
+    def expected_value(
+        self,
+        priority: Optional[int],
+        published_at: Optional[datetime],
+        probability: float,
+        now: datetime,
+    ) -> float:
+        """Expected value of scoring one article now.
+
+        Args:
+            priority: Source priority (1-10; None counts as the default 5)
+            published_at: Publication time (naive values are taken as UTC)
+            probability: P(score >= publish threshold)
+            now: Current time (timezone-aware)
+
+        Returns:
+            Value in [0, 1]
+        """
+        source_weight = (priority or 5) / 10
+
+        freshness = 1.0
+        if published_at is not None:
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            age_hours = max(0.0, (now - published_at).total_seconds() / 3600)
+            freshness = 0.5 ** (age_hours / self.recency_half_life_hours)
+
+        return probability * source_weight * freshness
+
+    def rank(self, candidates: Sequence[Tuple[RawNews, Optional[int]]]) -> list[RawNews]:
+        """Order candidates by expected value, best first.
+
+        Args:
+            candidates: (article, source priority) pairs
+
+        Returns:
+            Articles, highest expected value first
+        """
+        if not candidates:
+            return []
+
+        if self.prescorer is not None:
+            probabilities = self.prescorer.predict_proba([
+                prescorer_text(raw_news.title, raw_news.content) for raw_news, _ in candidates
+            ])
+        else:
+            probabilities = [self.default_probability] * len(candidates)
+
+        now = datetime.now(timezone.utc)
+        values = [
+            self.expected_value(priority, raw_news.published_at, float(probability), now)
+            for (raw_news, priority), probability in zip(candidates, probabilities)
+        ]
+        order = sorted(range(len(candidates)), key=lambda index: -values[index])
+        return [candidates[index][0] for index in order]
+
+    def time_left(self) -> Optional[float]:
+        """Seconds until the deadline (None = no deadline)."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def can_dispatch(self) -> bool:
+        """Whether another batch can start and still finish before the deadline."""
+        remaining = self.time_left()
+        if remaining is None:
+            return True
+        needed = (self.batch_seconds or 0.0) + self.safety_margin_seconds
+        if remaining < needed:
+            self.logger.info(
+                f"Deadline in {max(remaining, 0):.0f}s, a batch needs ~{needed:.0f}s: "
+                "not dispatching more work"
+            )
+            return False
+        return True
+
+    def record_batch(self, seconds: float) -> None:
+        """Update the batch duration estimate (the slowest recent batch dominates)."""
+        if self.batch_seconds is None:
+            self.batch_seconds = seconds
+        else:
+            # Rise immediately, decay slowly: overrunning the deadline costs more
+            self.batch_seconds = max(seconds, 0.8 * self.batch_seconds + 0.2 * seconds)
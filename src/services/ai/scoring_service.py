@@ -1,54 +1,151 @@
 """AI scoring service for news articles."""
 
+import asyncio
 import json
 import logging
+import math
+import pickle
 import time
-from typing import Optional, Tuple
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from datetime import datetime
 
-from openai import OpenAI, APIError, APIConnectionError, RateLimitError
+from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError
+from pydantic import ValidationError
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from src.models import RawNews, ProcessedNews, CostLog
 from src.services.ai.models import (
+    CategoryEnum,
     ScoringResponse,
     SummaryResponse,
     ProcessingMetadata,
     FullScoringResult,
+    CombinedScoringResponse,
 )
+from src.services.ai.rate_limiter import AdaptiveRateLimiter
+from src.services.ai.provider_router import (
+    CircuitBreaker,
+    ProviderRouter,
+    request_queued,
+    request_sent,
+)
+from src.services.ai.content_compactor import CompactionResult, ContentCompactor, count_tokens
+from src.services.ai.prescorer import PreScore, PreScorer, prescorer_text
+from src.services.ai.result_reuse import ReuseMatch, clone_processed_news, find_reusable
 from src.services.ai.prompt_templates import (
     get_scoring_prompt,
     get_summary_prompt,
+    get_combined_prompt,
+    PROMPT_TEMPLATE_VERSION,
     SCORING_SYSTEM_PROMPT,
 )
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
+from src.cache import ResponseCache, content_hash
 from src.utils.api_response import strip_markdown_code_blocks
 
 logger = logging.getLogger(__name__)
 
+# Summary version -> SummaryResponse field name
+SUMMARY_VERSIONS = {
+    "professional": "summary_pro",
+    "scientific": "summary_sci",
+    "professional_en": "summary_pro_en",
+    "scientific_en": "summary_sci_en",
+}
+
+# Placeholder texts _generate_summary returns when generation fails
+SUMMARY_ERROR_PREFIXES = ("API error:", "Error:", "Summary generation failed")
+
+
+@dataclass
+class BatchScoreEvent:
+    """One finished item from ScoringService.batch_score_stream."""
+
+    index: int  # Position in the input list
+    raw_news: RawNews
+    result: Optional[FullScoringResult]
+    error: Optional[Exception]
+    completed: int
+    succeeded: int
+    failed: int
+    total: int
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was scored successfully."""
+        return self.error is None
+
+    def error_info(self) -> dict:
+        """Error record in the format returned by batch_score."""
+        return {
+            "raw_news_id": self.raw_news.id,
+            "title": self.raw_news.title,
+            "error": str(self.error),
+        }
+
 
 class ScoringService:
     """Service for AI-powered news scoring and classification."""
 
-    def __init__(self, settings: Settings, db_session: Optional[Session] = None):
+    def __init__(
+        self,
+        settings: Settings,
+        db_session: Optional[Session] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiters: Optional[Dict[str, AdaptiveRateLimiter]] = None,
+        prescorer: Optional[PreScorer] = None,
+        router: Optional[ProviderRouter] = None,
+    ):
         """Initialize scoring service.
 
         Args:
             settings: Application settings containing AI provider config
             db_session: SQLAlchemy session for database operations
+            response_cache: LLM response cache (built from settings if omitted)
+            rate_limiters: Per-provider rate limiters (built from settings if
+                omitted); pass shared instances to pool budgets across services
+            prescorer: Local pre-scorer (loaded from settings if omitted)
+            router: Provider router (built from settings if omitted); pass a
+                shared instance to pool circuit breakers and latency stats
         """
         self.settings = settings
         self.db_session = db_session
 
+        # Content-addressed cache: identical articles never pay twice
+        if response_cache is None and settings.llm_cache_enabled:
+            response_cache = ResponseCache(
+                settings.llm_cache_path,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                max_bytes=settings.llm_cache_max_bytes,
+            )
+        self.cache = response_cache
+
         # Select AI provider based on configuration
         self.provider = settings.ai_provider.lower()
         self.logger = logger
 
+        # Score + all summaries in one request instead of five
+        self.combined_scoring = settings.ai_combined_scoring
+        # Score only; summaries come later from ensure_summaries()
+        self.lazy_summaries = settings.ai_lazy_summaries
+
+        # Token budget for article content in each prompt (0 = send verbatim)
+        self.content_compactor = (
+            ContentCompactor(max_tokens=settings.ai_content_max_tokens)
+            if settings.ai_content_max_tokens
+            else None
+        )
+
         # Initialize BOTH providers for automatic fallback
         # Primary provider (Grok or OpenAI)
+        # Async clients so that concurrent calls (summaries, batch workers)
+        # overlap their network round trips instead of blocking the event loop
         if self.provider == "grok":
             # Initialize Grok (xAI) client - uses OpenAI-compatible API
-            self.client = OpenAI(
+            self.client = AsyncOpenAI(
                 api_key=settings.xai_api_key,
                 base_url=settings.xai_base_url
             )
@@ -56,7 +153,7 @@ class ScoringService:
             self.provider_name = "grok"
 
             # Initialize OpenAI as fallback
-            self.fallback_client = OpenAI(api_key=settings.openai_api_key)
+            self.fallback_client = AsyncOpenAI(api_key=settings.openai_api_key)
             self.fallback_model = settings.openai_model
             self.fallback_provider_name = "openai"
 
@@ -65,7 +162,7 @@ class ScoringService:
                 self.logger.info(f"OpenAI fallback available with model {self.fallback_model}")
         else:
             # Default to OpenAI (no fallback needed)
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            self.client = AsyncOpenAI(api_key=settings.openai_api_key)
             self.model = settings.openai_model
             self.provider_name = "openai"
             self.fallback_client = None
@@ -75,6 +172,31 @@ class ScoringService:
             if self.logger:
                 self.logger.info(f"Initialized OpenAI scoring service with model {self.model}")
 
+        # Adaptive concurrency + RPM/TPM budgets per provider
+        if rate_limiters is None:
+            rate_limiters = {
+                name: self._build_rate_limiter(settings, name)
+                for name in (self.provider_name, self.fallback_provider_name)
+                if name
+            }
+        self.rate_limiters = rate_limiters
+        self.rate_limit_retries = settings.ai_rate_limit_retries
+
+        # Weighted load balancing, circuit breakers and hedging across providers
+        self.router = router or self._build_router(settings)
+        self.hedged_requests = settings.ai_hedged_requests
+
+        # Local model that skips LLM calls for clearly irrelevant articles
+        if prescorer is None and settings.prescorer_enabled:
+            prescorer = self._load_prescorer(settings.prescorer_model_path)
+        self.prescorer = prescorer
+        self.prescorer_skip_probability = settings.prescorer_skip_probability
+
+        # Clone results of near-duplicates instead of scoring them again
+        self.result_reuse = settings.ai_result_reuse
+        self.result_reuse_max_distance = settings.ai_result_reuse_max_distance
+        self.result_reuse_window_days = settings.ai_result_reuse_window_days
+
     async def score_news(self, raw_news: RawNews) -> FullScoringResult:
         """Score and classify a single news item.
 
@@ -82,51 +204,60 @@ class ScoringService:
             raw_news: Raw news article to score
 
         Returns:
-            Complete scoring result including summaries and metadata
+            Complete scoring result including summaries (None with
+            AI_LAZY_SUMMARIES, see ensure_summaries) and metadata
 
         Raises:
             ValueError: If API call fails after retries
             APIError: If OpenAI API returns error
         """
-        import asyncio
-
-        start_time = time.time()
+        start_time = time.perf_counter()
         costs = {}
+        # Operation -> provider that answered it (or whose cached answer was used)
+        served: Dict[str, str] = {}
+        # Operations answered from the response cache
+        cache_hits: list[str] = []
 
         try:
-            # Step 1: Score and classify
-            self.logger.info(f"Scoring news {raw_news.id}: {raw_news.title}")
-            scoring, score_cost = await self._call_scoring_api(raw_news)
-            costs["scoring"] = score_cost
-
-            # Steps 2-5: Generate bilingual summaries (4 versions) in parallel
-            self.logger.info(
-                f"Generating bilingual summaries for {raw_news.id} "
-                "(professional/scientific × Chinese/English)"
-            )
-
-            # Parallelize all 4 summary generations
-            summary_results = await asyncio.gather(
-                self._generate_summary(raw_news, scoring, version="professional"),
-                self._generate_summary(raw_news, scoring, version="scientific"),
-                self._generate_summary(raw_news, scoring, version="professional_en"),
-                self._generate_summary(raw_news, scoring, version="scientific_en"),
-                return_exceptions=False,
-            )
-
-            summary_pro, summary_pro_cost = summary_results[0]
-            summary_sci, summary_sci_cost = summary_results[1]
-            summary_pro_en, summary_pro_en_cost = summary_results[2]
-            summary_sci_en, summary_sci_en_cost = summary_results[3]
-
-            costs["summary_pro"] = summary_pro_cost
-            costs["summary_sci"] = summary_sci_cost
-            costs["summary_pro_en"] = summary_pro_en_cost
-            costs["summary_sci_en"] = summary_sci_en_cost
+            # Compact the article once; every prompt below reuses the result
+            compaction = self._compact_content(raw_news)
+            content = compaction.text
+
+            summaries = None
+            if self.lazy_summaries:
+                # Score and classify only; summaries are generated on demand
+                self.logger.info(f"Scoring news {raw_news.id} (lazy summaries): {raw_news.title}")
+                scoring, score_cost = await self._call_scoring_api(
+                    raw_news, content, served, cache_hits
+                )
+                costs["scoring"] = score_cost
+            elif self.combined_scoring:
+                # Single round trip: score + all 4 summaries in one request
+                self.logger.info(f"Scoring news {raw_news.id} (combined mode): {raw_news.title}")
+                scoring, summaries, costs = await self._score_combined(
+                    raw_news, content, served, cache_hits
+                )
+            else:
+                # Step 1: Score and classify
+                self.logger.info(f"Scoring news {raw_news.id}: {raw_news.title}")
+                scoring, score_cost = await self._call_scoring_api(
+                    raw_news, content, served, cache_hits
+                )
+                costs["scoring"] = score_cost
+
+                # Steps 2-5: Generate bilingual summaries (4 versions) in parallel
+                self.logger.info(
+                    f"Generating bilingual summaries for {raw_news.id} "
+                    "(professional/scientific × Chinese/English)"
+                )
+                summaries, summary_costs = await self._generate_summaries(
+                    raw_news, scoring, list(SUMMARY_VERSIONS), content, served, cache_hits
+                )
+                costs.update(summary_costs)
 
             # Calculate total cost and quality score
             total_cost = sum(costs.values())
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = math.ceil((time.perf_counter() - start_time) * 1000)
 
             # Quality score: higher score = better quality
             quality_score = self._calculate_quality_score(scoring)
@@ -134,17 +265,16 @@ class ScoringService:
             result = FullScoringResult(
                 raw_news_id=raw_news.id,
                 scoring=scoring,
-                summaries=SummaryResponse(
-                    summary_pro=summary_pro,
-                    summary_sci=summary_sci,
-                    summary_pro_en=summary_pro_en,
-                    summary_sci_en=summary_sci_en,
-                ),
+                summaries=SummaryResponse(**summaries) if summaries is not None else None,
                 metadata=ProcessingMetadata(
-                    ai_models_used=[self.model],
+                    ai_models_used=self._models_used(served),
+                    providers=served,
                     processing_time_ms=processing_time,
                     cost=total_cost,
                     cost_breakdown=costs,
+                    cache_hits=cache_hits,
+                    content_tokens=compaction.compacted_tokens,
+                    content_tokens_saved=compaction.saved_tokens,
                 ),
                 quality_score=quality_score,
             )
@@ -165,39 +295,97 @@ class ScoringService:
             self.logger.error(f"Unexpected error scoring {raw_news.id}: {str(e)}")
             raise
 
+    def find_reusable(
+        self, raw_news_list: list[RawNews]
+    ) -> Tuple[list[RawNews], list[ReuseMatch]]:
+        """Split off articles whose near-duplicate already has an LLM result.
+
+        Args:
+            raw_news_list: Articles about to be scored
+
+        Returns:
+            Tuple of (articles to score, reuse matches). Without a database
+            session or with AI_RESULT_REUSE off every article is scored.
+        """
+        if not self.result_reuse or not self.db_session or not raw_news_list:
+            return raw_news_list, []
+
+        to_score, matches = find_reusable(
+            self.db_session,
+            raw_news_list,
+            max_distance=self.result_reuse_max_distance,
+            window_days=self.result_reuse_window_days,
+        )
+        if matches:
+            self.logger.info(
+                f"Reusing results for {len(matches)}/{len(raw_news_list)} near-duplicate articles"
+            )
+        return to_score, matches
+
+    def prescreen(
+        self, raw_news_list: list[RawNews]
+    ) -> Tuple[list[RawNews], list[Tuple[RawNews, PreScore]]]:
+        """Split articles into those worth LLM scoring and confident skips.
+
+        Args:
+            raw_news_list: Articles about to be scored
+
+        Returns:
+            Tuple of (articles to score, (article, prediction) pairs to skip).
+            Without a pre-scorer every article is scored.
+        """
+        if self.prescorer is None or not raw_news_list:
+            return raw_news_list, []
+
+        predictions = self.prescorer.predict(
+            [prescorer_text(raw_news.title, raw_news.content) for raw_news in raw_news_list]
+        )
+
+        to_score = []
+        skipped = []
+        for raw_news, prediction in zip(raw_news_list, predictions):
+            if prediction.probability < self.prescorer_skip_probability:
+                skipped.append((raw_news, prediction))
+            else:
+                to_score.append(raw_news)
+
+        if skipped:
+            self.logger.info(
+                f"Pre-scorer skipped {len(skipped)}/{len(raw_news_list)} articles "
+                f"(P(score >= {self.prescorer.threshold:.0f}) < {self.prescorer_skip_probability})"
+            )
+        return to_score, skipped
+
     async def batch_score(
-        self, raw_news_list: list[RawNews], skip_errors: bool = True
+        self,
+        raw_news_list: list[RawNews],
+        skip_errors: bool = True,
+        max_concurrency: Optional[int] = None,
     ) -> Tuple[list[FullScoringResult], list[dict]]:
-        """Score multiple news items.
+        """Score multiple news items concurrently.
+
+        Collects batch_score_stream() into lists; use the stream directly to
+        act on items as soon as they finish.
 
         Args:
             raw_news_list: List of raw news to score
             skip_errors: Whether to skip failed items or raise error
+            max_concurrency: Articles scored at once (defaults to settings.ai_max_concurrency)
 
         Returns:
-            Tuple of (successful results, failed items with errors)
+            Tuple of (successful results, failed items with errors), in input order
         """
-        results = []
-        errors = []
+        events = [None] * len(raw_news_list)
 
-        for i, raw_news in enumerate(raw_news_list, 1):
-            try:
-                result = await self.score_news(raw_news)
-                results.append(result)
-                self.logger.info(f"[{i}/{len(raw_news_list)}] Scored: {raw_news.title}")
+        # aclosing() cancels in-flight items if we stop early on an error
+        async with aclosing(self.batch_score_stream(raw_news_list, max_concurrency)) as stream:
+            async for event in stream:
+                if not event.ok and not skip_errors:
+                    raise event.error
+                events[event.index] = event
 
-            except Exception as e:
-                error_info = {
-                    "raw_news_id": raw_news.id,
-                    "title": raw_news.title,
-                    "error": str(e),
-                }
-                errors.append(error_info)
-
-                if skip_errors:
-                    self.logger.warning(f"[{i}/{len(raw_news_list)}] Error scoring: {str(e)}")
-                else:
-                    raise
+        results = [event.result for event in events if event.ok]
+        errors = [event.error_info() for event in events if not event.ok]
 
         self.logger.info(
             f"Batch scoring complete: {len(results)} successful, "
@@ -205,6 +393,78 @@ class ScoringService:
         )
         return results, errors
 
+    async def batch_score_stream(
+        self,
+        raw_news_list: list[RawNews],
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchScoreEvent]:
+        """Score multiple news items, yielding each as soon as it finishes.
+
+        Items are yielded in completion order with running progress counters,
+        so callers can persist finished work while slow items are in flight.
+        At most `max_concurrency` articles are in progress at once; the
+        per-provider rate limiters further adapt how many API requests are
+        actually in flight. Closing the generator early cancels pending items.
+
+        Args:
+            raw_news_list: List of raw news to score
+            max_concurrency: Articles scored at once (defaults to settings.ai_max_concurrency)
+
+        Yields:
+            BatchScoreEvent per item (result or error)
+        """
+        limit = max_concurrency or self.settings.ai_max_concurrency
+        total = len(raw_news_list)
+        queue = iter(enumerate(raw_news_list))
+        pending: Dict[asyncio.Task, int] = {}
+        completed = succeeded = failed = 0
+
+        def fill() -> None:
+            # Only `limit` tasks exist at a time, however long the list is
+            while len(pending) < limit:
+                item = next(queue, None)
+                if item is None:
+                    return
+                index, raw_news = item
+                pending[asyncio.create_task(self.score_news(raw_news))] = index
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                finished = sorted((pending.pop(task), task) for task in done)
+                # Keep the pipeline full while the caller handles finished items
+                fill()
+
+                for index, task in finished:
+                    raw_news = raw_news_list[index]
+                    error = task.exception()
+                    completed += 1
+                    if error is None:
+                        succeeded += 1
+                        self.logger.info(f"[{completed}/{total}] Scored: {raw_news.title}")
+                    else:
+                        failed += 1
+                        self.logger.warning(
+                            f"[{completed}/{total}] Error scoring {raw_news.id}: {str(error)}"
+                        )
+
+                    yield BatchScoreEvent(
+                        index=index,
+                        raw_news=raw_news,
+                        result=task.result() if error is None else None,
+                        error=error,
+                        completed=completed,
+                        succeeded=succeeded,
+                        failed=failed,
+                        total=total,
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let cancelled tasks finish unwinding before the generator closes
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def save_to_database(
         self, raw_news: RawNews, scoring_result: FullScoringResult
     ) -> ProcessedNews:
@@ -224,53 +484,9 @@ class ScoringService:
             raise ValueError("Database session not configured")
 
         try:
-            # Create ProcessedNews record
-            processed_news = ProcessedNews(
-                raw_news_id=raw_news.id,
-                score=scoring_result.scoring.score,
-                score_breakdown={
-                    "reasoning": scoring_result.scoring.score_reasoning,
-                    "impact": scoring_result.scoring.impact_analysis,
-                },
-                category=scoring_result.scoring.category.value,
-                sub_categories=scoring_result.scoring.sub_categories,
-                confidence=scoring_result.scoring.confidence,
-                summary_pro=scoring_result.summaries.summary_pro,
-                summary_sci=scoring_result.summaries.summary_sci,
-                summary_pro_en=scoring_result.summaries.summary_pro_en,
-                summary_sci_en=scoring_result.summaries.summary_sci_en,
-                keywords=scoring_result.scoring.keywords,
-                entities=scoring_result.scoring.entities.model_dump(),
-                tech_terms=self._extract_tech_terms(
-                    scoring_result.scoring.keywords
-                ),
-                company_mentions=scoring_result.scoring.entities.companies,
-                infrastructure_tags=self._extract_infrastructure_tags(
-                    scoring_result.scoring.category.value
-                ),
-                ai_models_used=scoring_result.metadata.ai_models_used,
-                processing_time_ms=scoring_result.metadata.processing_time_ms,
-                cost=scoring_result.metadata.cost,
-                cost_breakdown=scoring_result.metadata.cost_breakdown,
-                quality_score=scoring_result.quality_score,
-                quality_notes=scoring_result.quality_notes,
-                version=1,
-            )
-
+            processed_news = self._build_processed_news(raw_news, scoring_result)
             self.db_session.add(processed_news)
-            self.db_session.commit()
-
-            # Log cost
-            cost_log = CostLog(
-                processed_news_id=processed_news.id,
-                service=self.provider_name,  # Use dynamic provider name (openai or grok)
-                operation="scoring_and_summarization",
-                model=self.model,
-                total_cost=scoring_result.metadata.cost,
-                extra_metadata=scoring_result.metadata.cost_breakdown,
-            )
-            self.db_session.add(cost_log)
-            self.db_session.commit()
+            self.db_session.add(self._build_cost_log(processed_news, scoring_result))
 
             # Update raw news status
             raw_news.status = "processed"
@@ -287,31 +503,399 @@ class ScoringService:
             self.logger.error(f"Failed to save to database: {str(e)}")
             raise
 
+    async def save_batch_to_database(
+        self,
+        items: list[Tuple[RawNews, FullScoringResult]],
+        batch_size: int = 50,
+    ) -> Tuple[list[ProcessedNews], list[dict]]:
+        """Save many scoring results with one transaction per batch.
+
+        Each batch inserts its ProcessedNews and CostLog rows in bulk, marks
+        the raw news processed with a single UPDATE ... WHERE id IN and
+        commits once. If a batch fails (e.g. an article was already saved by
+        another run), it is rolled back and retried item by item so one bad
+        row does not lose the rest.
+
+        Args:
+            items: (raw news, scoring result) pairs
+            batch_size: Results per transaction
+
+        Returns:
+            Tuple of (saved records, failed items with errors)
+
+        Raises:
+            ValueError: If database session not available
+        """
+        if not self.db_session:
+            raise ValueError("Database session not configured")
+
+        saved = []
+        errors = []
+
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            try:
+                saved.extend(self._write_batch(batch))
+            except Exception as e:
+                self.db_session.rollback()
+                self.logger.warning(
+                    f"Batch save of {len(batch)} results failed, "
+                    f"retrying one by one: {str(e)[:200]}"
+                )
+                for raw_news, scoring_result in batch:
+                    try:
+                        saved.extend(self._write_batch([(raw_news, scoring_result)]))
+                    except Exception as item_error:
+                        self.db_session.rollback()
+                        errors.append({
+                            "raw_news_id": raw_news.id,
+                            "title": raw_news.title,
+                            "error": str(item_error),
+                        })
+
+        self.logger.info(
+            f"Batch save complete: {len(saved)} saved, {len(errors)} failed"
+        )
+        return saved, errors
+
+    async def save_prescored_to_database(
+        self, skipped: list[Tuple[RawNews, PreScore]]
+    ) -> list[ProcessedNews]:
+        """Save lightweight records for articles the pre-scorer skipped.
+
+        The records carry the predicted score (kept below the publish
+        threshold) and category, empty summaries and zero cost, so the
+        articles leave the queue without any LLM call.
+
+        Args:
+            skipped: (article, prediction) pairs from prescreen()
+
+        Returns:
+            Saved records
+
+        Raises:
+            ValueError: If database session not available
+        """
+        if not self.db_session:
+            raise ValueError("Database session not configured")
+        if not skipped:
+            return []
+
+        threshold = self.prescorer.threshold if self.prescorer else 100.0
+        records = [
+            ProcessedNews(
+                raw_news_id=raw_news.id,
+                score=round(min(prediction.predicted_score, threshold - 1), 1),
+                score_breakdown={
+                    "reasoning": "Skipped by local pre-scorer",
+                    "prescore_probability": round(prediction.probability, 4),
+                },
+                category=prediction.category,
+                summary_pro="",
+                summary_sci="",
+                ai_models_used=["prescorer"],
+                processing_time_ms=0,
+                cost=0.0,
+                cost_breakdown={},
+                quality_notes="prescored",
+                version=1,
+            )
+            for raw_news, prediction in skipped
+        ]
+
+        try:
+            self.db_session.add_all(records)
+            self.db_session.execute(
+                update(RawNews)
+                .where(RawNews.id.in_([raw_news.id for raw_news, _ in skipped]))
+                .values(status="processed")
+            )
+            self.db_session.commit()
+        except Exception as e:
+            self.db_session.rollback()
+            self.logger.error(f"Failed to save pre-scored records: {str(e)}")
+            raise
+
+        return records
+
+    async def save_reused_to_database(self, matches: list[ReuseMatch]) -> list[ProcessedNews]:
+        """Save cloned results for near-duplicate articles.
+
+        Each record copies its neighbour's score, classification and
+        summaries, points to it through previous_id and costs nothing.
+
+        Args:
+            matches: Matches from find_reusable()
+
+        Returns:
+            Saved records
+
+        Raises:
+            ValueError: If database session not available
+        """
+        if not self.db_session:
+            raise ValueError("Database session not configured")
+        if not matches:
+            return []
+
+        records = [clone_processed_news(match) for match in matches]
+
+        try:
+            self.db_session.add_all(records)
+            self.db_session.execute(
+                update(RawNews)
+                .where(RawNews.id.in_([match.raw_news.id for match in matches]))
+                .values(status="processed")
+            )
+            self.db_session.commit()
+        except Exception as e:
+            self.db_session.rollback()
+            self.logger.error(f"Failed to save reused results: {str(e)}")
+            raise
+
+        return records
+
+    async def ensure_summaries(
+        self,
+        processed_news: ProcessedNews,
+        versions: Optional[list[str]] = None,
+        commit: bool = True,
+    ) -> Dict[str, str]:
+        """Generate and store the summaries an article is still missing.
+
+        Used with AI_LAZY_SUMMARIES: summaries are only paid for once an
+        article is selected for publishing or requested through the API.
+        Generated summaries are memoized on the record, so each version is
+        generated at most once. Failed generations are not stored and are
+        retried on the next call.
+
+        Args:
+            processed_news: Scored article (its raw_news must be loadable)
+            versions: Summary versions needed (keys of SUMMARY_VERSIONS;
+                default all four)
+            commit: Commit the session after storing (requires db_session)
+
+        Returns:
+            Newly generated summaries by field name
+        """
+        versions = versions or list(SUMMARY_VERSIONS)
+        missing = [
+            version for version in versions
+            if not getattr(processed_news, SUMMARY_VERSIONS[version])
+        ]
+        if not missing:
+            return {}
+
+        raw_news = processed_news.raw_news
+        served: Dict[str, str] = {}
+        summaries, costs = await self._generate_summaries(
+            raw_news, self._stored_scoring(processed_news), missing, served=served
+        )
+
+        generated = {}
+        for field, summary in summaries.items():
+            summary = SummaryResponse.validate_field(field, summary)
+            if summary is None or summary.startswith(SUMMARY_ERROR_PREFIXES):
+                self.logger.warning(
+                    f"Lazy {field} for processed news {processed_news.id} failed, not storing"
+                )
+                continue
+            setattr(processed_news, field, summary)
+            generated[field] = summary
+
+        spent = sum(costs.values())
+        processed_news.cost = (processed_news.cost or 0.0) + spent
+        processed_news.cost_breakdown = {**(processed_news.cost_breakdown or {}), **costs}
+        processed_news.ai_models_used = list(dict.fromkeys(
+            (processed_news.ai_models_used or []) + self._models_used(served)
+        ))
+
+        if self.db_session:
+            provider_name, model = self._attribution(served)
+            self.db_session.add(CostLog(
+                processed_news=processed_news,
+                service=provider_name,
+                operation="summarization",
+                model=model,
+                total_cost=spent,
+                extra_metadata={**costs, "providers": served},
+            ))
+            if commit:
+                try:
+                    self.db_session.commit()
+                except Exception as e:
+                    self.db_session.rollback()
+                    self.logger.error(f"Failed to store lazy summaries: {str(e)}")
+                    raise
+
+        self.logger.info(
+            f"Generated {len(generated)}/{len(missing)} lazy summaries for "
+            f"processed news {processed_news.id}, cost=${spent:.4f}"
+        )
+        return generated
+
+    async def ensure_summaries_many(
+        self,
+        items: list[ProcessedNews],
+        versions: Optional[list[str]] = None,
+    ) -> int:
+        """Ensure summaries for several articles concurrently, with one commit.
+
+        Args:
+            items: Scored articles
+            versions: Summary versions needed (default all four)
+
+        Returns:
+            Number of summaries generated
+        """
+        results = await asyncio.gather(*(
+            self.ensure_summaries(processed_news, versions, commit=False)
+            for processed_news in items
+        ))
+
+        if self.db_session:
+            try:
+                self.db_session.commit()
+            except Exception as e:
+                self.db_session.rollback()
+                self.logger.error(f"Failed to store lazy summaries: {str(e)}")
+                raise
+
+        return sum(len(generated) for generated in results)
+
+    @staticmethod
+    def _stored_scoring(processed_news: ProcessedNews) -> ScoringResponse:
+        """Rebuild the scoring fields summary prompts need from a stored record."""
+        breakdown = processed_news.score_breakdown or {}
+        return ScoringResponse.model_construct(
+            score=processed_news.score,
+            category=CategoryEnum(processed_news.category),
+            key_points=breakdown.get("key_points") or processed_news.keywords or [],
+        )
+
+    def _write_batch(
+        self, batch: list[Tuple[RawNews, FullScoringResult]]
+    ) -> list[ProcessedNews]:
+        """Insert one batch of results and commit (caller handles rollback)."""
+        records = [
+            self._build_processed_news(raw_news, scoring_result)
+            for raw_news, scoring_result in batch
+        ]
+        self.db_session.add_all(records)
+        self.db_session.flush()
+
+        self.db_session.add_all([
+            self._build_cost_log(record, scoring_result)
+            for record, (_, scoring_result) in zip(records, batch)
+        ])
+        self.db_session.execute(
+            update(RawNews)
+            .where(RawNews.id.in_([raw_news.id for raw_news, _ in batch]))
+            .values(status="processed")
+        )
+        self.db_session.commit()
+        return records
+
+    def _build_processed_news(
+        self, raw_news: RawNews, scoring_result: FullScoringResult
+    ) -> ProcessedNews:
+        """Build the ProcessedNews record for a scoring result."""
+        summaries = scoring_result.summaries
+        return ProcessedNews(
+            raw_news_id=raw_news.id,
+            score=scoring_result.scoring.score,
+            score_breakdown={
+                "reasoning": scoring_result.scoring.score_reasoning,
+                "impact": scoring_result.scoring.impact_analysis,
+                # Kept so summaries can be generated later without re-scoring
+                "key_points": scoring_result.scoring.key_points,
+            },
+            category=scoring_result.scoring.category.value,
+            sub_categories=scoring_result.scoring.sub_categories,
+            confidence=scoring_result.scoring.confidence,
+            summary_pro=summaries.summary_pro if summaries else None,
+            summary_sci=summaries.summary_sci if summaries else None,
+            summary_pro_en=summaries.summary_pro_en if summaries else None,
+            summary_sci_en=summaries.summary_sci_en if summaries else None,
+            keywords=scoring_result.scoring.keywords,
+            entities=scoring_result.scoring.entities.model_dump(),
+            tech_terms=self._extract_tech_terms(
+                scoring_result.scoring.keywords
+            ),
+            company_mentions=scoring_result.scoring.entities.companies,
+            infrastructure_tags=self._extract_infrastructure_tags(
+                scoring_result.scoring.category.value
+            ),
+            ai_models_used=scoring_result.metadata.ai_models_used,
+            processing_time_ms=scoring_result.metadata.processing_time_ms,
+            cost=scoring_result.metadata.cost,
+            cost_breakdown=scoring_result.metadata.cost_breakdown,
+            quality_score=scoring_result.quality_score,
+            quality_notes=scoring_result.quality_notes,
+            version=1,
+        )
+
+    def _build_cost_log(
+        self, processed_news: ProcessedNews, scoring_result: FullScoringResult
+    ) -> CostLog:
+        """Build the CostLog record for a scoring result."""
+        # Attributed to the provider that answered the scoring call
+        provider_name, model = self._attribution(scoring_result.metadata.providers)
+        return CostLog(
+            processed_news=processed_news,
+            service=provider_name,
+            operation="scoring_and_summarization",
+            model=model,
+            total_cost=scoring_result.metadata.cost,
+            extra_metadata={
+                **scoring_result.metadata.cost_breakdown,
+                "providers": scoring_result.metadata.providers,
+                "content_tokens": scoring_result.metadata.content_tokens,
+                "content_tokens_saved": scoring_result.metadata.content_tokens_saved,
+            },
+        )
+
     # Private methods
 
-    async def _call_scoring_api(self, raw_news: RawNews) -> Tuple[ScoringResponse, float]:
+    async def _call_scoring_api(
+        self,
+        raw_news: RawNews,
+        content: Optional[str] = None,
+        served: Optional[Dict[str, str]] = None,
+        cache_hits: Optional[list[str]] = None,
+    ) -> Tuple[ScoringResponse, float]:
         """Call AI API for scoring and classification with automatic fallback.
 
         Args:
             raw_news: Raw news to score
+            content: Compacted article content (compacted here if omitted)
+            served: Records which provider answered, under "scoring"
+            cache_hits: Records "scoring" if the answer came from the cache
 
         Returns:
             Tuple of (ScoringResponse, API cost)
         """
-        prompt = get_scoring_prompt(raw_news.title, raw_news.content or "")
+        temperature = 0.7
+        cached, provider_name = self._cache_lookup(raw_news, "scoring", temperature)
+        if cached is not None:
+            self._record_served(served, "scoring", provider_name)
+            self._record_cache_hit(cache_hits, "scoring")
+            return ScoringResponse(**cached), 0.0
+
+        prompt = get_scoring_prompt(raw_news.title, self._prompt_content(raw_news, content))
+
+        response, provider_name = await self._complete_with_fallback(
+            hedge=True,
+            messages=[
+                {"role": "system", "content": SCORING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=1000,
+        )
+        self._record_served(served, "scoring", provider_name)
 
-        # Try primary provider first
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SCORING_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-                max_tokens=1000,
-            )
-
             # Parse response
             response_text = response.choices[0].message.content
 
@@ -326,59 +910,508 @@ class ScoringService:
 
             response_json = json.loads(response_text)
 
-            # Calculate cost (rough estimate)
-            # GPT-4o: ~$0.005 per 1K input tokens, ~$0.015 per 1K output tokens
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            cost = (input_tokens * 0.000005 + output_tokens * 0.000015)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Invalid JSON in API response: {str(e)}")
+            self.logger.error(f"Response text was: {repr(response_text[:500])}")
+            raise ValueError(f"API returned invalid JSON: {str(e)}") from e
+
+        scoring = ScoringResponse(**response_json)
+        self._cache_set(
+            self._cache_key(raw_news, "scoring", temperature, provider_name),
+            scoring.model_dump(mode="json"),
+        )
+        return scoring, self._calculate_cost(response)
 
-            scoring = ScoringResponse(**response_json)
-            return scoring, cost
+    async def _call_combined_api(
+        self,
+        raw_news: RawNews,
+        content: Optional[str] = None,
+        served: Optional[Dict[str, str]] = None,
+        cache_hits: Optional[list[str]] = None,
+    ) -> Tuple[ScoringResponse, Dict[str, str], float]:
+        """Call AI API once for scoring plus all four summaries.
 
+        Args:
+            raw_news: Raw news to score
+            content: Compacted article content (compacted here if omitted)
+            served: Records which provider answered, under "combined"
+            cache_hits: Records "combined" if the answer came from the cache
+
+        Returns:
+            Tuple of (ScoringResponse, valid summaries by field name, API cost).
+            Summaries that fail validation are left out of the mapping.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            ValidationError: If the scoring fields fail validation
+        """
+        temperature = 0.7
+        cached, provider_name = self._cache_lookup(raw_news, "combined", temperature)
+        if cached is not None:
+            self._record_served(served, "combined", provider_name)
+            self._record_cache_hit(cache_hits, "combined")
+            return ScoringResponse(**cached["scoring"]), cached["summaries"], 0.0
+
+        prompt = get_combined_prompt(raw_news.title, self._prompt_content(raw_news, content))
+
+        response, provider_name = await self._complete_with_fallback(
+            hedge=True,
+            messages=[
+                {"role": "system", "content": SCORING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=2000,
+            response_format={"type": "json_object"},
+        )
+        self._record_served(served, "combined", provider_name)
+
+        response_text = strip_markdown_code_blocks(
+            response.choices[0].message.content or ""
+        )
+        combined = CombinedScoringResponse(**json.loads(response_text))
+        scoring = combined.to_scoring()
+        summaries = combined.valid_summaries()
+
+        self._cache_set(
+            self._cache_key(raw_news, "combined", temperature, provider_name),
+            {"scoring": scoring.model_dump(mode="json"), "summaries": summaries},
+        )
+        return scoring, summaries, self._calculate_cost(response)
+
+    async def _score_combined(
+        self,
+        raw_news: RawNews,
+        content: Optional[str] = None,
+        served: Optional[Dict[str, str]] = None,
+        cache_hits: Optional[list[str]] = None,
+    ) -> Tuple[ScoringResponse, Dict[str, str], Dict[str, float]]:
+        """Score and summarize in one request, falling back per field.
+
+        Summaries that fail validation are regenerated with individual
+        summary calls. If the scoring part itself is invalid, the whole
+        article goes through the per-call path.
+
+        Args:
+            raw_news: Raw news to score
+            content: Compacted article content (compacted here if omitted)
+            served: Records which provider answered each operation
+            cache_hits: Records operations answered from the cache
+
+        Returns:
+            Tuple of (ScoringResponse, summaries by field name, cost breakdown)
+        """
+        costs = {}
+        content = self._prompt_content(raw_news, content)
+
+        try:
+            scoring, summaries, costs["combined"] = await self._call_combined_api(
+                raw_news, content, served, cache_hits
+            )
+        except (json.JSONDecodeError, ValidationError) as e:
+            self.logger.warning(
+                f"Combined response invalid for {raw_news.id}, "
+                f"falling back to per-call scoring: {str(e)[:200]}"
+            )
+            scoring, costs["scoring"] = await self._call_scoring_api(raw_news, content, served, cache_hits)
+            summaries = {}
+
+        missing = [
+            version for version, key in SUMMARY_VERSIONS.items()
+            if key not in summaries
+        ]
+        if missing:
+            self.logger.info(
+                f"Generating {len(missing)} summaries separately for {raw_news.id}: "
+                f"{', '.join(missing)}"
+            )
+            fallback_summaries, fallback_costs = await self._generate_summaries(
+                raw_news, scoring, missing, content, served, cache_hits
+            )
+            summaries.update(fallback_summaries)
+            costs.update(fallback_costs)
+
+        return scoring, summaries, costs
+
+    async def _generate_summaries(
+        self,
+        raw_news: RawNews,
+        scoring: ScoringResponse,
+        versions: list[str],
+        content: Optional[str] = None,
+        served: Optional[Dict[str, str]] = None,
+        cache_hits: Optional[list[str]] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, float]]:
+        """Generate several summary versions concurrently.
+
+        Args:
+            raw_news: Raw news article
+            scoring: Scoring result
+            versions: Summary versions to generate (keys of SUMMARY_VERSIONS)
+            content: Compacted article content (compacted here if omitted)
+            served: Records which provider answered each summary
+            cache_hits: Records summaries answered from the cache
+
+        Returns:
+            Tuple of (summaries by field name, costs by field name)
+        """
+        content = self._prompt_content(raw_news, content)
+        results = await asyncio.gather(
+            *(
+                self._generate_summary(
+                    raw_news, scoring, version=v, content=content, served=served, cache_hits=cache_hits
+                )
+                for v in versions
+            ),
+            return_exceptions=False,
+        )
+
+        summaries = {}
+        costs = {}
+        for version, (summary, cost) in zip(versions, results):
+            key = SUMMARY_VERSIONS[version]
+            summaries[key] = summary
+            costs[key] = cost
+        return summaries, costs
+
+    async def _complete_with_fallback(self, hedge: bool = False, **request) -> Tuple[Any, str]:
+        """Create a chat completion through the provider router.
+
+        The router picks the provider (by weight, skipping open circuits) and
+        falls back to the other provider when a call fails.
+
+        Args:
+            hedge: Hedge the call on a second provider if the first is slower
+                than its p95 latency (only when AI_HEDGED_REQUESTS is on)
+            **request: Chat completion arguments (messages, temperature, ...)
+
+        Returns:
+            Tuple of (chat completion response, provider that answered)
+
+        Raises:
+            ValueError: If every provider fails
+        """
+        async def attempt(provider_name: str) -> Any:
+            client, model = self._provider_client(provider_name)
+            return await self._create_completion(provider_name, client, model, **request)
+
+        try:
+            provider_name, response = await self.router.call_routed(
+                attempt, hedge=hedge and self.hedged_requests
+            )
+            return response, provider_name
         except (APIError, APIConnectionError, RateLimitError) as e:
-            error_msg = str(e)
-            self.logger.warning(f"{self.provider_name} API error: {error_msg}")
+            providers = " and ".join(self.router.weights)
+            self.logger.error(f"{providers} API call failed: {str(e)}")
+            raise ValueError(f"{providers} API error: {str(e)}") from e
+
+    def _provider_client(self, provider_name: str) -> Tuple[AsyncOpenAI, str]:
+        """Return the (client, model) pair for a provider name."""
+        if provider_name == self.fallback_provider_name:
+            return self.fallback_client, self.fallback_model
+        return self.client, self.model
+
+    def _attribution(self, served: Optional[Dict[str, str]]) -> Tuple[str, str]:
+        """(provider, model) to bill an article's calls to.
+
+        The provider that answered the scoring call, else the first one
+        recorded, else the primary provider.
+        """
+        served = served or {}
+        provider_name = next(
+            (served[op] for op in ("combined", "scoring") if op in served),
+            next(iter(served.values()), self.provider_name),
+        )
+        return provider_name, self._provider_client(provider_name)[1]
+
+    def _models_used(self, served: Dict[str, str]) -> list[str]:
+        """Models of the providers that answered, in first-use order."""
+        models = [self._provider_client(name)[1] for name in served.values()]
+        return list(dict.fromkeys(models)) or [self.model]
+
+    @staticmethod
+    def _record_served(served: Optional[Dict[str, str]], operation: str, provider_name: Optional[str]) -> None:
+        if served is not None and provider_name:
+            served[operation] = provider_name
+
+    @staticmethod
+    def _record_cache_hit(cache_hits: Optional[list[str]], operation: str) -> None:
+        if cache_hits is not None:
+            cache_hits.append(operation)
+
+    def provider_stats(self) -> dict:
+        """Return routing and rate limiter statistics per provider."""
+        stats = self.router.stats()
+        for name, limiter in self.rate_limiters.items():
+            if name in stats:
+                stats[name]["rate_limiter"] = limiter.stats()
+        return stats
+
+    async def _create_completion(
+        self, provider_name: str, client: AsyncOpenAI, model: str, **request
+    ) -> Any:
+        """Create a chat completion through the provider's rate limiter.
+
+        Rate-limited (429) calls shrink the provider's concurrency, wait for
+        retry-after and are retried up to `rate_limit_retries` times.
 
-            # Try fallback to OpenAI if available
-            if self.fallback_client:
-                self.logger.warning(f"Attempting fallback to {self.fallback_provider_name}...")
+        Args:
+            provider_name: Provider the client belongs to
+            client: Provider client
+            model: Model name
+            **request: Chat completion arguments
+
+        Returns:
+            Chat completion response
+
+        Raises:
+            RateLimitError: If still rate limited after all retries
+        """
+        limiter = self.rate_limiters.get(provider_name)
+        if limiter is None:
+            return await client.chat.completions.create(model=model, **request)
+
+        estimated_tokens = self._estimate_tokens(request)
+
+        for attempt in range(self.rate_limit_retries + 1):
+            try:
+                # Time spent waiting for a slot is not provider latency
+                request_queued()
+                async with limiter.slot(estimated_tokens) as slot:
+                    request_sent()
+                    try:
+                        response = await client.chat.completions.create(model=model, **request)
+                    except RateLimitError:
+                        # Rejected requests count against RPM but use no tokens
+                        slot.record_tokens(0)
+                        raise
+                    used_tokens = self._usage_tokens(response)
+                    if used_tokens is not None:
+                        slot.record_tokens(used_tokens)
+                    return response
+
+            except RateLimitError as e:
+                limiter.on_rate_limited(self._retry_after(e))
+                if attempt == self.rate_limit_retries:
+                    raise
+                self.logger.warning(
+                    f"{provider_name} rate limited, retrying "
+                    f"({attempt + 1}/{self.rate_limit_retries})"
+                )
+
+    @staticmethod
+    def _build_rate_limiter(settings: Settings, provider_name: str) -> AdaptiveRateLimiter:
+        """Build a provider's rate limiter from settings.
+
+        Args:
+            settings: Application settings
+            provider_name: "grok" or "openai"
+
+        Returns:
+            Rate limiter for the provider
+        """
+        prefix = "xai" if provider_name == "grok" else provider_name
+        return AdaptiveRateLimiter(
+            provider_name,
+            max_concurrency=settings.ai_max_concurrency,
+            requests_per_minute=getattr(settings, f"{prefix}_requests_per_minute"),
+            tokens_per_minute=getattr(settings, f"{prefix}_tokens_per_minute"),
+        )
+
+    def _build_router(self, settings: Settings) -> ProviderRouter:
+        """Build the provider router from settings.
+
+        Without load balancing the primary provider takes all traffic and
+        the fallback provider (weight 0) is only used when it fails.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            Provider router
+        """
+        providers = [name for name in (self.provider_name, self.fallback_provider_name) if name]
+        weights = {name: 0.0 for name in providers}
+        weights[self.provider_name] = 1.0
+        if settings.ai_load_balancing:
+            for name in providers:
+                prefix = "xai" if name == "grok" else name
+                weights[name] = getattr(settings, f"{prefix}_weight")
+
+        breakers = {
+            name: CircuitBreaker(
+                failure_rate_threshold=settings.ai_circuit_failure_rate,
+                latency_threshold_seconds=settings.ai_circuit_latency_seconds,
+                open_seconds=settings.ai_circuit_open_seconds,
+            )
+            for name in providers
+        }
+        return ProviderRouter(
+            weights,
+            retry_on=(APIError, APIConnectionError, RateLimitError),
+            hedge_min_delay_seconds=settings.ai_hedge_min_delay_seconds,
+            breakers=breakers,
+        )
+
+    def _load_prescorer(self, path: str) -> Optional[PreScorer]:
+        """Load the pre-scorer model, or None if unavailable."""
+        try:
+            prescorer = PreScorer.load(path)
+        except (OSError, ImportError, ValueError, pickle.UnpicklingError) as e:
+            self.logger.warning(f"Pre-scorer disabled, could not load {path}: {str(e)}")
+            return None
+        self.logger.info(f"Loaded pre-scorer from {path} (trained on {prescorer.trained_on} articles)")
+        return prescorer
+
+    @staticmethod
+    def _estimate_tokens(request: dict) -> int:
+        """Rough token estimate for a request (prompt chars / 3 + max output)."""
+        prompt_chars = sum(len(m.get("content") or "") for m in request.get("messages", []))
+        return prompt_chars // 3 + request.get("max_tokens", 0)
+
+    @staticmethod
+    def _usage_tokens(response: Any) -> Optional[int]:
+        """Total tokens reported by a response (None if the provider omits usage)."""
+        usage = getattr(response, "usage", None)
+        try:
+            return int(usage.prompt_tokens) + int(usage.completion_tokens)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _retry_after(error: RateLimitError) -> Optional[float]:
+        """Extract the retry-after delay (seconds) from a 429 response."""
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            value = headers.get(header)
+            if value:
                 try:
-                    response = self.fallback_client.chat.completions.create(
-                        model=self.fallback_model,
-                        messages=[
-                            {"role": "system", "content": SCORING_SYSTEM_PROMPT},
-                            {"role": "user", "content": prompt},
-                        ],
-                        temperature=0.7,
-                        max_tokens=1000,
-                    )
+                    return float(value) * scale
+                except ValueError:
+                    continue
+        return None
 
-                    response_text = response.choices[0].message.content
-                    response_text = strip_markdown_code_blocks(response_text)
-                    response_json = json.loads(response_text)
+    def _compact_content(self, raw_news: RawNews) -> CompactionResult:
+        """Compact an article's content to the per-call token budget.
 
-                    input_tokens = response.usage.prompt_tokens
-                    output_tokens = response.usage.completion_tokens
-                    cost = (input_tokens * 0.000005 + output_tokens * 0.000015)
+        Args:
+            raw_news: Raw news article
 
-                    scoring = ScoringResponse(**response_json)
-                    self.logger.info(f"✅ Fallback to {self.fallback_provider_name} successful")
-                    return scoring, cost
+        Returns:
+            Compaction result (content unchanged when compaction is disabled)
+        """
+        content = raw_news.content or ""
+        if self.content_compactor is None:
+            tokens = count_tokens(content)
+            return CompactionResult(content, tokens, tokens)
 
-                except Exception as fallback_error:
-                    self.logger.error(f"Fallback to {self.fallback_provider_name} also failed: {str(fallback_error)}")
-                    raise ValueError(f"Both {self.provider_name} and {self.fallback_provider_name} failed") from fallback_error
-            else:
-                # No fallback available
-                raise ValueError(f"{self.provider_name} API error: {error_msg}") from e
+        compaction = self.content_compactor.compact(raw_news.title, content)
+        if compaction.compacted:
+            self.logger.info(
+                f"Compacted content for {raw_news.id}: {compaction.original_tokens} -> "
+                f"{compaction.compacted_tokens} tokens ({compaction.saved_tokens} saved per call)"
+            )
+        return compaction
+
+    def _prompt_content(self, raw_news: RawNews, content: Optional[str]) -> str:
+        """Return `content` if already compacted, otherwise compact the article."""
+        if content is not None:
+            return content
+        return self._compact_content(raw_news).text
+
+    def _cache_key(
+        self,
+        raw_news: RawNews,
+        operation: str,
+        temperature: float,
+        provider_name: Optional[str] = None,
+        **extra: Any,
+    ) -> str:
+        """Build the response cache key for an LLM call on this article.
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in API response: {str(e)}")
-            self.logger.error(f"Response text was: {repr(response_text[:500])}")
-            raise ValueError(f"API returned invalid JSON: {str(e)}") from e
+        Args:
+            raw_news: Raw news article
+            operation: "scoring", "combined" or "summary:<version>"
+            temperature: Sampling temperature of the call
+            provider_name: Provider that answers (default the primary)
+            **extra: Additional prompt inputs (e.g. scoring fields for summaries)
+
+        Returns:
+            Cache key
+        """
+        provider_name = provider_name or self.provider_name
+        return ResponseCache.make_key(
+            provider=provider_name,
+            model=self._provider_client(provider_name)[1],
+            template_version=PROMPT_TEMPLATE_VERSION,
+            content=content_hash(raw_news.title, raw_news.content),
+            content_budget=self.content_compactor.max_tokens if self.content_compactor else None,
+            temperature=temperature,
+            operation=operation,
+            **extra,
+        )
+
+    def _cache_lookup(
+        self, raw_news: RawNews, operation: str, temperature: float, **extra: Any
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """Look up a cached answer from any configured provider.
+
+        Answers are cached under the provider and model that produced them;
+        the primary provider's answer is preferred.
+
+        Returns:
+            Tuple of (cached value or None, provider it came from)
+        """
+        if self.cache is None:
+            return None, None
+        for provider_name in dict.fromkeys([self.provider_name, *self.router.weights]):
+            cached = self._cache_get(self._cache_key(raw_news, operation, temperature, provider_name, **extra))
+            if cached is not None:
+                return cached, provider_name
+        return None, None
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Read from the response cache; cache failures count as misses."""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            self.logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Write to the response cache; cache failures are logged and ignored."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value)
+        except Exception as e:
+            self.logger.warning(f"Response cache write failed: {str(e)}")
+
+    @staticmethod
+    def _calculate_cost(response: Any) -> float:
+        """Estimate API cost from token usage.
+
+        Args:
+            response: Chat completion response
+
+        Returns:
+            Estimated cost in USD
+        """
+        # GPT-4o: ~$0.005 per 1K input tokens, ~$0.015 per 1K output tokens
+        input_tokens = response.usage.prompt_tokens
+        output_tokens = response.usage.completion_tokens
+        return input_tokens * 0.000005 + output_tokens * 0.000015
 
     async def _generate_summary(
-        self, raw_news: RawNews, scoring: ScoringResponse, version: str
+        self,
+        raw_news: RawNews,
+        scoring: ScoringResponse,
+        version: str,
+        content: Optional[str] = None,
+        served: Optional[Dict[str, str]] = None,
+        cache_hits: Optional[list[str]] = None,
     ) -> Tuple[str, float]:
         """Generate summary for the news.
 
@@ -386,13 +1419,30 @@ class ScoringService:
             raw_news: Raw news article
             scoring: Scoring result
             version: "professional", "scientific", "professional_en", or "scientific_en"
+            content: Compacted article content (compacted here if omitted)
+            served: Records which provider answered, under the summary field name
+            cache_hits: Records the summary field name if the answer came from the cache
 
         Returns:
             Tuple of (summary text, API cost)
         """
+        temperature = 0.5
+        operation = f"summary:{version}"
+        summary_field = SUMMARY_VERSIONS.get(version, f"summary_{version[:3]}")
+        prompt_inputs = {
+            "score": scoring.score,
+            "category": scoring.category.value,
+            "key_points": scoring.key_points,
+        }
+        cached, provider_name = self._cache_lookup(raw_news, operation, temperature, **prompt_inputs)
+        if cached is not None:
+            self._record_served(served, summary_field, provider_name)
+            self._record_cache_hit(cache_hits, summary_field)
+            return cached, 0.0
+
         prompts = get_summary_prompt(
             raw_news.title,
-            raw_news.content or "",
+            self._prompt_content(raw_news, content),
             scoring.score,
             scoring.category.value,
             scoring.key_points,
@@ -412,15 +1462,15 @@ class ScoringService:
             )
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response, provider_name = await self._complete_with_fallback(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0.5,
+                temperature=temperature,
                 max_tokens=300,
             )
+            self._record_served(served, summary_field, provider_name)
 
             response_text = response.choices[0].message.content
 
@@ -429,31 +1479,21 @@ class ScoringService:
 
             response_json = json.loads(response_text_clean)
 
-            # Build expected key: summary_pro, summary_sci, summary_pro_en, summary_sci_en
-            if version == "professional":
-                summary_key = "summary_pro"
-            elif version == "scientific":
-                summary_key = "summary_sci"
-            elif version == "professional_en":
-                summary_key = "summary_pro_en"
-            elif version == "scientific_en":
-                summary_key = "summary_sci_en"
-            else:
-                summary_key = f"summary_{version[:3]}"
-
-            summary = response_json.get(summary_key, response_text_clean)
+            # Expected key: summary_pro, summary_sci, summary_pro_en, summary_sci_en
+            summary = response_json.get(summary_field, response_text_clean)
 
             # Validate summary content
             if not summary or len(str(summary).strip()) < 10:
                 self.logger.warning(f"Summary for {version} is too short, using fallback")
                 summary = response_text_clean if response_text_clean else "Summary generation failed"
+            else:
+                # Only clean summaries are cached; fallbacks get retried next time
+                self._cache_set(
+                    self._cache_key(raw_news, operation, temperature, provider_name, **prompt_inputs),
+                    summary,
+                )
 
-            # Calculate cost
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            cost = (input_tokens * 0.000005 + output_tokens * 0.000015)
-
-            return summary, cost
+            return summary, self._calculate_cost(response)
 
         except (json.JSONDecodeError, KeyError) as e:
             self.logger.warning(f"JSON parse error for {version}: {str(e)}")
@@ -475,7 +1515,7 @@ class ScoringService:
             self.logger.error(f"Could not extract summary from response for {version}")
             return f"Summary generation failed for {version}", 0.005
 
-        except (APIError, APIConnectionError, RateLimitError) as e:
+        except (ValueError, APIError, APIConnectionError, RateLimitError) as e:
             self.logger.error(f"API error while generating summary for {version}: {str(e)}")
             return f"API error: {str(e)[:100]}", 0.005
 
@@ -546,3 +1586,41 @@ class ScoringService:
             "policy": ["compliance", "privacy"],
         }
         return infrastructure_categories.get(category, [])
+
+
+async def ensure_publishable_summaries(
+    db_session: Session,
+    items: list[ProcessedNews],
+    versions: list[str],
+    settings: Optional[Settings] = None,
+) -> int:
+    """Generate the summaries a publishing path needs (AI_LAZY_SUMMARIES).
+
+    Does nothing unless lazy summaries are enabled. A failure is logged and
+    the articles are published with the summaries they already have.
+
+    Args:
+        db_session: Session the articles belong to (committed here)
+        items: Articles about to be published
+        versions: Summary versions the channel renders
+        settings: Application settings (default from the environment)
+
+    Returns:
+        Number of summaries generated
+    """
+    settings = settings or get_settings()
+    if not settings.ai_lazy_summaries:
+        return 0
+
+    missing = [
+        processed_news for processed_news in items
+        if not all(getattr(processed_news, SUMMARY_VERSIONS[version]) for version in versions)
+    ]
+    if not missing:
+        return 0
+
+    try:
+        return await ScoringService(settings, db_session).ensure_summaries_many(missing, versions)
+    except Exception as e:
+        logger.warning(f"Lazy summary generation for {len(missing)} articles failed: {e}")
+        return 0
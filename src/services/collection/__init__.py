@@ -3,9 +3,17 @@
 from src.services.collection.base_collector import BaseCollector
 from src.services.collection.rss_collector import RSSCollector
 from src.services.collection.collection_manager import CollectionManager
+from src.services.collection.http_client import CollectionHttpClient
+from src.services.collection.seen_filter import SeenFilter
+from src.services.collection.simhash_index import SimhashIndex
+from src.services.collection.simhash_snapshot import SimhashSnapshot
 
 __all__ = [
     "BaseCollector",
     "RSSCollector",
     "CollectionManager",
+    "CollectionHttpClient",
+    "SeenFilter",
+    "SimhashIndex",
+    "SimhashSnapshot",
 ]
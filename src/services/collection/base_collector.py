@@ -1,27 +1,93 @@
 """Base collector class for different data sources."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Sequence, TypeVar
 from datetime import datetime
 import hashlib
 import logging
 
 from src.models import RawNews, DataSource
+from src.services.collection.http_client import CollectionHttpClient
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class BaseCollector(ABC):
     """Abstract base class for all data collectors."""
 
-    def __init__(self, data_source: DataSource):
+    # Entries processed at once within one collect(); the shared HTTP client
+    # still caps connections per host and requests across all collectors
+    entry_concurrency = 8
+
+    def __init__(
+        self,
+        data_source: DataSource,
+        http_client: Optional[CollectionHttpClient] = None,
+        cpu_executor: Optional[Executor] = None,
+    ):
         """Initialize collector with data source configuration.
 
         Args:
             data_source: DataSource model instance with configuration
+            http_client: Shared HTTP client (default: a private client that
+                is closed after each collect())
+            cpu_executor: Executor for CPU-bound parsing, e.g. the shared
+                process pool (default: the event loop's thread pool)
         """
         self.data_source = data_source
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or CollectionHttpClient()
+        self.cpu_executor = cpu_executor
+
+    async def close(self) -> None:
+        """Release the HTTP client if this collector created it."""
+        if self._owns_http_client:
+            await self.http_client.close()
+
+    async def run_cpu(self, func: Callable[..., R], *args: Any) -> R:
+        """Run a CPU-bound function off the event loop.
+
+        With a process pool, func must be a module-level (or static) function
+        and its arguments and result must be picklable.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.cpu_executor, func, *args)
+
+    async def process_entries(
+        self, process: Callable[[T], Awaitable[R]], entries: Sequence[T]
+    ) -> List[R]:
+        """Run a per-entry coroutine over entries with bounded concurrency.
+
+        Per-feed wall time becomes roughly the slowest entries' time instead
+        of the sum, without flooding a site with one request per entry.
+
+        Args:
+            process: Coroutine function handling one entry
+            entries: Entries to process
+
+        Returns:
+            Results in entry order
+        """
+        semaphore = asyncio.Semaphore(self.entry_concurrency)
+
+        async def run(entry: T) -> R:
+            async with semaphore:
+                return await process(entry)
+
+        return await asyncio.gather(*(run(entry) for entry in entries))
 
     @abstractmethod
     async def collect(self) -> List[Dict[str, Any]]:
@@ -2,19 +2,31 @@
 
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 import hashlib
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_
 
+from src.config import get_settings
 from src.models import DataSource, RawNews
 from src.services.collection.base_collector import BaseCollector
 from src.services.collection.rss_collector import RSSCollector
 from src.services.collection.twitter_collector import TwitterCollector
 from src.services.collection.crawler_collector import CrawlerCollector
 from src.services.collection.deduplication import ContentDeduplicator
+from src.services.collection.http_client import CollectionHttpClient
+from src.services.collection.process_pool import get_process_pool
+from src.services.collection.simhash_index import (
+    SIMHASH_BANDS,
+    SimhashIndex,
+    from_signed64,
+    simhash_columns,
+)
+from src.services.collection.seen_filter import SeenFilter
+from src.services.collection.simhash_snapshot import SimhashSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +34,42 @@ logger = logging.getLogger(__name__)
 class CollectionManager:
     """Manages data collection from all configured sources."""
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        in_memory_index: bool = False,
+        snapshot_path: Optional[str] = None,
+        http_client: Optional[CollectionHttpClient] = None,
+        cpu_executor: Optional[Executor] = None,
+    ):
         """Initialize collection manager.
 
         Args:
             db_session: SQLAlchemy database session
+            in_memory_index: Look up near duplicates in an in-memory index
+                loaded once per run instead of querying the simhash band
+                columns (single-process collectors only)
+            snapshot_path: Look up near duplicates in this shared memory-mapped
+                snapshot (see export_simhash_snapshot) and append new articles
+                to its log (multi-process collectors)
+            http_client: HTTP client shared by all collectors (default: one
+                built from settings for each collect_all run)
+            cpu_executor: Executor for collectors' CPU-bound parsing (default:
+                the shared process pool when settings.collection_process_workers
+                is set, else the event loop's thread pool)
         """
         self.db = db_session
         self.logger = logger
         self.deduplicator = ContentDeduplicator()
+        self.seen_filter = SeenFilter(db_session, self.deduplicator)
+        self.in_memory_index = in_memory_index
+        self.snapshot_path = snapshot_path
+        self._snapshot: Optional[SimhashSnapshot] = None
+        self.http_client = http_client
+        self.cpu_executor = cpu_executor
+        # Recent content simhashes, loaded on first use in each collection run
+        self._simhash_index: Optional[SimhashIndex] = None
+        self._simhash_index_days = 0
 
     async def collect_all(self) -> Dict[str, Any]:
         """Collect data from all enabled sources.
@@ -43,6 +82,9 @@ class CollectionManager:
             - errors: List of errors occurred
             - by_source: Stats per source
         """
+        # Pick up articles stored since the previous run
+        self._simhash_index = None
+
         # Fetch all enabled sources
         sources = self.db.query(DataSource).filter(DataSource.is_enabled == True).order_by(DataSource.priority).all()
 
@@ -56,9 +98,22 @@ class CollectionManager:
                 "by_source": {},
             }
 
-        # Collect from all sources concurrently
-        tasks = [self._collect_from_source(source) for source in sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Collect from all sources concurrently over one pooled HTTP client,
+        # which also caps requests in flight across sources
+        settings = get_settings()
+        owns_http_client = self.http_client is None
+        if owns_http_client:
+            self.http_client = CollectionHttpClient.from_settings(settings)
+        if self.cpu_executor is None and settings.collection_process_workers > 0:
+            # Long-lived and shared, so workers warm up once per process
+            self.cpu_executor = get_process_pool(settings.collection_process_workers)
+        try:
+            tasks = [self._collect_from_source(source) for source in sources]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if owns_http_client:
+                await self.http_client.close()
+                self.http_client = None
 
         # Process results
         stats = {
@@ -104,11 +159,13 @@ class CollectionManager:
 
         # Collect articles
         articles = await collector.collect()
-        total_collected = len(articles)
+        # Entries the collector skipped as already stored count as duplicates
+        skipped_seen = getattr(collector, "skipped_seen", 0)
+        total_collected = len(articles) + skipped_seen
 
         # Check for duplicates and save new items
         new_count = 0
-        duplicate_count = 0
+        duplicate_count = skipped_seen
 
         # Content quality statistics
         content_stats = {
@@ -118,26 +175,24 @@ class CollectionManager:
             "min_length": float('inf'),
             "max_length": 0,
         }
-
-        for article in articles:
-            # Generate both URL/title hash and content simhash
-            url_title_hash = self.deduplicator.compute_url_title_hash(
-                article["title"], article["url"]
-            )
-            content_simhash = self.deduplicator.compute_simhash(
-                article.get("content", "")
-            )
-
+        saved_news = []
+
+        # URL/title hashes and content simhashes for the whole batch at once
+        url_title_hashes = [
+            self.deduplicator.compute_url_title_hash(article["title"], article["url"])
+            for article in articles
+        ]
+        content_simhashes = self.deduplicator.compute_simhash_many(
+            [article.get("content") or "" for article in articles]
+        )
+        # Stored hashes plus those accepted earlier in this batch
+        seen_hashes = self._existing_hashes(url_title_hashes)
+
+        for article, url_title_hash, content_simhash in zip(articles, url_title_hashes, content_simhashes):
             # 1. Check for exact match on URL/title
-            existing_exact = self.db.query(RawNews).filter(
-                RawNews.hash == url_title_hash
-            ).first()
-
-            if existing_exact:
+            if url_title_hash in seen_hashes:
                 duplicate_count += 1
-                self.logger.debug(
-                    f"Duplicate found (exact): {article['title']} (id: {existing_exact.id})"
-                )
+                self.logger.debug(f"Duplicate found (exact): {article['title']}")
                 continue  # Skip this article, don't save it
 
             # 2. Check for similar content (only if content exists and simhash is valid)
@@ -147,20 +202,26 @@ class CollectionManager:
                     duplicate_count += 1
                     self.logger.debug(
                         f"Duplicate found (similar content): {article['title']} "
-                        f"(similar to id: {similar_items[0].id})"
+                        f"(similar to hash: {similar_items[0]})"
                     )
                     continue  # Skip this article, don't save it
 
+            # html_content is binary; the RSS collector returns decoded text
+            html_content = article.get("html_content")
+            if isinstance(html_content, str):
+                html_content = html_content.encode("utf-8")
+
             # Only save non-duplicate articles
             raw_news = RawNews(
                 source_id=source.id,
                 title=article["title"],
                 url=article["url"],
                 content=article.get("content"),
-                html_content=article.get("html_content"),
+                html_content=html_content,
                 language=article.get("language", "en"),
                 hash=url_title_hash,
                 content_simhash=str(content_simhash) if content_simhash else None,  # Store simhash as string
+                **simhash_columns(content_simhash),  # Integer + band columns for SQL lookups
                 author=article.get("author"),
                 source_name=source.name,
                 published_at=article["published_at"],
@@ -169,9 +230,16 @@ class CollectionManager:
                 is_duplicate=False,  # Always False here (duplicates are skipped)
             )
 
-            self.db.add(raw_news)
+            saved_news.append(raw_news)
+            seen_hashes.add(url_title_hash)
             new_count += 1
 
+            # Later articles in this run are checked against this one too
+            if content_simhash:
+                self._get_simhash_index().insert(
+                    content_simhash, url_title_hash, self._as_utc(raw_news.fetched_at)
+                )
+
             # Track content quality statistics
             content = article.get("content", "")
             content_length = len(content)
@@ -185,16 +253,36 @@ class CollectionManager:
             elif article.get("content_source") == "fetched":
                 content_stats["fetched"] += 1
 
-        # Commit all new items
+        # Remember the feed's validators in the same commit as its articles,
+        # so an unchanged feed is skipped only once its articles are stored
+        for column, value in getattr(collector, "feed_validators", {}).items():
+            setattr(source, column, value)
+
+        # Insert all new items in one batched INSERT
         try:
+            self.db.add_all(saved_news)
+            self.db.flush()
+            # Read IDs and fingerprints now: the commit expires the rows and
+            # reading them afterwards would reload each one
+            snapshot_entries = [
+                (raw_news.id, from_signed64(raw_news.simhash_signed), raw_news.fetched_at)
+                for raw_news in saved_news
+                if raw_news.simhash_signed is not None
+            ]
             self.db.commit()
         except Exception as e:
             self.db.rollback()
             raise e
 
+        # Share the new fingerprints with collectors in other processes
+        if self.snapshot_path:
+            self._get_snapshot().append(snapshot_entries)
+
         # Update source stats
         source.last_check_at = datetime.now()
-        source.last_success_at = datetime.now() if new_count > 0 or duplicate_count > 0 else source.last_success_at
+        not_modified = getattr(collector, "not_modified", False)
+        if new_count > 0 or duplicate_count > 0 or not_modified:
+            source.last_success_at = datetime.now()
         source.error_count = 0
         source.consecutive_failures = 0
         self.db.commit()
@@ -213,12 +301,33 @@ class CollectionManager:
 
         return total_collected, new_count, duplicate_count
 
+    def _existing_hashes(self, url_title_hashes: List[str], chunk_size: int = 500) -> set:
+        """Find which URL/title hashes are already stored.
+
+        Args:
+            url_title_hashes: Hashes of a collected batch
+            chunk_size: Hashes per IN (...) query
+
+        Returns:
+            Set of the given hashes that exist in RawNews
+        """
+        unique_hashes = list(dict.fromkeys(url_title_hashes))
+        existing = set()
+        for start in range(0, len(unique_hashes), chunk_size):
+            existing.update(
+                url_title_hash
+                for (url_title_hash,) in self.db.query(RawNews.hash).filter(
+                    RawNews.hash.in_(unique_hashes[start:start + chunk_size])
+                ).distinct()
+            )
+        return existing
+
     def _find_similar_content(
         self,
         simhash: int,
         hamming_threshold: int = 3,
         time_window_days: int = 7
-    ) -> List[RawNews]:
+    ) -> List[str]:
         """
         Find similar content based on Simhash Hamming distance.
 
@@ -228,38 +337,145 @@ class CollectionManager:
             time_window_days: Only check records within recent N days (default 7)
 
         Returns:
-            List of similar RawNews records
+            URL/title hashes of similar RawNews records
 
         Notes:
             - Hamming distance = number of differing bits in two simhashes
             - Distance <= 3 indicates high similarity (typically same content)
-            - Time window optimization reduces query scope for performance
+            - Any fingerprint within 3 bits shares one of its four 16-bit bands
+              exactly, so candidates come from indexed band equality (or the
+              in-memory index / shared snapshot tables) and only they get the
+              exact Hamming check
         """
-        # Calculate time threshold
         time_threshold = datetime.now(timezone.utc) - timedelta(days=time_window_days)
 
-        # Query recent records with valid simhash
-        recent_items = self.db.query(RawNews).filter(
+        # Articles of this run (unflushed with autoflush off), or everything
+        # recent with the in-memory index
+        index = self._get_simhash_index(time_window_days)
+        index.expire(time_threshold)
+        similar_items = [
+            url_title_hash
+            for url_title_hash, _ in index.query(simhash, hamming_threshold, since=time_threshold)
+        ]
+        if self.in_memory_index:
+            return similar_items
+
+        if self.snapshot_path:
+            snapshot = self._get_snapshot()
+            snapshot.refresh()
+            row_ids = [
+                row_id for row_id, _ in snapshot.query(simhash, hamming_threshold, since=time_threshold)
+            ]
+            if row_ids:
+                for (url_title_hash,) in self.db.query(RawNews.hash).filter(
+                    RawNews.id.in_(row_ids)
+                ).order_by(RawNews.id):
+                    if url_title_hash not in similar_items:
+                        similar_items.append(url_title_hash)
+            return similar_items
+
+        if hamming_threshold >= SIMHASH_BANDS:
+            raise ValueError(f"Band lookup supports distances below {SIMHASH_BANDS}")
+
+        bands = simhash_columns(simhash)
+        candidates = self.db.query(RawNews.hash, RawNews.simhash_signed).filter(
+            or_(*(
+                getattr(RawNews, f"simhash_band_{band}") == bands[f"simhash_band_{band}"]
+                for band in range(SIMHASH_BANDS)
+            )),
+            RawNews.fetched_at >= time_threshold
+        ).order_by(RawNews.id).all()
+
+        for url_title_hash, simhash_signed in candidates:
+            distance = (simhash ^ from_signed64(simhash_signed)).bit_count()
+            if distance <= hamming_threshold and url_title_hash not in similar_items:
+                similar_items.append(url_title_hash)
+        return similar_items
+
+    def _get_simhash_index(self, time_window_days: int = 7) -> SimhashIndex:
+        """Get the simhash index of this collection run, loading it if needed.
+
+        With in_memory_index, recent articles are loaded into it (only the
+        hash, simhash and fetch time columns) and it is reloaded when a wider
+        time window is requested. Otherwise it only holds the articles saved
+        during this run, and stored ones are found through the band columns.
+
+        Args:
+            time_window_days: Days of articles the index must cover
+
+        Returns:
+            SimhashIndex with URL/title hashes as payloads
+        """
+        if self._simhash_index is not None and (
+            not self.in_memory_index or time_window_days <= self._simhash_index_days
+        ):
+            return self._simhash_index
+
+        index = SimhashIndex(
+            hash_bits=self.deduplicator.hash_bits,
+            max_distance=self.deduplicator.hamming_threshold,
+        )
+        self._simhash_index = index
+        self._simhash_index_days = time_window_days
+        if not self.in_memory_index:
+            return index
+
+        time_threshold = datetime.now(timezone.utc) - timedelta(days=time_window_days)
+        rows = self.db.query(RawNews.hash, RawNews.content_simhash, RawNews.fetched_at).filter(
             RawNews.content_simhash.isnot(None),
             RawNews.fetched_at >= time_threshold
         ).all()
 
-        # Calculate Hamming distance for each item
-        similar_items = []
-        for item in recent_items:
-            if item.content_simhash:
-                try:
-                    # Convert string simhash to int for comparison
-                    item_simhash = int(item.content_simhash) if isinstance(item.content_simhash, str) else item.content_simhash
-                    # XOR to find differing bits, count them
-                    hamming_distance = bin(simhash ^ item_simhash).count('1')
-                    if hamming_distance <= hamming_threshold:
-                        similar_items.append(item)
-                except (ValueError, TypeError):
-                    # Skip if simhash conversion fails
-                    continue
+        for url_title_hash, content_simhash, fetched_at in rows:
+            try:
+                # Simhash is stored as string to support unsigned 64-bit
+                item_simhash = int(content_simhash)
+            except (ValueError, TypeError):
+                # Skip if simhash conversion fails
+                continue
+            index.insert(item_simhash, url_title_hash, self._as_utc(fetched_at))
 
-        return similar_items
+        self.logger.debug(f"Loaded simhash index with {len(index)} recent articles")
+        return index
+
+    def _get_snapshot(self) -> SimhashSnapshot:
+        """Map the shared simhash snapshot on first use."""
+        if self._snapshot is None:
+            self._snapshot = self.deduplicator.load_snapshot(self.snapshot_path)
+        return self._snapshot
+
+    def export_simhash_snapshot(self, path: str, time_window_days: int = 7) -> int:
+        """Write recent content simhashes to a shared memory-mapped snapshot.
+
+        Run periodically by one process; collectors started with
+        snapshot_path=path map the file and pick up the new generation on
+        their next lookup. Articles saved in between reach them through the
+        snapshot's append log.
+
+        Args:
+            path: Snapshot file path
+            time_window_days: Days of articles to include
+
+        Returns:
+            Number of fingerprints written
+        """
+        time_threshold = datetime.now(timezone.utc) - timedelta(days=time_window_days)
+        rows = self.db.query(RawNews.id, RawNews.simhash_signed, RawNews.fetched_at).filter(
+            RawNews.simhash_signed.isnot(None),
+            RawNews.fetched_at >= time_threshold
+        ).yield_per(10000)
+
+        count = self.deduplicator.export_snapshot(
+            path,
+            ((row_id, from_signed64(simhash_signed), fetched_at) for row_id, simhash_signed, fetched_at in rows),
+        )
+        self.logger.info(f"Exported simhash snapshot with {count} articles to {path}")
+        return count
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Treat naive datetimes (e.g. from SQLite) as UTC."""
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
 
     def _get_collector(self, source: DataSource) -> Optional[BaseCollector]:
         """Get appropriate collector for source type.
@@ -277,8 +493,18 @@ class CollectionManager:
         }
 
         collector_class = collectors.get(source.type)
+        if collector_class is RSSCollector:
+            # Skip unchanged feeds, then stored entries before downloading
+            # full articles
+            return RSSCollector(
+                source,
+                seen_filter=self.seen_filter,
+                http_client=self.http_client,
+                feed_cache=True,
+                cpu_executor=self.cpu_executor,
+            )
         if collector_class:
-            return collector_class(source)
+            return collector_class(source, http_client=self.http_client, cpu_executor=self.cpu_executor)
 
         if source.type == "api":
             # TODO: Implement API collector
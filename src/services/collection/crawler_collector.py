@@ -6,10 +6,10 @@ CSS selectors for list pages and article pages.
 """
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
-import aiohttp
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
@@ -24,6 +24,7 @@ except ImportError:
     detect = None
 
 from src.services.collection.base_collector import BaseCollector
+from src.services.collection.http_client import CollectionHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -53,15 +54,31 @@ class CrawlerCollector(BaseCollector):
     }
     """
 
-    def __init__(self, data_source):
+    # Browser-like UA; some sites reject unknown clients on HTML pages
+    BROWSER_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/91.0.4472.124 Safari/537.36"
+        )
+    }
+
+    def __init__(
+        self,
+        data_source,
+        http_client: Optional[CollectionHttpClient] = None,
+        cpu_executor: Optional[Executor] = None,
+    ):
         """Initialize crawler collector.
 
         Args:
             data_source: DataSource instance with crawler configuration
+            http_client: Shared HTTP client (default: a private one)
+            cpu_executor: Executor for HTML parsing and language detection
+                (default: the event loop's thread pool)
         """
-        super().__init__(data_source)
+        super().__init__(data_source, http_client, cpu_executor)
         self.config = data_source.config or {}
-        self.session: Optional[aiohttp.ClientSession] = None
 
     async def collect(self) -> List[Dict[str, Any]]:
         """Collect articles from configured website.
@@ -75,28 +92,28 @@ class CrawlerCollector(BaseCollector):
             raise ValueError(f"Missing 'list_url' in config for {self.data_source.name}")
 
         try:
-            # Create aiohttp session
-            async with aiohttp.ClientSession() as self.session:
-                articles = []
-                pagination_config = self.config.get("pagination", {})
-                max_items = self.data_source.max_items_per_run or 50
-
-                if pagination_config.get("enabled", False):
-                    # Crawl with pagination
-                    articles = await self._crawl_with_pagination(
-                        list_url, pagination_config, max_items
-                    )
-                else:
-                    # Crawl single page
-                    page_articles = await self._crawl_list_page(list_url)
-                    articles.extend(page_articles[:max_items])
-
-                self.log_collection_attempt(True, f"Collected {len(articles)} articles")
-                return articles
+            articles = []
+            pagination_config = self.config.get("pagination", {})
+            max_items = self.data_source.max_items_per_run or 50
+
+            if pagination_config.get("enabled", False):
+                # Crawl with pagination
+                articles = await self._crawl_with_pagination(
+                    list_url, pagination_config, max_items
+                )
+            else:
+                # Crawl single page
+                page_articles = await self._crawl_list_page(list_url)
+                articles.extend(page_articles[:max_items])
+
+            self.log_collection_attempt(True, f"Collected {len(articles)} articles")
+            return articles
 
         except Exception as e:
             self.log_collection_attempt(False, str(e), e)
             raise
+        finally:
+            await self.close()
 
     async def _crawl_with_pagination(
         self, base_url: str, pagination_config: Dict, max_items: int
@@ -156,14 +173,13 @@ class CrawlerCollector(BaseCollector):
 
                     # Find next page link
                     html = await self._fetch_url(current_url)
-                    soup = BeautifulSoup(html, 'html.parser')
-                    next_link = soup.select_one(next_selector)
+                    next_href = await self.run_cpu(find_next_link, html, next_selector)
 
-                    if not next_link or not next_link.get('href'):
+                    if not next_href:
                         self.logger.info("No more pages found")
                         break
 
-                    current_url = urljoin(current_url, next_link['href'])
+                    current_url = urljoin(current_url, next_href)
 
                 except Exception as e:
                     self.logger.warning(f"Failed to crawl page {page_num + 1}: {e}")
@@ -184,86 +200,103 @@ class CrawlerCollector(BaseCollector):
             List of article dictionaries
         """
         html = await self._fetch_url(url)
-        soup = BeautifulSoup(html, 'html.parser')
 
         list_selector = self.config.get("list_selector")
         if not list_selector:
             raise ValueError(f"Missing 'list_selector' in config")
 
-        items = soup.select(list_selector)
+        # Parse off the event loop (in worker processes if configured)
+        items = await self.run_cpu(parse_list_page, html, self.config, url)
         self.logger.debug(f"Found {len(items)} items with selector '{list_selector}'")
 
-        articles = []
-        for item in items:
+        async def complete(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             try:
-                article = await self._extract_article_from_list_item(item, url)
-                if article:
-                    articles.append(article)
+                return await self._complete_article(item)
             except Exception as e:
                 self.logger.warning(f"Failed to extract article from list item: {e}")
-                continue
+                return None
 
-        return articles
+        # Fetch detail pages concurrently, keeping list order
+        results = await self.process_entries(complete, items)
+        return [article for article in results if article]
 
-    async def _extract_article_from_list_item(
-        self, item, base_url: str
+    @classmethod
+    def _extract_article_from_list_item(
+        cls, item, base_url: str, config: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Extract article data from a list item element.
 
         Args:
             item: BeautifulSoup element (list item)
             base_url: Base URL for resolving relative URLs
+            config: Crawler configuration
 
         Returns:
-            Article dictionary or None if extraction fails
+            Dict with title, url, published_at, author, plus the list-page
+            summary as content/html_content when detail pages are not
+            fetched, or None if extraction fails
         """
         # Extract title
-        title_selector = self.config.get("title_selector", "h2, h3, .title")
+        title_selector = config.get("title_selector", "h2, h3, .title")
         title_elem = item.select_one(title_selector)
         if not title_elem:
-            self.logger.debug(f"No title found with selector '{title_selector}'")
+            logger.debug(f"No title found with selector '{title_selector}'")
             return None
         title = title_elem.get_text(strip=True)
 
         # Extract URL
-        url_selector = self.config.get("url_selector", "a[href]")
+        url_selector = config.get("url_selector", "a[href]")
         url_elem = item.select_one(url_selector)
         if not url_elem or not url_elem.get('href'):
-            self.logger.debug(f"No URL found with selector '{url_selector}'")
+            logger.debug(f"No URL found with selector '{url_selector}'")
             return None
         article_url = urljoin(base_url, url_elem['href'])
 
-        # Extract date
-        published_at = self._extract_date(item)
-
-        # Extract content
+        # Extract summary from list page
         content = ""
         html_content = ""
-
-        if self.config.get("fetch_detail", True):
-            # Fetch detail page for full content
-            content, html_content = await self._fetch_article_detail(article_url)
-        else:
-            # Extract summary from list page
-            content_selector = self.config.get("content_selector", ".summary, .excerpt")
+        if not config.get("fetch_detail", True):
+            content_selector = config.get("content_selector", ".summary, .excerpt")
             content_elem = item.select_one(content_selector)
             if content_elem:
                 content = content_elem.get_text(strip=True)
                 html_content = str(content_elem)
 
-        # Detect language
-        language = self._detect_language(content)
-
-        # Extract author (optional)
-        author = self._extract_author(item)
-
         return {
             "title": title,
             "url": article_url,
+            "published_at": cls._extract_date(item, config),
+            "author": cls._extract_author(item, config),
+            "content": content,
+            "html_content": html_content,
+        }
+
+    async def _complete_article(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch an item's detail page (if configured) and detect its language.
+
+        Args:
+            item: Dict from _extract_article_from_list_item
+
+        Returns:
+            Article dictionary
+        """
+        content = item["content"]
+        html_content = item["html_content"]
+
+        if self.config.get("fetch_detail", True):
+            # Fetch detail page for full content
+            content, html_content = await self._fetch_article_detail(item["url"])
+
+        # Detect language
+        language = await self.run_cpu(self._detect_language, content)
+
+        return {
+            "title": item["title"],
+            "url": item["url"],
             "content": content,
             "html_content": html_content.encode('utf-8') if html_content else None,
-            "author": author,
-            "published_at": published_at,
+            "author": item["author"],
+            "published_at": item["published_at"],
             "language": language,
             "content_source": "crawler",
             "is_full_text": bool(content and len(content) > 500),
@@ -283,10 +316,8 @@ class CrawlerCollector(BaseCollector):
         if use_newspaper and NewspaperArticle:
             # Use newspaper3k for smart extraction
             try:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, self._extract_with_newspaper, url
-                )
+                html = await self._fetch_url(url)
+                result = await self.run_cpu(self._extract_with_newspaper, url, html)
                 if result:
                     return result["text"], result["html"]
             except Exception as e:
@@ -297,24 +328,21 @@ class CrawlerCollector(BaseCollector):
         if content_selector:
             try:
                 html = await self._fetch_url(url)
-                soup = BeautifulSoup(html, 'html.parser')
-                content_elem = soup.select_one(content_selector)
-
-                if content_elem:
-                    text = content_elem.get_text(strip=True)
-                    html_str = str(content_elem)
-                    return text, html_str
+                selected = await self.run_cpu(select_content, html, content_selector)
+                if selected:
+                    return selected
             except Exception as e:
                 self.logger.warning(f"CSS selector extraction failed for {url}: {e}")
 
         return "", ""
 
     @staticmethod
-    def _extract_with_newspaper(url: str) -> Optional[Dict[str, str]]:
+    def _extract_with_newspaper(url: str, html: str) -> Optional[Dict[str, str]]:
         """Extract article using newspaper3k.
 
         Args:
             url: Article URL
+            html: Downloaded article HTML
 
         Returns:
             Dict with 'text' and 'html', or None if fails
@@ -324,7 +352,7 @@ class CrawlerCollector(BaseCollector):
 
         try:
             article = NewspaperArticle(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
 
             if article.text and article.html:
@@ -337,16 +365,18 @@ class CrawlerCollector(BaseCollector):
 
         return None
 
-    def _extract_date(self, item) -> datetime:
+    @staticmethod
+    def _extract_date(item, config: Dict[str, Any]) -> datetime:
         """Extract published date from list item.
 
         Args:
             item: BeautifulSoup element
+            config: Crawler configuration
 
         Returns:
             datetime object (current time if not found)
         """
-        date_selector = self.config.get("date_selector", "time, .date, .published")
+        date_selector = config.get("date_selector", "time, .date, .published")
         date_elem = item.select_one(date_selector)
 
         if date_elem:
@@ -356,21 +386,23 @@ class CrawlerCollector(BaseCollector):
             try:
                 return date_parser.parse(date_str)
             except Exception as e:
-                self.logger.debug(f"Failed to parse date '{date_str}': {e}")
+                logger.debug(f"Failed to parse date '{date_str}': {e}")
 
         # Fallback to current time
         return datetime.now(timezone.utc)
 
-    def _extract_author(self, item) -> Optional[str]:
+    @staticmethod
+    def _extract_author(item, config: Dict[str, Any]) -> Optional[str]:
         """Extract author from list item.
 
         Args:
             item: BeautifulSoup element
+            config: Crawler configuration
 
         Returns:
             Author name or None
         """
-        author_selector = self.config.get("author_selector", ".author, .byline")
+        author_selector = config.get("author_selector", ".author, .byline")
         author_elem = item.select_one(author_selector)
 
         if author_elem:
@@ -409,24 +441,7 @@ class CrawlerCollector(BaseCollector):
         Returns:
             HTML content as string
         """
-        if not self.session:
-            raise RuntimeError("Session not initialized")
-
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/91.0.4472.124 Safari/537.36"
-            )
-        }
-
-        async with self.session.get(
-            url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
-        ) as response:
-            if response.status != 200:
-                raise ValueError(f"HTTP {response.status} for {url}")
-
-            return await response.text()
+        return await self.http_client.get_text(url, headers=self.BROWSER_HEADERS)
 
     @staticmethod
     def _build_paginated_url(base_url: str, param_name: str, page_num: int) -> str:
@@ -448,3 +463,62 @@ class CrawlerCollector(BaseCollector):
         new_parsed = parsed._replace(query=new_query)
 
         return urlunparse(new_parsed)
+
+
+# Module-level HTML parsing steps, so they can run in worker processes:
+# page text in, plain picklable values out.
+
+
+def parse_list_page(html: str, config: Dict[str, Any], base_url: str) -> List[Dict[str, Any]]:
+    """Extract article items from a list page.
+
+    Args:
+        html: List page HTML
+        config: Crawler configuration (list_selector and item selectors)
+        base_url: List page URL for resolving relative links
+
+    Returns:
+        Item dicts from CrawlerCollector._extract_article_from_list_item
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    items = []
+    for element in soup.select(config["list_selector"]):
+        try:
+            item = CrawlerCollector._extract_article_from_list_item(element, base_url, config)
+            if item:
+                items.append(item)
+        except Exception as e:
+            logger.warning(f"Failed to extract article from list item: {e}")
+    return items
+
+
+def select_content(html: str, selector: str) -> Optional[tuple[str, str]]:
+    """Extract the element matching a CSS selector.
+
+    Args:
+        html: Page HTML
+        selector: CSS selector of the content element
+
+    Returns:
+        Tuple of (text_content, html_content), or None if nothing matches
+    """
+    content_elem = BeautifulSoup(html, 'html.parser').select_one(selector)
+    if content_elem:
+        return content_elem.get_text(strip=True), str(content_elem)
+    return None
+
+
+def find_next_link(html: str, selector: str) -> Optional[str]:
+    """Find the href of a pagination "next" link.
+
+    Args:
+        html: List page HTML
+        selector: CSS selector of the next link
+
+    Returns:
+        The (possibly relative) href, or None on the last page
+    """
+    next_link = BeautifulSoup(html, 'html.parser').select_one(selector)
+    if next_link and next_link.get('href'):
+        return next_link['href']
+    return None
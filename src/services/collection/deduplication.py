@@ -2,7 +2,21 @@
 
 import re
 import hashlib
-from typing import Set, List
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Set, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is part of the optional "ai" extra; fall back to pure Python
+    np = None
+
+from src.services.collection.simhash_snapshot import SimhashSnapshot
+
+# Token hash functions: md5 matches the fingerprints stored so far, blake2b
+# (8-byte digest) is faster but produces different fingerprints
+HASH_ALGORITHMS = ("md5", "blake2b")
 
 
 class ContentDeduplicator:
@@ -12,15 +26,25 @@ class ContentDeduplicator:
     significantly more accurate than simple URL/title hashing.
     """
 
-    def __init__(self, hash_bits: int = 64, hamming_threshold: int = 3):
+    def __init__(self, hash_bits: int = 64, hamming_threshold: int = 3, hash_algorithm: str = "md5"):
         """Initialize deduplicator.
 
         Args:
             hash_bits: Number of bits in simhash (default 64)
             hamming_threshold: Maximum Hamming distance for duplicates (default 3)
+            hash_algorithm: Token hash, "md5" (default) or "blake2b" (faster;
+                fingerprints are not comparable with md5 ones)
+
+        Raises:
+            ValueError: If hash_algorithm is unknown or hash_bits too large for it
         """
+        if hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {hash_algorithm}")
+        if hash_algorithm == "blake2b" and hash_bits > 64:
+            raise ValueError("blake2b mode supports at most 64 hash bits")
         self.hash_bits = hash_bits
         self.hamming_threshold = hamming_threshold
+        self.hash_algorithm = hash_algorithm
 
     def compute_simhash(self, text: str) -> int:
         """Compute Simhash fingerprint for text content.
@@ -37,36 +61,133 @@ class ContentDeduplicator:
         Returns:
             Integer simhash fingerprint
         """
-        if not text:
-            return 0
+        return self.compute_simhash_many([text])[0]
 
-        # Tokenize and normalize text
-        tokens = self._tokenize(text)
+    def compute_simhash_many(self, texts: Sequence[str], chunk_size: int = 1000) -> List[int]:
+        """Compute Simhash fingerprints for many texts.
 
-        # Initialize bit vector for weighted voting
-        v = [0] * self.hash_bits
+        Each distinct token is hashed once per chunk of documents. With numpy,
+        a chunk's votes are one summation over rows of a token x bit sign
+        matrix; without it (or for more than 64 bits) a pure Python loop per
+        distinct token is used. Both give the same fingerprints.
 
-        # Process each token
-        for token in tokens:
-            # Hash token to get bit pattern
-            token_hash = int(hashlib.md5(token.encode('utf-8')).hexdigest(), 16)
+        Args:
+            texts: Input text contents
+            chunk_size: Documents voted on together (bounds memory use)
 
-            # Weight each bit (+1 if bit is 1, -1 if bit is 0)
+        Returns:
+            Fingerprints, in input order (0 for empty texts)
+        """
+        documents = [self._tokenize(text) if text else [] for text in texts]
+
+        if np is None or self.hash_bits > 64:
+            hashes = {}
+            fingerprints = []
+            for tokens in documents:
+                counts = Counter(tokens)
+                for token in counts:
+                    if token not in hashes:
+                        hashes[token] = self._hash_token(token)
+                fingerprints.append(self._vote(counts, hashes))
+            return fingerprints
+
+        fingerprints = []
+        for start in range(0, len(documents), chunk_size):
+            fingerprints.extend(self._vote_many(documents[start:start + chunk_size]))
+        return fingerprints
+
+    def _hash_token(self, token: str) -> int:
+        """Hash one token to an integer (only the low hash_bits are used)."""
+        if self.hash_algorithm == "blake2b":
+            return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        return int.from_bytes(hashlib.md5(token.encode("utf-8")).digest(), "big")
+
+    def _vote(self, counts: Counter, hashes: dict) -> int:
+        """Pure Python bit voting for one document."""
+        # Weight each bit (+count if bit is 1, -count if bit is 0)
+        v = [0] * self.hash_bits
+        for token, count in counts.items():
+            token_hash = hashes[token]
             for i in range(self.hash_bits):
-                bit_mask = 1 << i
-                if token_hash & bit_mask:
-                    v[i] += 1
+                if token_hash & (1 << i):
+                    v[i] += count
                 else:
-                    v[i] -= 1
+                    v[i] -= count
 
         # Generate final fingerprint by majority voting
         fingerprint = 0
         for i in range(self.hash_bits):
             if v[i] > 0:
                 fingerprint |= (1 << i)
-
         return fingerprint
 
+    def _vote_many(self, documents: List[List[str]]) -> List[int]:
+        """Vectorized bit voting for a chunk of tokenized documents."""
+        vocabulary = {}
+        token_index = []
+        offsets = [0]
+        for tokens in documents:
+            token_index.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+            offsets.append(len(token_index))
+
+        fingerprints = [0] * len(documents)
+        if not vocabulary:
+            return fingerprints
+
+        # Low 64 bits of each distinct token's hash, in bulk
+        if self.hash_algorithm == "blake2b":
+            digests = b"".join(
+                hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest() for token in vocabulary
+            )
+        else:
+            digests = b"".join(hashlib.md5(token.encode("utf-8")).digest()[8:] for token in vocabulary)
+        token_hashes = np.frombuffer(digests, dtype=">u8").astype(np.uint64)
+
+        # Token x bit matrix of +1/-1 votes
+        shifts = np.arange(self.hash_bits, dtype=np.uint64)
+        signs = (((token_hashes[:, None] >> shifts) & np.uint64(1)).astype(np.int8) << 1) - 1
+
+        # One sum per document over the rows of its token occurrences, so
+        # repeated tokens are weighted by their frequency
+        non_empty = np.flatnonzero(np.diff(offsets))
+        starts = np.asarray(offsets[:-1])[non_empty]
+        votes = np.add.reduceat(signs[np.asarray(token_index)], starts, axis=0, dtype=np.int32)
+
+        bits = (votes > 0).astype(np.uint64) << shifts
+        for doc, fingerprint in zip(non_empty, np.bitwise_or.reduce(bits, axis=1)):
+            fingerprints[doc] = int(fingerprint)
+        return fingerprints
+
+    def export_snapshot(self, path: str, entries: Iterable[Tuple[int, int, datetime]]) -> int:
+        """Write fingerprints to a memory-mapped snapshot file for other processes.
+
+        Args:
+            path: Snapshot file path (replaced atomically)
+            entries: (row_id, simhash, timestamp) tuples
+
+        Returns:
+            Number of fingerprints written
+
+        Raises:
+            ValueError: If hash_bits is not 64
+        """
+        if self.hash_bits != 64:
+            raise ValueError("Snapshots hold 64-bit fingerprints")
+        # Enough block tables for exact lookups within hamming_threshold
+        blocks = next(n for n in range(self.hamming_threshold + 1, 65) if 64 % n == 0)
+        return SimhashSnapshot.write(path, entries, blocks=blocks)
+
+    def load_snapshot(self, path: str) -> SimhashSnapshot:
+        """Map a snapshot file written by export_snapshot (zero-copy).
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            SimhashSnapshot; query it with max_distance=self.hamming_threshold
+        """
+        return SimhashSnapshot(path)
+
     def compute_url_title_hash(self, title: str, url: str) -> str:
         """Compute traditional hash for URL and title.
 
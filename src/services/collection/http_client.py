@@ -0,0 +1,265 @@
+"""Shared pooled HTTP client for collectors."""
+
+import asyncio
+import codecs
+import logging
+import re
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+try:
+    import brotli  # noqa: F401  (lets aiohttp decode "br" responses)
+except ImportError:
+    try:
+        import brotlicffi as brotli  # noqa: F401
+    except ImportError:
+        brotli = None
+
+try:
+    from charset_normalizer import from_bytes as detect_encoding
+except ImportError:
+    detect_encoding = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "DeepDive Tracking Collector"
+
+# <meta charset="gbk">, <meta http-equiv="Content-Type" content="text/html; charset=gbk">
+# or <?xml version="1.0" encoding="gbk"?> near the top of the document
+_DECLARED_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)|<\?xml[^>]+encoding\s*=\s*["']([A-Za-z0-9._:-]+)""",
+    re.IGNORECASE,
+)
+_SNIFF_BYTES = 4096
+
+
+class ResponseTooLargeError(ValueError):
+    """Raised when a response body exceeds the client's size cap."""
+
+
+class HttpResponse(NamedTuple):
+    """A fully read response."""
+
+    status: int
+    body: bytes
+    charset: Optional[str]
+    headers: Mapping[str, str]
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the server answered a conditional request with 304."""
+        return self.status == 304
+
+    def text(self) -> str:
+        """Body decoded with the Content-Type charset, else a detected one."""
+        return self.body.decode(self.charset or sniff_charset(self.body), errors="replace")
+
+
+def _known_codec(name: str) -> Optional[str]:
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def sniff_charset(body: bytes) -> str:
+    """Charset of a body served without one in its Content-Type.
+
+    Tries a byte order mark, a <meta> or XML declaration in the first few KB,
+    strict UTF-8, then statistical detection (charset-normalizer, when
+    installed).
+
+    Args:
+        body: Response body
+
+    Returns:
+        Codec name (UTF-8 when nothing else fits)
+    """
+    if body.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if body.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+
+    match = _DECLARED_CHARSET_RE.search(body[:_SNIFF_BYTES])
+    if match:
+        declared = _known_codec((match.group(1) or match.group(2)).decode("ascii"))
+        # Pages often say gb2312 but use GBK-only characters; GB18030 covers both
+        if declared in ("gb2312", "gbk"):
+            declared = "gb18030"
+        if declared:
+            return declared
+
+    try:
+        body.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    if detect_encoding is not None:
+        best = detect_encoding(body[:256 * 1024]).best()
+        if best is not None:
+            return best.encoding
+    return "utf-8"
+
+
+class CollectionHttpClient:
+    """One HTTP client for a whole collection run.
+
+    All collectors share a single aiohttp session, so connections are kept
+    alive and reused, DNS lookups are cached and compressed responses are
+    decoded. A semaphore caps requests in flight across every source, the
+    connector caps connections per host, and bodies larger than
+    max_response_bytes are rejected while streaming.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        limit_per_host: int = 4,
+        timeout_seconds: float = 30,
+        max_response_bytes: int = 10 * 1024 * 1024,
+        dns_cache_seconds: int = 300,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        """Initialize client (the session is opened on first use).
+
+        Args:
+            max_concurrency: Requests in flight across all collectors
+            limit_per_host: Open connections per host
+            timeout_seconds: Default total timeout per request
+            max_response_bytes: Largest accepted response body
+            dns_cache_seconds: DNS cache TTL
+            user_agent: Default User-Agent header
+        """
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout_seconds = timeout_seconds
+        self.max_response_bytes = max_response_bytes
+        self.dns_cache_seconds = dns_cache_seconds
+        self.user_agent = user_agent
+        self.logger = logger
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_settings(cls, settings) -> "CollectionHttpClient":
+        """Build a client from application settings."""
+        return cls(
+            max_concurrency=settings.max_concurrent_requests,
+            limit_per_host=settings.http_limit_per_host,
+            timeout_seconds=settings.request_timeout,
+            max_response_bytes=settings.http_max_response_bytes,
+            dns_cache_seconds=settings.http_dns_cache_seconds,
+            user_agent=settings.user_agent,
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The pooled session (opened on first access)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_seconds,
+            )
+            encodings = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                headers={"User-Agent": self.user_agent, "Accept-Encoding": encodings},
+                auto_decompress=True,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "CollectionHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> HttpResponse:
+        """GET a URL and read its (decompressed) body.
+
+        A 304 answer to a conditional request is returned, not raised.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout_seconds: Total timeout overriding the default
+
+        Returns:
+            HttpResponse with status, body, charset and response headers
+
+        Raises:
+            aiohttp.ClientResponseError: On 4xx/5xx responses
+            ResponseTooLargeError: If the body exceeds max_response_bytes
+        """
+        session = self.session
+        # timeout=None would disable the session's default timeout
+        timeout = aiohttp.ClientTimeout(total=timeout_seconds or self.timeout_seconds)
+        async with self._semaphore:
+            async with session.get(url, headers=headers, timeout=timeout, allow_redirects=True) as response:
+                response.raise_for_status()
+                if (response.content_length or 0) > self.max_response_bytes:
+                    raise ResponseTooLargeError(
+                        f"{url}: {response.content_length} bytes exceeds {self.max_response_bytes}"
+                    )
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body.extend(chunk)
+                    if len(body) > self.max_response_bytes:
+                        raise ResponseTooLargeError(
+                            f"{url}: response exceeds {self.max_response_bytes} bytes"
+                        )
+                return HttpResponse(response.status, bytes(body), response.charset, response.headers.copy())
+
+    async def get_bytes(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Tuple[bytes, Optional[str]]:
+        """GET a URL and return its (decompressed) body.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout_seconds: Total timeout overriding the default
+
+        Returns:
+            Tuple of (body, charset from Content-Type or None)
+        """
+        response = await self.get(url, headers, timeout_seconds)
+        return response.body, response.charset
+
+    async def get_text(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        """GET a URL and decode its body as text.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout_seconds: Total timeout overriding the default
+
+        Returns:
+            Response text (charset from Content-Type, else UTF-8)
+        """
+        response = await self.get(url, headers, timeout_seconds)
+        return response.text()
@@ -1,11 +1,11 @@
 """RSS feed collector implementation."""
 
-import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 import feedparser
-import aiohttp
 from pytz import UTC
 
 try:
@@ -23,6 +23,8 @@ except ImportError:
 
 from src.models import DataSource, RawNews
 from src.services.collection.base_collector import BaseCollector
+from src.services.collection.http_client import CollectionHttpClient
+from src.services.collection.seen_filter import SeenFilter
 from src.utils.html_cleaner import HTMLCleaner
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,37 @@ logger = logging.getLogger(__name__)
 class RSSCollector(BaseCollector):
     """Collector for RSS feeds."""
 
+    def __init__(
+        self,
+        data_source: DataSource,
+        seen_filter: Optional[SeenFilter] = None,
+        http_client: Optional[CollectionHttpClient] = None,
+        feed_cache: bool = False,
+        cpu_executor: Optional[Executor] = None,
+    ):
+        """Initialize RSS collector.
+
+        Args:
+            data_source: DataSource model instance
+            seen_filter: Skips entries that are already stored before any
+                per-entry work (default: no pre-fetch check)
+            http_client: Shared HTTP client (default: a private one)
+            feed_cache: Send the source's stored ETag / Last-Modified and skip
+                parsing when the feed is unchanged. The caller persists
+                feed_validators once the articles are saved.
+            cpu_executor: Executor for feed/article parsing and language
+                detection (default: the event loop's thread pool)
+        """
+        super().__init__(data_source, http_client, cpu_executor)
+        self.seen_filter = seen_filter
+        self.feed_cache = feed_cache
+        # Entries skipped by seen_filter in the last collect()
+        self.skipped_seen = 0
+        # Whether the last collect() found the feed unchanged
+        self.not_modified = False
+        # DataSource feed_* column values to store after the last collect()
+        self.feed_validators: Dict[str, Optional[str]] = {}
+
     async def collect(self) -> List[Dict[str, Any]]:
         """Collect articles from RSS feed.
 
@@ -40,37 +73,67 @@ class RSSCollector(BaseCollector):
         if not self.data_source.url:
             raise ValueError(f"RSS feed URL not configured for {self.data_source.name}")
 
+        self.not_modified = False
+        self.feed_validators = {}
         try:
             feed_data = await self._fetch_feed(self.data_source.url)
+            if feed_data is None:
+                # Unchanged since the last run: nothing to parse or store
+                self.not_modified = True
+                self.skipped_seen = 0
+                self.log_collection_attempt(True, "Feed not modified")
+                return []
             articles = await self._parse_feed(feed_data)
             self.log_collection_attempt(True, f"Collected {len(articles)} articles")
             return articles
         except Exception as e:
             self.log_collection_attempt(False, str(e), e)
             raise
+        finally:
+            await self.close()
 
-    async def _fetch_feed(self, url: str) -> str:
+    async def _fetch_feed(self, url: str) -> Optional[bytes]:
         """Fetch RSS feed content.
 
+        With feed_cache enabled, this sends If-None-Match / If-Modified-Since
+        from the source's stored validators. It also compares the body hash,
+        for servers that ignore conditional requests.
+
         Args:
             url: Feed URL
 
         Returns:
-            Feed XML content as string
+            Raw feed bytes (feedparser detects the encoding), or None if the
+            feed is not modified
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={"User-Agent": "DeepDive Tracking RSS Collector"},
-                allow_redirects=True,
-            ) as response:
-                response.raise_for_status()  # Raise exception for 4xx/5xx errors
-                text = await response.text()
-                logger.info(f"Fetched RSS feed: {len(text)} bytes from {url}")
-                return text
-
-    async def _parse_feed(self, feed_content: str) -> List[Dict[str, Any]]:
+        headers = {"User-Agent": "DeepDive Tracking RSS Collector"}
+        if self.feed_cache:
+            if self.data_source.feed_etag:
+                headers["If-None-Match"] = self.data_source.feed_etag
+            if self.data_source.feed_last_modified:
+                headers["If-Modified-Since"] = self.data_source.feed_last_modified
+
+        # Raises for 4xx/5xx errors and oversized responses
+        response = await self.http_client.get(url, headers=headers)
+        if response.not_modified:
+            logger.info(f"RSS feed not modified (304): {url}")
+            return None
+
+        if self.feed_cache:
+            body_hash = hashlib.sha256(response.body).hexdigest()
+            if body_hash == self.data_source.feed_body_hash:
+                logger.info(f"RSS feed body unchanged: {url}")
+                return None
+            self.feed_validators = {
+                "feed_etag": response.headers.get("ETag"),
+                "feed_last_modified": response.headers.get("Last-Modified"),
+                "feed_body_hash": body_hash,
+            }
+
+        logger.info(f"Fetched RSS feed: {len(response.body)} bytes from {url}")
+        return response.body
+
+    async def _parse_feed(self, feed_content: Union[bytes, str]) -> List[Dict[str, Any]]:
         """Parse RSS feed content.
 
         Args:
@@ -79,70 +142,87 @@ class RSSCollector(BaseCollector):
         Returns:
             List of parsed articles
         """
-        # Parse in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        parsed = await loop.run_in_executor(None, lambda: feedparser.parse(feed_content))
-
-        articles = []
+        # Parse off the event loop (in worker processes if configured)
         max_items = self.data_source.max_items_per_run or 50
+        entries = await self.run_cpu(parse_feed_entries, feed_content, max_items)
 
-        for entry in parsed.entries[:max_items]:
-            try:
-                # Extract content with raw HTML and cleaned text from RSS
-                rss_content, rss_html = self._extract_content(entry)
-                rss_content_len = len(rss_content.strip()) if rss_content else 0
+        # Drop already collected entries before fetching or parsing them
+        self.skipped_seen = 0
+        if self.seen_filter is not None and entries:
+            seen = self.seen_filter.seen(entries)
+            self.skipped_seen = sum(seen)
+            entries = [entry for entry, is_seen in zip(entries, seen) if not is_seen]
+            if self.skipped_seen:
+                self.logger.info(f"Skipping {self.skipped_seen} already collected entries")
 
-                # Validate content is not empty (reduced minimum from 50 to 20 chars)
-                if not rss_content or rss_content_len < 20:
-                    self.logger.warning(
-                        f"Skipping entry with insufficient RSS content (len={rss_content_len}): "
-                        f"{entry.get('title', 'No title')[:60]}"
-                    )
-                    continue
+        # Fetch, extract and language-detect entries concurrently, keeping
+        # feed order
+        results = await self.process_entries(self._process_entry, entries)
+        return [article for article in results if article is not None]
 
-                self.logger.info(f"Processing entry: {entry.get('title', 'No title')[:60]}... (RSS content: {rss_content_len} chars)")
+    async def _process_entry(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Turn one feed entry into an article dict.
 
-                # Attempt to fetch full article if RSS content is too short
-                article_url = entry.get("link", "")
-                full_article = await self._fetch_full_article(
-                    article_url, rss_content, rss_html
+        Args:
+            entry: Entry dict from parse_feed_entries
+
+        Returns:
+            Article dictionary, or None if the entry is skipped
+        """
+        try:
+            # Cleaned text and raw HTML from RSS
+            rss_content, rss_html = entry["rss_content"], entry["rss_html"]
+            rss_content_len = len(rss_content.strip()) if rss_content else 0
+
+            # Validate content is not empty (reduced minimum from 50 to 20 chars)
+            if not rss_content or rss_content_len < 20:
+                self.logger.warning(
+                    f"Skipping entry with insufficient RSS content (len={rss_content_len}): "
+                    f"{entry.get('title', 'No title')[:60]}"
                 )
+                return None
 
-                # Use fetched content (or fall back to RSS content)
-                final_content = full_article["content"]
-                final_html = full_article["html_content"]
-
-                # Detect language from final content
-                language = self._detect_language(final_content)
-
-                # Extract author with multiple sources
-                author = self._extract_author(entry)
-
-                article = {
-                    "title": entry.get("title", ""),
-                    "url": article_url,
-                    "content": final_content,
-                    "author": author,
-                    "published_at": self._parse_published_date(entry),
-                    "language": language,
-                    "html_content": final_html,
-                    # Metadata about content source
-                    "content_source": full_article["content_source"],
-                    "is_full_text": full_article["is_full_text"],
-                }
+            self.logger.info(f"Processing entry: {entry.get('title', 'No title')[:60]}... (RSS content: {rss_content_len} chars)")
 
-                # Validate required fields
-                if not article["title"] or not article["url"]:
-                    self.logger.warning(f"Skipping entry with missing title or URL: {entry}")
-                    continue
+            # Attempt to fetch full article if RSS content is too short
+            article_url = entry["url"]
+            full_article = await self._fetch_full_article(
+                article_url, rss_content, rss_html
+            )
 
-                articles.append(article)
+            # Use fetched content (or fall back to RSS content)
+            final_content = full_article["content"]
+            final_html = full_article["html_content"]
+
+            # Detect language from final content
+            language = await self.run_cpu(self._detect_language, final_content)
+
+            # Feed author, falling back to the data source's default author
+            author = entry["author"] or (self.data_source and self.data_source.default_author) or ""
+
+            article = {
+                "title": entry["title"],
+                "url": article_url,
+                "content": final_content,
+                "author": author,
+                "published_at": entry["published_at"],
+                "language": language,
+                "html_content": final_html,
+                # Metadata about content source
+                "content_source": full_article["content_source"],
+                "is_full_text": full_article["is_full_text"],
+            }
 
-            except Exception as e:
-                self.logger.warning(f"Failed to parse RSS entry: {e}")
-                continue
+            # Validate required fields
+            if not article["title"] or not article["url"]:
+                self.logger.warning(f"Skipping entry with missing title or URL: {entry['title'] or entry['url']}")
+                return None
 
-        return articles
+            return article
+
+        except Exception as e:
+            self.logger.warning(f"Failed to parse RSS entry: {e}")
+            return None
 
     @staticmethod
     def _extract_content(entry: Dict[str, Any]) -> tuple[str, str]:
@@ -190,8 +270,11 @@ class RSSCollector(BaseCollector):
         # Return empty strings if nothing found
         return "", ""
 
-    def _extract_author(self, entry: Dict[str, Any]) -> str:
-        """Extract author with fallback to data source default.
+    @staticmethod
+    def _extract_author(entry: Dict[str, Any]) -> str:
+        """Extract author from the entry's author fields.
+
+        The data source's default author is applied by _process_entry.
 
         Args:
             entry: Parsed RSS entry from feedparser
@@ -221,10 +304,6 @@ class RSSCollector(BaseCollector):
                     if author:
                         return author
 
-        # Fallback to data source's default author
-        if self.data_source and self.data_source.default_author:
-            return self.data_source.default_author
-
         # Return empty string if no author found
         return ""
 
@@ -346,11 +425,10 @@ class RSSCollector(BaseCollector):
                 f"RSS content short ({len(rss_content)} chars), fetching full article from {url}"
             )
 
-            # Run newspaper3k in thread pool (it's CPU-bound)
-            loop = asyncio.get_event_loop()
-            article = await loop.run_in_executor(
-                None, self._extract_with_newspaper, url
-            )
+            # Download through the shared client, parse with newspaper3k off
+            # the event loop (it's CPU-bound)
+            html = await self.http_client.get_text(url)
+            article = await self.run_cpu(self._extract_with_newspaper, url, html)
 
             if article and article.get("text") and article.get("html"):
                 fetched_text = article["text"]
@@ -385,14 +463,16 @@ class RSSCollector(BaseCollector):
         }
 
     @staticmethod
-    def _extract_with_newspaper(url: str) -> Optional[Dict[str, str]]:
+    def _extract_with_newspaper(url: str, html: str) -> Optional[Dict[str, str]]:
         """
         Extract article content using newspaper3k.
 
-        This is a synchronous method designed to be run in a thread pool.
+        This is a synchronous method designed to be run in an executor
+        (thread or process pool).
 
         Args:
             url: Article URL
+            html: Downloaded article HTML
 
         Returns:
             Dictionary with 'text' and 'html' keys, or None if extraction fails
@@ -402,7 +482,7 @@ class RSSCollector(BaseCollector):
 
         try:
             article = NewspaperArticle(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
 
             if article.text and article.html:
@@ -415,3 +495,36 @@ class RSSCollector(BaseCollector):
             logger.debug(f"Newspaper extraction failed for {url}: {e}")
 
         return None
+
+
+def parse_feed_entries(feed_content: Union[bytes, str], max_items: int) -> List[Dict[str, Any]]:
+    """Parse a feed into compact entry dicts.
+
+    Module-level so it can run in a worker process: raw feed bytes in, small
+    picklable dicts out instead of feedparser's objects.
+
+    Args:
+        feed_content: Raw RSS/Atom content
+        max_items: Maximum entries to return
+
+    Returns:
+        List of dicts with title, url, guid, rss_content, rss_html, author
+        and published_at
+    """
+    parsed = feedparser.parse(feed_content)
+    entries = []
+    for entry in parsed.entries[:max_items]:
+        try:
+            rss_content, rss_html = RSSCollector._extract_content(entry)
+            entries.append({
+                "title": entry.get("title", ""),
+                "url": entry.get("link", ""),
+                "guid": entry.get("id"),
+                "rss_content": rss_content,
+                "rss_html": rss_html,
+                "author": RSSCollector._extract_author(entry),
+                "published_at": RSSCollector._parse_published_date(entry),
+            })
+        except Exception as e:
+            logger.warning(f"Failed to parse RSS entry: {e}")
+    return entries
@@ -0,0 +1,89 @@
+"""Pre-fetch gate for feed entries that are already stored."""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.models import RawNews
+from src.services.collection.deduplication import ContentDeduplicator
+
+logger = logging.getLogger(__name__)
+
+
+class SeenFilter:
+    """Tells collectors which feed entries are already in raw_news.
+
+    Runs on the bare feed metadata (title, link, GUID) before any per-entry
+    work such as content cleaning, full-article downloads or language
+    detection. Most entries of a feed are unchanged between runs, so this
+    skips most of that work. One batched query per feed checks the URL/title
+    hash (which uses the canonical URL) and the link/GUID URLs. Repeats within
+    the batch are marked as seen too.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        deduplicator: Optional[ContentDeduplicator] = None,
+        chunk_size: int = 500,
+    ):
+        """Initialize filter.
+
+        Args:
+            db_session: SQLAlchemy database session
+            deduplicator: Deduplicator providing URL/title hashes (default new one)
+            chunk_size: Keys per IN (...) query
+        """
+        self.db = db_session
+        self.deduplicator = deduplicator or ContentDeduplicator()
+        self.chunk_size = chunk_size
+        self.logger = logger
+
+    def seen(self, entries: Sequence[Dict[str, Optional[str]]]) -> List[bool]:
+        """Check feed entries against stored articles.
+
+        Args:
+            entries: Dicts with title, url and optional guid
+
+        Returns:
+            One flag per entry, True if it was already collected
+        """
+        keys = []
+        for entry in entries:
+            title = entry.get("title") or ""
+            url = entry.get("url") or ""
+            urls = {url} if url else set()
+            # Permalink GUIDs are URLs too; opaque GUIDs are not stored
+            guid = entry.get("guid") or ""
+            if guid.startswith(("http://", "https://")):
+                urls.add(guid)
+            canonical = {self.deduplicator._normalize_url(u) for u in urls}
+            keys.append((self.deduplicator.compute_url_title_hash(title, url), urls, canonical))
+
+        all_hashes = list(dict.fromkeys(key[0] for key in keys))
+        all_urls = list(dict.fromkeys(u for key in keys for u in key[1]))
+        stored_hashes = set()
+        stored_urls = set()
+        for start in range(0, max(len(all_hashes), len(all_urls)), self.chunk_size):
+            hashes = all_hashes[start:start + self.chunk_size]
+            urls = all_urls[start:start + self.chunk_size]
+            for url_title_hash, url in self.db.query(RawNews.hash, RawNews.url).filter(
+                or_(RawNews.hash.in_(hashes), RawNews.url.in_(urls))
+            ):
+                stored_hashes.add(url_title_hash)
+                stored_urls.add(self.deduplicator._normalize_url(url))
+
+        flags = []
+        batch_hashes = set()
+        batch_urls = set()
+        for url_title_hash, _, canonical in keys:
+            flags.append(
+                url_title_hash in stored_hashes
+                or url_title_hash in batch_hashes
+                or any(u in stored_urls or u in batch_urls for u in canonical)
+            )
+            batch_hashes.add(url_title_hash)
+            batch_urls.update(canonical)
+        return flags
@@ -0,0 +1,186 @@
+"""Simhash indexing for near-duplicate lookup, in memory and in the database."""
+
+import heapq
+from datetime import datetime
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bands of the persisted 64-bit simhash (RawNews.simhash_band_0..3)
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = 16
+
+
+def to_signed64(simhash: int) -> int:
+    """Map an unsigned 64-bit fingerprint to a signed BIGINT value."""
+    return simhash - (1 << 64) if simhash >= (1 << 63) else simhash
+
+
+def from_signed64(value: int) -> int:
+    """Map a signed BIGINT value back to the unsigned fingerprint."""
+    return value + (1 << 64) if value < 0 else value
+
+
+def simhash_columns(simhash: Optional[int]) -> Dict[str, Optional[int]]:
+    """RawNews integer simhash column values for a fingerprint.
+
+    Args:
+        simhash: Unsigned 64-bit fingerprint (None or 0 = no content)
+
+    Returns:
+        Dict for simhash_signed and simhash_band_0..3
+    """
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    columns = {"simhash_signed": to_signed64(simhash) if simhash else None}
+    for band in range(SIMHASH_BANDS):
+        columns[f"simhash_band_{band}"] = (
+            (simhash >> (band * SIMHASH_BAND_BITS)) & mask if simhash else None
+        )
+    return columns
+
+
+class SimhashIndex:
+    """Multi-table Simhash index with exact lookups within a Hamming distance.
+
+    Fingerprints are split into ``blocks`` blocks. Two fingerprints at most
+    ``max_distance < blocks`` bits apart agree exactly on at least one block
+    (pigeonhole), so each block gets its own table keyed by the block value,
+    the hash-table form of the permuted-block tables of Manku et al. A query
+    only compares the fingerprints sharing a block with it instead of every
+    fingerprint in the index, and returns the same matches as a linear scan.
+
+    With the defaults (64 bits, distance 3) there are 4 tables of 16-bit
+    blocks. Entries can carry a timestamp for time-window queries and expiry.
+    """
+
+    def __init__(self, hash_bits: int = 64, max_distance: int = 3, blocks: Optional[int] = None):
+        """Initialize index.
+
+        Args:
+            hash_bits: Number of bits in the fingerprints (default 64)
+            max_distance: Largest Hamming distance queries may ask for (default 3)
+            blocks: Number of blocks/tables (default: smallest divisor of
+                hash_bits greater than max_distance)
+
+        Raises:
+            ValueError: If blocks does not divide hash_bits or is not
+                greater than max_distance
+        """
+        if blocks is None:
+            blocks = next(n for n in range(max_distance + 1, hash_bits + 1) if hash_bits % n == 0)
+        if hash_bits % blocks:
+            raise ValueError(f"{blocks} blocks do not divide {hash_bits} bits")
+        if max_distance >= blocks:
+            raise ValueError(f"max_distance {max_distance} needs more than {blocks} blocks")
+
+        self.hash_bits = hash_bits
+        self.max_distance = max_distance
+        self.blocks = blocks
+        self.block_bits = hash_bits // blocks
+        self._block_mask = (1 << self.block_bits) - 1
+        self._tables: List[Dict[int, set]] = [{} for _ in range(blocks)]
+        # entry id -> (simhash, payload, timestamp); ids increase with insertion
+        self._entries: Dict[int, Tuple[int, Any, Optional[datetime]]] = {}
+        self._expiry: List[Tuple[datetime, int]] = []
+        self._ids = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _block_values(self, simhash: int):
+        for block in range(self.blocks):
+            yield block, (simhash >> (block * self.block_bits)) & self._block_mask
+
+    def insert(self, simhash: int, payload: Any = None, timestamp: Optional[datetime] = None) -> int:
+        """Add a fingerprint.
+
+        Args:
+            simhash: Fingerprint
+            payload: Value returned by queries (e.g. a record id)
+            timestamp: Entry time for time-window queries and expiry
+                (None = never expires)
+
+        Returns:
+            Entry id (for remove)
+        """
+        entry_id = next(self._ids)
+        self._entries[entry_id] = (simhash, payload, timestamp)
+        for block, value in self._block_values(simhash):
+            self._tables[block].setdefault(value, set()).add(entry_id)
+        if timestamp is not None:
+            heapq.heappush(self._expiry, (timestamp, entry_id))
+        return entry_id
+
+    def remove(self, entry_id: int) -> bool:
+        """Remove an entry.
+
+        Args:
+            entry_id: Id returned by insert
+
+        Returns:
+            True if the entry was in the index
+        """
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return False
+        for block, value in self._block_values(entry[0]):
+            bucket = self._tables[block][value]
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._tables[block][value]
+        return True
+
+    def query(
+        self,
+        simhash: int,
+        max_distance: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[Any, int]]:
+        """Find fingerprints within a Hamming distance.
+
+        Args:
+            simhash: Fingerprint to look up
+            max_distance: Maximum Hamming distance (default: the index's)
+            since: Only match entries timestamped at or after this time
+                (entries without timestamp always match)
+
+        Returns:
+            List of (payload, distance), in insertion order
+
+        Raises:
+            ValueError: If max_distance exceeds the index's
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(f"Index supports distances up to {self.max_distance}")
+
+        candidates = set()
+        for block, value in self._block_values(simhash):
+            bucket = self._tables[block].get(value)
+            if bucket:
+                candidates.update(bucket)
+
+        matches = []
+        for entry_id in sorted(candidates):
+            fingerprint, payload, timestamp = self._entries[entry_id]
+            if since is not None and timestamp is not None and timestamp < since:
+                continue
+            distance = (simhash ^ fingerprint).bit_count()
+            if distance <= max_distance:
+                matches.append((payload, distance))
+        return matches
+
+    def expire(self, before: datetime) -> int:
+        """Remove entries timestamped before a time.
+
+        Args:
+            before: Cutoff time
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        while self._expiry and self._expiry[0][0] < before:
+            _, entry_id = heapq.heappop(self._expiry)
+            removed += self.remove(entry_id)
+        return removed
@@ -0,0 +1,313 @@
+"""Memory-mapped simhash snapshot shared by collector processes.
+
+A snapshot file holds the recent fingerprint window as flat arrays that
+every worker maps read-only, so the pages are shared through the OS page
+cache: startup is an mmap instead of a database load, and resident memory
+does not grow with the number of workers or the window size.
+
+Layout (native byte order, 8-byte aligned sections):
+    header      magic, version, blocks, count, generation, created_at
+    simhashes   count x uint64, sorted ascending
+    timestamps  count x int64 (epoch seconds)
+    row_ids     count x int64 (RawNews ids)
+    per block   count x uint64 fingerprints rotated so the block is in the
+                top bits, sorted, followed by count x uint32 positions into
+                the arrays above (padded to 8 bytes)
+
+Each block table answers "which fingerprints share this block exactly" with
+two binary searches, so queries are exact within blocks - 1 bits, like
+SimhashIndex. Inserts made between rebuilds go to an append log next to the
+snapshot ("<path>.<generation>.log", fixed-size records), which readers tail
+into a small in-memory SimhashIndex.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from src.services.collection.simhash_index import SimhashIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"SIMHSNP1"
+SNAPSHOT_VERSION = 1
+# magic, version, blocks, count, generation, created_at (padded to 64 bytes)
+_HEADER = struct.Struct("=8sIIQQd")
+_HEADER_SIZE = 64
+# simhash, timestamp, row id
+_LOG_RECORD = struct.Struct("=QqQ")
+
+_MASK64 = (1 << 64) - 1
+
+
+def _rotate_left(value: int, shift: int) -> int:
+    return ((value << shift) | (value >> (64 - shift))) & _MASK64 if shift else value
+
+
+def _epoch(timestamp: datetime) -> int:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def log_path(path: str, generation: int) -> str:
+    """Append log file of a snapshot generation."""
+    return f"{path}.{generation}.log"
+
+
+class SimhashSnapshot:
+    """Read-only view of a memory-mapped simhash snapshot plus its append log."""
+
+    def __init__(self, path: str):
+        """Map a snapshot file.
+
+        Args:
+            path: Snapshot file written by SimhashSnapshot.write
+
+        Raises:
+            ValueError: If the file is not a snapshot of this version
+        """
+        self.path = path
+        self._mmap: Optional[mmap.mmap] = None
+        self._map()
+
+    @staticmethod
+    def write(
+        path: str,
+        entries: Iterable[Tuple[int, int, datetime]],
+        blocks: int = 4,
+    ) -> int:
+        """Write a snapshot atomically and start a new, empty append log.
+
+        Args:
+            path: Snapshot file path
+            entries: (row_id, simhash, timestamp) tuples, simhash unsigned 64-bit
+            blocks: Number of block tables (supports distances below blocks)
+
+        Returns:
+            Number of fingerprints written
+        """
+        if 64 % blocks:
+            raise ValueError(f"{blocks} blocks do not divide 64 bits")
+        block_bits = 64 // blocks
+
+        rows = sorted((simhash, _epoch(timestamp), row_id) for row_id, simhash, timestamp in entries)
+        count = len(rows)
+
+        generation = 1
+        try:
+            with open(path, "rb") as existing:
+                header = _HEADER.unpack(existing.read(_HEADER.size))
+                if header[0] == SNAPSHOT_MAGIC:
+                    generation = header[4] + 1
+        except (OSError, struct.error):
+            pass
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".simhash-")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, blocks, count, generation, time.time())
+                out.write(header.ljust(_HEADER_SIZE, b"\0"))
+                out.write(array("Q", (row[0] for row in rows)).tobytes())
+                out.write(array("q", (row[1] for row in rows)).tobytes())
+                out.write(array("q", (row[2] for row in rows)).tobytes())
+                for block in range(blocks):
+                    shift = 64 - block_bits * (block + 1)
+                    table = sorted(
+                        (_rotate_left(row[0], shift), position) for position, row in enumerate(rows)
+                    )
+                    out.write(array("Q", (rotated for rotated, _ in table)).tobytes())
+                    positions = array("I", (position for _, position in table)).tobytes()
+                    out.write(positions.ljust(_padded(len(positions)), b"\0"))
+            # Start the new generation's log before readers can see it
+            open(log_path(path, generation), "ab").close()
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        # Logs of older generations are covered by the new snapshot
+        for old_generation in range(max(1, generation - 10), generation):
+            try:
+                os.unlink(log_path(path, old_generation))
+            except FileNotFoundError:
+                pass
+        return count
+
+    def _map(self) -> None:
+        with open(self.path, "rb") as snapshot_file:
+            self._inode = os.fstat(snapshot_file.fileno()).st_ino
+            mapped = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, blocks, count, generation, created_at = _HEADER.unpack_from(mapped)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            mapped.close()
+            raise ValueError(f"Not a simhash snapshot: {self.path}")
+
+        if self._mmap is not None:
+            self._release()
+        self._mmap = mapped
+        self.blocks = blocks
+        self.block_bits = 64 // blocks
+        self.count = count
+        self.generation = generation
+        self.created_at = datetime.fromtimestamp(created_at, timezone.utc)
+
+        # Zero-copy typed views into the mapping
+        self._view = view = memoryview(mapped)
+        offset = _HEADER_SIZE
+        self._simhashes = view[offset:offset + 8 * count].cast("Q")
+        offset += 8 * count
+        self._timestamps = view[offset:offset + 8 * count].cast("q")
+        offset += 8 * count
+        self._row_ids = view[offset:offset + 8 * count].cast("q")
+        offset += 8 * count
+        self._tables = []
+        for _ in range(blocks):
+            rotated = view[offset:offset + 8 * count].cast("Q")
+            offset += 8 * count
+            positions = view[offset:offset + 4 * count].cast("I")
+            offset += _padded(4 * count)
+            self._tables.append((rotated, positions))
+
+        self._log = SimhashIndex(max_distance=blocks - 1, blocks=blocks)
+        self._log_offset = 0
+
+    def _release(self) -> None:
+        for rotated, positions in self._tables:
+            rotated.release()
+            positions.release()
+        for view in (self._simhashes, self._timestamps, self._row_ids, self._view):
+            view.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def close(self) -> None:
+        """Unmap the snapshot."""
+        if self._mmap is not None:
+            self._release()
+
+    def __enter__(self) -> "SimhashSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count + len(self._log)
+
+    def refresh(self) -> None:
+        """Remap a rebuilt snapshot and read new append log records."""
+        try:
+            if os.stat(self.path).st_ino != self._inode:
+                self._map()
+                logger.debug(f"Remapped simhash snapshot generation {self.generation}")
+        except FileNotFoundError:
+            pass
+
+        try:
+            with open(log_path(self.path, self.generation), "rb") as log_file:
+                log_file.seek(self._log_offset)
+                data = log_file.read()
+        except FileNotFoundError:
+            return
+        complete = len(data) - len(data) % _LOG_RECORD.size
+        for simhash, timestamp, row_id in _LOG_RECORD.iter_unpack(data[:complete]):
+            self._log.insert(simhash, row_id, datetime.fromtimestamp(timestamp, timezone.utc))
+        self._log_offset += complete
+
+    def append(self, entries: Iterable[Tuple[int, int, datetime]]) -> int:
+        """Append inserts to the current generation's log (visible after refresh).
+
+        Args:
+            entries: (row_id, simhash, timestamp) tuples
+
+        Returns:
+            Number of records appended
+        """
+        data = b"".join(
+            _LOG_RECORD.pack(simhash, _epoch(timestamp), row_id) for row_id, simhash, timestamp in entries
+        )
+        if not data:
+            return 0
+
+        # Another process may have rebuilt the snapshot since this one was
+        # mapped; its log is then gone or superseded, so write to the log of
+        # the generation on disk, and again if a rebuild lands mid-write
+        for _ in range(3):
+            generation = self._disk_generation()
+            try:
+                # No O_CREAT: write() creates each generation's log, and a
+                # missing one means a rebuild deleted it
+                fd = os.open(log_path(self.path, generation), os.O_WRONLY | os.O_APPEND)
+            except FileNotFoundError:
+                continue
+            try:
+                # One O_APPEND write per batch keeps concurrent writers' records whole
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            if self._disk_generation() == generation:
+                return len(data) // _LOG_RECORD.size
+
+        logger.warning(f"Simhash snapshot {self.path} kept being rebuilt; appended records may be lost")
+        return len(data) // _LOG_RECORD.size
+
+    def _disk_generation(self) -> int:
+        """Generation of the snapshot file currently at self.path."""
+        with open(self.path, "rb") as snapshot_file:
+            return _HEADER.unpack(snapshot_file.read(_HEADER.size))[4]
+
+    def query(
+        self,
+        simhash: int,
+        max_distance: int = 3,
+        since: Optional[datetime] = None,
+    ) -> List[Tuple[int, int]]:
+        """Find fingerprints within a Hamming distance in the snapshot and log.
+
+        Args:
+            simhash: Unsigned 64-bit fingerprint
+            max_distance: Maximum Hamming distance (below the block count)
+            since: Only match entries timestamped at or after this time
+
+        Returns:
+            List of (row_id, distance), snapshot matches first
+
+        Raises:
+            ValueError: If max_distance is not below the block count
+        """
+        if max_distance >= self.blocks:
+            raise ValueError(f"Snapshot supports distances below {self.blocks}")
+        min_timestamp = _epoch(since) if since is not None else None
+
+        candidates = set()
+        for block, (rotated, positions) in enumerate(self._tables):
+            shift = 64 - self.block_bits * (block + 1)
+            prefix = _rotate_left(simhash, shift) >> (64 - self.block_bits)
+            low = bisect_left(rotated, prefix << (64 - self.block_bits))
+            high = bisect_left(rotated, (prefix + 1) << (64 - self.block_bits), low)
+            candidates.update(positions[low:high])
+
+        matches = []
+        for position in sorted(candidates):
+            if min_timestamp is not None and self._timestamps[position] < min_timestamp:
+                continue
+            distance = (simhash ^ self._simhashes[position]).bit_count()
+            if distance <= max_distance:
+                matches.append((self._row_ids[position], distance))
+
+        matches.extend(self._log.query(simhash, max_distance, since=since))
+        return matches
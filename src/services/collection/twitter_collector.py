@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
@@ -18,6 +19,7 @@ except ImportError:
 
 from src.models import DataSource, RawNews
 from src.services.collection.base_collector import BaseCollector
+from src.services.collection.http_client import CollectionHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +27,23 @@ logger = logging.getLogger(__name__)
 class TwitterCollector(BaseCollector):
     """Collector for Twitter/X tweets."""
 
-    def __init__(self, data_source: DataSource):
+    def __init__(
+        self,
+        data_source: DataSource,
+        http_client: Optional[CollectionHttpClient] = None,
+        cpu_executor: Optional[Executor] = None,
+    ):
         """Initialize Twitter collector with API credentials.
 
         Args:
             data_source: DataSource model instance with Twitter configuration
+            http_client: Shared HTTP client (the Twitter API itself goes through tweepy)
+            cpu_executor: Executor for CPU-bound parsing (default: thread pool)
 
         Raises:
             ValueError: If required Twitter API credentials are not configured
         """
-        super().__init__(data_source)
+        super().__init__(data_source, http_client, cpu_executor)
 
         # Get Twitter API credentials from environment or data_source config
         bearer_token = (
@@ -1,11 +1,14 @@
 """Publishing service for publishing content to multiple channels."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 
+from src.config import get_settings
 from src.models import PublishedContent, ProcessedNews, ContentReview, RawNews
+from src.services.ai.scoring_service import ensure_publishable_summaries
 from src.services.channels.wechat import WeChatPublisher
 
 logger = logging.getLogger(__name__)
@@ -323,11 +326,17 @@ class PublishingService:
             if not raw_news:
                 raise ValueError(f"Raw news not found")
 
+            # Lazy mode: generate the summaries published below
+            if get_settings().ai_lazy_summaries and not (
+                processed_news.summary_pro and processed_news.summary_sci
+            ):
+                self._generate_lazy_summaries(processed_news)
+
             # Prepare content for WeChat
             title = raw_news.title
             author = raw_news.author or "DeepDive Tracking"
             content = processed_news.summary_pro  # Use professional summary
-            summary = processed_news.summary_sci[:100]  # Use scientific summary as description
+            summary = (processed_news.summary_sci or "")[:100]  # Use scientific summary as description
 
             # Publish to WeChat
             result = self.wechat_publisher.publish_article(
@@ -381,6 +390,25 @@ class PublishingService:
             self.logger.error(f"Error publishing to WeChat: {str(e)}")
             raise
 
+    def _generate_lazy_summaries(self, processed_news: ProcessedNews) -> None:
+        """Generate missing summaries from this synchronous publishing path.
+
+        Args:
+            processed_news: Article about to be published
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(ensure_publishable_summaries(
+                self.db_session, [processed_news], ["professional", "scientific"]
+            ))
+        else:
+            # asyncio.run cannot nest; async callers use fill_article_summaries
+            self.logger.warning(
+                f"Cannot generate lazy summaries for processed news {processed_news.id} "
+                f"inside a running event loop; publishing without them"
+            )
+
     def get_publishing_stats(self) -> Dict[str, Any]:
         """Get publishing statistics.
 
@@ -0,0 +1,38 @@
+"""Summaries for approved articles scored with AI_LAZY_SUMMARIES."""
+
+from typing import Any, Dict, List
+
+from sqlalchemy.orm import Session
+
+from src.models import ProcessedNews
+from src.services.ai.scoring_service import ensure_publishable_summaries
+
+
+async def fill_article_summaries(db_session: Session, articles: List[Dict[str, Any]]) -> int:
+    """Generate missing professional summaries for articles about to be published.
+
+    Articles are the dicts the publishing workflows build; their "summary"
+    (and "content", when the article has no body) are filled in place.
+
+    Args:
+        db_session: SQLAlchemy session
+        articles: Articles with "id" (processed news ID), "summary" and "content"
+
+    Returns:
+        Number of summaries generated
+    """
+    missing = [article for article in articles if not article["summary"]]
+    if not missing:
+        return 0
+
+    rows = db_session.query(ProcessedNews).filter(
+        ProcessedNews.id.in_([article["id"] for article in missing])
+    ).all()
+    generated = await ensure_publishable_summaries(db_session, rows, ["professional"])
+
+    if generated:
+        summaries = {row.id: row.summary_pro for row in rows}
+        for article in missing:
+            article["summary"] = summaries.get(article["id"])
+            article["content"] = article["content"] or article["summary"]
+    return generated
@@ -18,6 +18,7 @@ from datetime import datetime
 from src.services.channels.wechat import WeChatPublisher
 from src.services.channels.github import GitHubPublisher
 from src.services.channels.email import EmailPublisher
+from src.services.workflow.lazy_summaries import fill_article_summaries
 from src.models import (
     ContentReview,
     PublishedContent,
@@ -185,6 +186,8 @@ class MultiChannelPublishingWorkflow:
 
             # 获取待发布文章
             articles = self._get_approved_articles(limit=article_limit)
+            # 懒生成摘要模式 (AI_LAZY_SUMMARIES)：发布前补齐摘要
+            await fill_article_summaries(self.db_session, articles)
 
             if not articles:
                 return {
@@ -0,0 +1,9 @@
+"""Background tasks and workers."""
+
+from src.tasks.score_worker import ScoreWorker, WorkerStats, run_score_workers
+
+__all__ = [
+    "ScoreWorker",
+    "WorkerStats",
+    "run_score_workers",
+]
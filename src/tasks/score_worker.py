@@ -0,0 +1,330 @@
+"""Horizontally scalable scoring workers.
+
+Each worker loops: claim a batch from the ScoringQueue, score it
+concurrently, save it in one transaction, repeat. Workers coordinate only
+through the database (row leases with SKIP LOCKED), so any number of them can
+run per process and any number of processes or Cloud Run instances can run
+against the same database.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.config.settings import Settings
+from src.models import RawNews
+from src.services.ai import FullScoringResult, ScoringService, ScoringQueue, ScoringScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WorkerStats:
+    """Per-worker throughput counters."""
+
+    worker_id: str
+    claimed: int = 0
+    scored: int = 0
+    failed: int = 0
+    prescored: int = 0
+    reused: int = 0
+    cost: float = 0.0
+    content_tokens_saved: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the worker started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def articles_per_minute(self) -> float:
+        """Scored articles per minute."""
+        return self.scored * 60 / max(self.elapsed_seconds, 1e-9)
+
+    def summary(self) -> str:
+        """One-line throughput report."""
+        return (
+            f"{self.worker_id}: scored={self.scored} prescored={self.prescored} "
+            f"reused={self.reused} "
+            f"failed={self.failed} "
+            f"claimed={self.claimed} cost=${self.cost:.4f} "
+            f"tokens_saved={self.content_tokens_saved} "
+            f"rate={self.articles_per_minute:.1f}/min "
+            f"elapsed={self.elapsed_seconds:.0f}s"
+        )
+
+
+class ArticleBudget:
+    """Caps how many articles the workers of one process claim in total."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self.remaining = limit
+
+    def take(self, wanted: int) -> int:
+        """Reserve up to `wanted` articles; returns how many may be claimed."""
+        if self.remaining is None:
+            return wanted
+        granted = min(wanted, self.remaining)
+        self.remaining -= granted
+        return granted
+
+    def give_back(self, unused: int) -> None:
+        """Return reserved articles that were not claimed."""
+        if self.remaining is not None:
+            self.remaining += unused
+
+
+class ScoreWorker:
+    """Claims, scores and saves batches of raw news until the queue is drained."""
+
+    # Consecutive failed batches after which the worker gives up
+    max_consecutive_failures = 3
+
+    def __init__(
+        self,
+        worker_id: str,
+        settings: Settings,
+        session_factory: Callable[[], Session],
+        batch_size: int = 10,
+        lease_seconds: int = 600,
+        template_service: Optional[ScoringService] = None,
+    ):
+        """Initialize worker.
+
+        Args:
+            worker_id: Name used in logs and stats
+            settings: Application settings
+            session_factory: Creates the worker's own database session
+            batch_size: Articles claimed (and scored concurrently) per batch
+            lease_seconds: Claim lease; must exceed the time to score a batch
+            template_service: Service whose rate limiters, provider router,
+                response cache and pre-scorer are shared, so workers in one
+                process pool their budgets and load the model once
+        """
+        self.worker_id = worker_id
+        self.settings = settings
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.template_service = template_service
+        self.stats = WorkerStats(worker_id)
+        self.logger = logger
+
+    async def run(
+        self,
+        stop: Optional[asyncio.Event] = None,
+        budget: Optional[ArticleBudget] = None,
+        exit_when_idle: bool = True,
+        poll_interval: float = 30.0,
+        scheduler: Optional[ScoringScheduler] = None,
+    ) -> WorkerStats:
+        """Process batches until stopped, out of budget or time, or (optionally) idle.
+
+        Args:
+            stop: Set to stop claiming new batches (the current batch finishes)
+            budget: Shared article budget for this process
+            exit_when_idle: Exit when nothing is claimable instead of polling
+            poll_interval: Seconds between polls when idle
+            scheduler: Shared scheduler that orders claims by expected value
+                and stops dispatching before its deadline
+
+        Returns:
+            Final worker statistics
+        """
+        stop = stop or asyncio.Event()
+        budget = budget or ArticleBudget()
+        scheduler = scheduler or ScoringScheduler()
+        session = self.session_factory()
+        queue = ScoringQueue(session, lease_seconds=self.lease_seconds)
+        service = ScoringService(
+            self.settings,
+            session,
+            response_cache=self.template_service.cache if self.template_service else None,
+            rate_limiters=self.template_service.rate_limiters if self.template_service else None,
+            prescorer=self.template_service.prescorer if self.template_service else None,
+            router=self.template_service.router if self.template_service else None,
+        )
+
+        consecutive_failures = 0
+        try:
+            while not stop.is_set() and scheduler.can_dispatch():
+                wanted = budget.take(self.batch_size)
+                if wanted == 0:
+                    break
+
+                claimed = queue.claim(wanted, scheduler)
+                budget.give_back(wanted - len(claimed))
+
+                if not claimed:
+                    if exit_when_idle:
+                        break
+                    try:
+                        await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                self.stats.claimed += len(claimed)
+                batch_started = time.monotonic()
+                try:
+                    await self._process_batch(service, queue, claimed)
+                except Exception as e:
+                    # Hand the batch back right away instead of leaving it
+                    # locked until the lease expires
+                    consecutive_failures += 1
+                    self.logger.error(f"{self.worker_id}: batch failed: {e}", exc_info=True)
+                    session.rollback()
+                    self._release(queue, claimed)
+                    if consecutive_failures >= self.max_consecutive_failures:
+                        self.logger.error(
+                            f"{self.worker_id}: stopping after {consecutive_failures} failed batches"
+                        )
+                        break
+                    continue
+                consecutive_failures = 0
+                scheduler.record_batch(time.monotonic() - batch_started)
+                self.logger.info(self.stats.summary())
+
+        finally:
+            session.close()
+
+        return self.stats
+
+    def _release(self, queue: ScoringQueue, claimed: list) -> None:
+        """Return a failed batch's unfinished claims to the queue."""
+        try:
+            queue.release(claimed)
+        except Exception as e:
+            # The leases still expire, so the rows are reclaimed later
+            queue.db_session.rollback()
+            self.logger.error(f"{self.worker_id}: could not release claims: {e}")
+
+    async def _process_batch(
+        self, service: ScoringService, queue: ScoringQueue, claimed: list
+    ) -> None:
+        """Score one claimed batch and save it in a single transaction."""
+        claimed, reused = service.find_reusable(claimed)
+        if reused:
+            await service.save_reused_to_database(reused)
+            self.stats.reused += len(reused)
+
+        to_score, skipped = service.prescreen(claimed)
+        if skipped:
+            await service.save_prescored_to_database(skipped)
+            self.stats.prescored += len(skipped)
+
+        if not to_score:
+            return
+
+        scored: list[tuple[RawNews, FullScoringResult]] = []
+        async for event in service.batch_score_stream(to_score, max_concurrency=len(to_score)):
+            if event.ok and event.result is not None:
+                scored.append((event.raw_news, event.result))
+                self.stats.content_tokens_saved += event.result.metadata.content_tokens_saved
+            else:
+                self.stats.failed += 1
+                queue.fail(event.raw_news, str(event.error))
+
+        if not scored:
+            return
+
+        saved, errors = await service.save_batch_to_database(scored, batch_size=len(scored))
+        self.stats.scored += len(saved)
+        self.stats.cost += sum(record.cost or 0.0 for record in saved)
+
+        claimed_by_id = {raw_news.id: raw_news for raw_news, _ in scored}
+        for error in errors:
+            self.stats.failed += 1
+            queue.fail(claimed_by_id[error["raw_news_id"]], error["error"])
+
+
+async def run_score_workers(
+    settings: Settings,
+    session_factory: Callable[[], Session],
+    workers: int = 4,
+    batch_size: int = 10,
+    max_articles: Optional[int] = None,
+    exit_when_idle: bool = True,
+    poll_interval: float = 30.0,
+    stop: Optional[asyncio.Event] = None,
+    deadline_seconds: Optional[float] = None,
+) -> list[WorkerStats]:
+    """Run N scoring workers in this process.
+
+    Workers share one response cache, one set of provider rate limiters and
+    one provider router, so adding workers raises throughput until the
+    provider ceiling rather than past it.
+
+    Args:
+        settings: Application settings
+        session_factory: Creates a database session per worker
+        workers: Number of concurrent workers
+        batch_size: Articles claimed per batch per worker
+        max_articles: Total articles this process may claim (None = unlimited)
+        exit_when_idle: Exit when the queue is drained instead of polling
+        poll_interval: Seconds between polls when idle
+        stop: Set to stop all workers after their current batch
+        deadline_seconds: Wall-clock budget; no new batch is dispatched unless
+            it is expected to finish within it
+
+    Returns:
+        Statistics per worker
+    """
+    template = ScoringService(settings)
+    budget = ArticleBudget(max_articles)
+    stop = stop or asyncio.Event()
+    # Best articles first: source priority x freshness x pre-score
+    scheduler = ScoringScheduler(
+        prescorer=template.prescorer,
+        recency_half_life_hours=settings.scheduler_recency_half_life_hours,
+        deadline=time.monotonic() + deadline_seconds if deadline_seconds else None,
+    )
+
+    score_workers = [
+        ScoreWorker(
+            f"worker-{i + 1}",
+            settings,
+            session_factory,
+            batch_size=batch_size,
+            template_service=template,
+        )
+        for i in range(workers)
+    ]
+
+    started = time.monotonic()
+    # A worker that crashes must not cancel the others
+    results = await asyncio.gather(*(
+        worker.run(stop, budget, exit_when_idle, poll_interval, scheduler)
+        for worker in score_workers
+    ), return_exceptions=True)
+    stats = []
+    for worker, result in zip(score_workers, results):
+        if isinstance(result, BaseException):
+            logger.error(f"{worker.worker_id} crashed: {result!r}")
+            stats.append(worker.stats)
+        else:
+            stats.append(result)
+
+    elapsed = time.monotonic() - started
+    total_scored = sum(s.scored for s in stats)
+    for worker_stats in stats:
+        logger.info(worker_stats.summary())
+    logger.info(
+        f"All workers done: scored={total_scored} "
+        f"failed={sum(s.failed for s in stats)} "
+        f"cost=${sum(s.cost for s in stats):.4f} "
+        f"rate={total_scored * 60 / max(elapsed, 1e-9):.1f}/min"
+    )
+    for provider, provider_stats in template.provider_stats().items():
+        logger.info(
+            f"{provider}: requests={provider_stats['requests']} "
+            f"error_rate={provider_stats['error_rate']:.1%} "
+            f"p50={provider_stats['p50_ms']}ms p95={provider_stats['p95_ms']}ms "
+            f"hedges={provider_stats['hedges']} circuit={provider_stats['circuit']}"
+        )
+    return list(stats)
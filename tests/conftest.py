@@ -4,6 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.config import get_settings
+from src.config.settings import Settings
 from src.main import create_app
 
 
@@ -23,3 +24,25 @@ def client(app):
 def settings():
     """Get test settings."""
     return get_settings()
+
+
+@pytest.fixture
+def make_settings():
+    """Build Settings for service tests: test defaults plus overrides.
+
+    Ignores .env, uses OpenAI as the only provider and turns off features
+    that touch the filesystem (response cache, pre-scorer model).
+    """
+    def make(**overrides) -> Settings:
+        fields = dict(
+            ai_provider="openai",
+            openai_api_key="test-key",
+            openai_model="gpt-4o",
+            llm_cache_enabled=False,
+            prescorer_enabled=False,
+            ai_result_reuse=False,
+        )
+        fields.update(overrides)
+        return Settings(_env_file=None, **fields)
+
+    return make
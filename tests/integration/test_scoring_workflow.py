@@ -9,8 +9,14 @@ from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 from sqlalchemy.orm import Session
 
-from src.models import DataSource, RawNews, ProcessedNews
-from src.services.ai import ScoringService
+from src.models import DataSource, RawNews, ProcessedNews, CostLog
+from src.services.ai import (
+    ScoringService,
+    ScoringResponse,
+    SummaryResponse,
+    ProcessingMetadata,
+    FullScoringResult,
+)
 from src.config.settings import Settings
 
 
@@ -42,9 +48,10 @@ class TestScoringWorkflow:
         assert initial_count >= 1
 
         # Step 2: Score the news using AI service
-        with patch("src.services.ai.scoring_service.OpenAI") as mock_openai:
+        with patch("src.services.ai.scoring_service.AsyncOpenAI") as mock_openai:
             service = ScoringService(integration_settings, test_session)
             service.client = Mock()
+            service.client.chat.completions.create = AsyncMock()
 
             # Mock scoring response
             mock_scoring_response = Mock()
@@ -75,7 +82,7 @@ class TestScoringWorkflow:
             mock_summary_pro = Mock()
             mock_summary_pro.choices = [Mock()]
             mock_summary_pro.choices[0].message.content = json.dumps({
-                "summary_pro": "Technical breakthrough in AI delivering significant performance improvements. This advancement represents a major milestone with broad implications for industry transformation and competitive advantage."
+                "summary_pro": "Technical breakthrough in AI delivering significant performance improvements. This advancement represents a major milestone for the industry."
             })
             mock_summary_pro.usage.prompt_tokens = 200
             mock_summary_pro.usage.completion_tokens = 100
@@ -83,15 +90,33 @@ class TestScoringWorkflow:
             mock_summary_sci = Mock()
             mock_summary_sci.choices = [Mock()]
             mock_summary_sci.choices[0].message.content = json.dumps({
-                "summary_sci": "New AI advancement makes technology faster and more capable for practical applications. This breakthrough demonstrates significant progress in making advanced AI accessible for solving complex problems."
+                "summary_sci": "New AI advancement makes technology faster and more capable for practical applications. It makes advanced AI more accessible."
             })
             mock_summary_sci.usage.prompt_tokens = 200
             mock_summary_sci.usage.completion_tokens = 100
 
+            mock_summary_pro_en = Mock()
+            mock_summary_pro_en.choices = [Mock()]
+            mock_summary_pro_en.choices[0].message.content = json.dumps({
+                "summary_pro_en": "AI breakthrough delivers major performance and efficiency gains for industry."
+            })
+            mock_summary_pro_en.usage.prompt_tokens = 200
+            mock_summary_pro_en.usage.completion_tokens = 100
+
+            mock_summary_sci_en = Mock()
+            mock_summary_sci_en.choices = [Mock()]
+            mock_summary_sci_en.choices[0].message.content = json.dumps({
+                "summary_sci_en": "New AI makes technology faster and more useful in everyday applications."
+            })
+            mock_summary_sci_en.usage.prompt_tokens = 200
+            mock_summary_sci_en.usage.completion_tokens = 100
+
             service.client.chat.completions.create.side_effect = [
                 mock_scoring_response,
                 mock_summary_pro,
                 mock_summary_sci,
+                mock_summary_pro_en,
+                mock_summary_sci_en,
             ]
 
             # Execute scoring
@@ -108,7 +133,7 @@ class TestScoringWorkflow:
             assert len(result.summaries.summary_sci) > 0
 
         # Step 3: Save scoring result to database
-        with patch("src.services.ai.scoring_service.OpenAI"):
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
             service = ScoringService(integration_settings, test_session)
             processed = await service.save_to_database(raw_news, result)
 
@@ -163,9 +188,10 @@ class TestScoringWorkflow:
             test_session.refresh(raw_news)
 
         # Score all items in batch
-        with patch("src.services.ai.scoring_service.OpenAI"):
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
             service = ScoringService(integration_settings, test_session)
             service.client = Mock()
+            service.client.chat.completions.create = AsyncMock()
 
             # Create mock responses
             mock_scoring = Mock()
@@ -200,15 +226,37 @@ class TestScoringWorkflow:
             mock_summary_sci.usage.prompt_tokens = 200
             mock_summary_sci.usage.completion_tokens = 100
 
+            mock_summary_pro_en = Mock()
+            mock_summary_pro_en.choices = [Mock()]
+            mock_summary_pro_en.choices[0].message.content = json.dumps({
+                "summary_pro_en": "Professional summary of the article for industry decision makers."
+            })
+            mock_summary_pro_en.usage.prompt_tokens = 200
+            mock_summary_pro_en.usage.completion_tokens = 100
+
+            mock_summary_sci_en = Mock()
+            mock_summary_sci_en.choices = [Mock()]
+            mock_summary_sci_en.choices[0].message.content = json.dumps({
+                "summary_sci_en": "Accessible summary of the article for a general audience."
+            })
+            mock_summary_sci_en.usage.prompt_tokens = 200
+            mock_summary_sci_en.usage.completion_tokens = 100
+
             # Set up responses for batch
             responses = []
             for _ in range(len(raw_news_list)):
-                responses.extend([mock_scoring, mock_summary_pro, mock_summary_sci])
+                responses.extend([
+                    mock_scoring,
+                    mock_summary_pro,
+                    mock_summary_sci,
+                    mock_summary_pro_en,
+                    mock_summary_sci_en,
+                ])
 
             service.client.chat.completions.create.side_effect = responses
 
-            # Execute batch scoring
-            results, errors = await service.batch_score(raw_news_list)
+            # Execute batch scoring (one article at a time so responses arrive in sequence)
+            results, errors = await service.batch_score(raw_news_list, max_concurrency=1)
 
             # Verify results
             assert len(results) == 3
@@ -218,3 +266,76 @@ class TestScoringWorkflow:
         # Verify results were saved (batch_score doesn't save to DB, must save separately)
         # This is by design - the service returns results which must be saved explicitly
         assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_save_workflow(
+        self,
+        test_session: Session,
+        sample_data_source: DataSource,
+        integration_settings: Settings,
+    ):
+        """Test saving many results in batched transactions."""
+        raw_news_list = []
+        for i in range(5):
+            raw_news = RawNews(
+                source_id=sample_data_source.id,
+                title=f"Batch Save Item {i}",
+                url=f"https://example.com/batch-save/{i}",
+                content=f"Content for batch save item {i}",
+                source_name=sample_data_source.name,
+                hash=f"integration_batch_save_hash_{i}",
+                published_at=datetime.now(),
+                fetched_at=datetime.now(),
+                status="raw",
+            )
+            test_session.add(raw_news)
+            raw_news_list.append(raw_news)
+        test_session.commit()
+
+        def make_result(raw_news):
+            return FullScoringResult(
+                raw_news_id=raw_news.id,
+                scoring=ScoringResponse(
+                    score=72,
+                    score_reasoning="Solid update",
+                    category="company_news",
+                    confidence=0.8,
+                    key_points=["P1", "P2", "P3"],
+                    keywords=["a", "b", "c", "d", "e"],
+                    entities={"companies": [], "technologies": [], "people": []},
+                    impact_analysis="Moderate impact",
+                ),
+                summaries=SummaryResponse(
+                    summary_pro="公司发布新产品，提升模型推理效率。",
+                    summary_sci="一家公司推出了更快的AI产品。",
+                    summary_pro_en="Company ships a product with faster model inference.",
+                    summary_sci_en="A company released a faster AI product.",
+                ),
+                metadata=ProcessingMetadata(
+                    processing_time_ms=100,
+                    cost=0.01,
+                    cost_breakdown={"scoring": 0.01},
+                ),
+                quality_score=0.7,
+            )
+
+        # One article already saved: its batch is retried item by item
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+            service = ScoringService(integration_settings, test_session)
+            await service.save_to_database(raw_news_list[0], make_result(raw_news_list[0]))
+
+            saved, errors = await service.save_batch_to_database(
+                [(raw_news, make_result(raw_news)) for raw_news in raw_news_list],
+                batch_size=2,
+            )
+
+        assert len(saved) == 4
+        assert [e["raw_news_id"] for e in errors] == [raw_news_list[0].id]
+        assert test_session.query(ProcessedNews).count() == 5
+        assert test_session.query(CostLog).count() == 5
+        assert all(
+            raw_news.status == "processed"
+            for raw_news in test_session.query(RawNews).filter(
+                RawNews.id.in_([r.id for r in raw_news_list])
+            )
+        )
@@ -0,0 +1,279 @@
+"""Local OpenAI/xAI-compatible stand-in server for benchmarks.
+
+Serves POST /v1/chat/completions with canned but valid JSON answers for the
+scoring, summary and combined prompts, with configurable latency and 429
+injection, plus GET /feeds/{name}.xml RSS feeds so collection can run over
+real HTTP too. Point the app at it with XAI_BASE_URL / OPENAI_BASE_URL to
+exercise the whole pipeline without paying for tokens.
+
+Run standalone:
+    python -m tests.performance.fake_openai_server --port 8099 \\
+        --median-latency 0.8 --p95-latency 3 --rate-limit-probability 0.02
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from email.utils import format_datetime
+from typing import Optional
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+from src.services.ai.prompt_templates import CATEGORIES
+
+_SUMMARY_KEY_RE = re.compile(r'"(summary_(?:pro|sci)(?:_en)?)"')
+
+CANNED_SUMMARIES = {
+    "summary_pro": "新模型推理速度提升40%，成本下降一半，企业部署门槛显著降低。",
+    "summary_sci": "一款新的AI模型更快更便宜，让更多公司能用上先进AI。",
+    "summary_pro_en": "New model delivers 40% faster inference at half the cost, lowering enterprise deployment barriers.",
+    "summary_sci_en": "A faster, cheaper AI model makes advanced AI practical for many more companies.",
+}
+
+
+@dataclass
+class LatencyProfile:
+    """Response latency distribution (lognormal from median and p95)."""
+
+    median_seconds: float = 0.0
+    p95_seconds: Optional[float] = None
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.median_seconds <= 0:
+            return 0.0
+        if not self.p95_seconds or self.p95_seconds <= self.median_seconds:
+            return self.median_seconds
+        sigma = math.log(self.p95_seconds / self.median_seconds) / 1.645
+        return rng.lognormvariate(math.log(self.median_seconds), sigma)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class FakeOpenAIServer:
+    """In-process aiohttp server imitating the chat completions API."""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyProfile] = None,
+        rate_limit_probability: float = 0.0,
+        retry_after_seconds: float = 0.05,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize server.
+
+        Args:
+            latency: Latency of completion responses (default none)
+            rate_limit_probability: Share of completion requests answered 429
+            retry_after_seconds: Retry-After sent with 429 responses
+            seed: Random seed for latency and 429 injection
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+        """
+        self.latency = latency or LatencyProfile()
+        self.rate_limit_probability = rate_limit_probability
+        self.retry_after_seconds = retry_after_seconds
+        self.rng = random.Random(seed)
+        self.host = host
+        self.port = port
+        self.feeds: dict[str, list[dict]] = {}
+        self.requests: Counter = Counter()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def add_feed(self, name: str, items: list[dict]) -> str:
+        """Publish an RSS feed.
+
+        Args:
+            name: Feed name
+            items: Entries with title, link, content and published (datetime)
+
+        Returns:
+            Feed URL
+        """
+        self.feeds[name] = items
+        return f"{self.url}/feeds/{name}.xml"
+
+    def stats(self) -> dict:
+        """Request counts and server-side latency percentiles per kind."""
+        return {
+            "requests": dict(self.requests),
+            "latency": {
+                kind: {
+                    "p50": _percentile(values, 0.5),
+                    "p95": _percentile(values, 0.95),
+                }
+                for kind, values in self.latencies.items()
+            },
+        }
+
+    async def start(self) -> "FakeOpenAIServer":
+        """Start serving."""
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/v1/chat/completions", self._chat_completions)
+        app.router.add_post("/chat/completions", self._chat_completions)
+        app.router.add_get("/feeds/{name}.xml", self._feed)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeOpenAIServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _chat_completions(self, request: web.Request) -> web.Response:
+        started = time.perf_counter()
+        body = await request.json()
+        kind, content = self._answer(body)
+
+        await asyncio.sleep(self.latency.sample(self.rng))
+
+        if self.rng.random() < self.rate_limit_probability:
+            self.requests["rate_limited"] += 1
+            return web.json_response(
+                {"error": {
+                    "message": "Rate limit reached (injected by fake server)",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded",
+                }},
+                status=429,
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+
+        self.requests[kind] += 1
+        self.latencies[kind].append(time.perf_counter() - started)
+
+        prompt_chars = sum(len(m.get("content") or "") for m in body.get("messages", []))
+        completion = json.dumps(content, ensure_ascii=False)
+        prompt_tokens = prompt_chars // 3
+        completion_tokens = len(completion) // 3
+        return web.json_response({
+            "id": f"chatcmpl-fake-{sum(self.requests.values())}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": completion},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    @staticmethod
+    def _answer(body: dict) -> tuple[str, dict]:
+        """Pick the canned answer for a request: (kind, JSON content)."""
+        messages = body.get("messages", [])
+        prompt = messages[-1].get("content", "") if messages else ""
+
+        # Deterministic per prompt, spread over the whole score range
+        digest = hashlib.sha256(prompt.encode()).digest()
+        score = 15 + digest[0] % 81
+        category = CATEGORIES[digest[1] % len(CATEGORIES)]
+        scoring = {
+            "score": score,
+            "score_reasoning": "Canned reasoning from the fake server",
+            "category": category,
+            "sub_categories": [],
+            "confidence": 0.8,
+            "key_points": ["Canned point one", "Canned point two", "Canned point three"],
+            "keywords": ["ai", "model", "benchmark", "inference", "release"],
+            "entities": {"companies": ["ExampleAI"], "technologies": ["LLM"], "people": []},
+            "impact_analysis": "Canned impact analysis",
+        }
+
+        if body.get("response_format", {}).get("type") == "json_object":
+            return "combined", {**scoring, **CANNED_SUMMARIES}
+
+        keys = _SUMMARY_KEY_RE.findall(prompt)
+        if body.get("max_tokens") == 300 and keys:
+            return "summary", {keys[-1]: CANNED_SUMMARIES[keys[-1]]}
+
+        return "scoring", scoring
+
+    async def _feed(self, request: web.Request) -> web.Response:
+        items = self.feeds.get(request.match_info["name"])
+        if items is None:
+            raise web.HTTPNotFound()
+        entries = "".join(
+            f"<item><title>{escape(item['title'])}</title>"
+            f"<link>{escape(item['link'])}</link>"
+            f"<guid>{escape(item['link'])}</guid>"
+            f"<pubDate>{format_datetime(item['published'])}</pubDate>"
+            f"<description>{escape(item['content'])}</description></item>"
+            for item in items
+        )
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel><title>Fake feed</title>'
+            f"<link>{self.url}</link><description>Benchmark feed</description>"
+            f"{entries}</channel></rss>"
+        )
+        return web.Response(text=xml, content_type="application/rss+xml")
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = FakeOpenAIServer(
+        latency=LatencyProfile(args.median_latency, args.p95_latency),
+        rate_limit_probability=args.rate_limit_probability,
+        retry_after_seconds=args.retry_after,
+        port=args.port,
+    )
+    async with server:
+        print(f"Fake OpenAI server listening on {server.url}/v1")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(json.dumps(server.stats(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in server")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--median-latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--p95-latency", type=float, default=None, help="Seconds")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Seconds")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""End-to-end throughput benchmark against the local fake OpenAI server.
+
+Drives collect -> score -> save -> select -> render over real HTTP (RSS feeds
+and chat completions served by FakeOpenAIServer), real JSON parsing, the
+scoring workers and real database writes, and reports articles/sec, p50/p95
+per-article latency and time spent in the database per stage.
+
+The 100-article run is part of the normal suite. The 1k and 10k runs are
+opt-in:
+    ENABLE_FULL_BENCHMARKS=1 pytest tests/performance/test_pipeline_benchmark.py -s
+"""
+
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config.settings import Settings
+from src.models import DataSource, ProcessedNews, RawNews
+from src.models.base import Base
+from src.services.channels.email.email_publisher import EmailPublisher
+from src.services.collection.collection_manager import CollectionManager
+from src.services.selection import DiversityAwareSelector
+from src.tasks import run_score_workers
+from tests.performance.fake_openai_server import FakeOpenAIServer, LatencyProfile
+
+
+ITEMS_PER_FEED = 100
+
+FULL_BENCHMARK = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not os.getenv("ENABLE_FULL_BENCHMARKS"),
+        reason="Large benchmarks disabled. Enable with ENABLE_FULL_BENCHMARKS=1",
+    ),
+]
+
+
+class DatabaseTimer:
+    """Accumulates time spent executing SQL statements on an engine."""
+
+    def __init__(self, engine):
+        self.seconds = 0.0
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("statement_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.seconds += time.perf_counter() - conn.info["statement_started"].pop()
+        self.statements += 1
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0
+
+
+def _feed_items(feed_index, count, rng):
+    """Distinct articles (simhash-far apart) of roughly 1000 characters."""
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(count):
+        words = [f"term{rng.randrange(20000)}" for _ in range(120)]
+        items.append({
+            "title": f"Benchmark article {feed_index}-{i}: {' '.join(words[:4])}",
+            "link": f"https://news.example.com/{feed_index}/{i}",
+            "content": " ".join(words) + ".",
+            "published": now - timedelta(minutes=rng.randrange(24 * 60)),
+        })
+    return items
+
+
+async def _run_pipeline(articles, server, monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    timer = DatabaseTimer(engine)
+    stages = {}
+
+    def stage(name, started, db_before):
+        stages[name] = (time.perf_counter() - started, timer.seconds - db_before)
+
+    # Fallback provider requests go to the fake server as well
+    monkeypatch.setenv("OPENAI_BASE_URL", f"{server.url}/v1")
+    settings = Settings(
+        ai_provider="grok",
+        xai_api_key="fake-key",
+        xai_base_url=f"{server.url}/v1",
+        openai_api_key="fake-key",
+        llm_cache_enabled=False,
+        prescorer_enabled=False,
+    )
+
+    rng = random.Random(articles)
+    session = session_factory()
+    for feed_index in range(0, (articles + ITEMS_PER_FEED - 1) // ITEMS_PER_FEED):
+        count = min(ITEMS_PER_FEED, articles - feed_index * ITEMS_PER_FEED)
+        url = server.add_feed(f"feed-{feed_index}", _feed_items(feed_index, count, rng))
+        session.add(DataSource(
+            name=f"Benchmark Feed {feed_index}",
+            type="rss",
+            url=url,
+            priority=1 + feed_index % 10,
+            max_items_per_run=ITEMS_PER_FEED,
+        ))
+    session.commit()
+
+    # Collect
+    started, db_before = time.perf_counter(), timer.seconds
+    collection = await CollectionManager(session).collect_all()
+    stage("collect", started, db_before)
+    assert collection["total_new"] == articles, collection["errors"]
+
+    # Score + save
+    started, db_before = time.perf_counter(), timer.seconds
+    worker_stats = await run_score_workers(settings, session_factory, workers=4, batch_size=10)
+    stage("score+save", started, db_before)
+    assert sum(s.scored for s in worker_stats) == articles
+
+    # Select
+    started, db_before = time.perf_counter(), timer.seconds
+    selected, _ = DiversityAwareSelector(session).select_top_articles(limit=10, min_raw_score=60.0)
+    stage("select", started, db_before)
+    assert 0 < len(selected) <= 10
+
+    # Render
+    started, db_before = time.perf_counter(), timer.seconds
+    publisher = EmailPublisher(
+        smtp_host="localhost",
+        smtp_port=25,
+        smtp_user="",
+        smtp_password="",
+        from_email="benchmark@example.com",
+    )
+    html = publisher._generate_batch_email_html(
+        [
+            {
+                "title": candidate.raw_news.title,
+                "category": candidate.processed_news.category,
+                "score": candidate.processed_news.score,
+                "summary": candidate.processed_news.summary_pro,
+                "source_url": candidate.raw_news.url,
+            }
+            for candidate in selected
+        ],
+        "Benchmark digest",
+    )
+    stage("render", started, db_before)
+    assert "article-card" in html
+
+    latencies_ms = [
+        row.processing_time_ms for row in session.query(ProcessedNews.processing_time_ms)
+    ]
+    assert session.query(RawNews).filter(RawNews.status != "processed").count() == 0
+    session.close()
+
+    total_seconds = sum(seconds for seconds, _ in stages.values())
+    score_seconds = stages["score+save"][0]
+    server_stats = server.stats()
+
+    print(f"\n\nPipeline benchmark ({articles} articles):")
+    print(f"  {'stage':<12}{'wall s':>10}{'db s':>10}")
+    for name, (seconds, db_seconds) in stages.items():
+        print(f"  {name:<12}{seconds:>10.2f}{db_seconds:>10.2f}")
+    print(f"  {'total':<12}{total_seconds:>10.2f}{timer.seconds:>10.2f}")
+    print(f"  - End-to-end: {articles / total_seconds:.1f} articles/s")
+    print(f"  - Scoring: {articles / score_seconds:.1f} articles/s")
+    print(
+        f"  - Per-article scoring latency: p50={_percentile(latencies_ms, 0.5)}ms "
+        f"p95={_percentile(latencies_ms, 0.95)}ms"
+    )
+    print(f"  - SQL statements: {timer.statements}")
+    print(f"  - Server requests: {server_stats['requests']}")
+    return stages, server_stats
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "articles",
+    [100, pytest.param(1000, marks=FULL_BENCHMARK), pytest.param(10000, marks=FULL_BENCHMARK)],
+)
+async def test_pipeline_throughput(articles, monkeypatch):
+    """Benchmark collect -> score -> save -> select -> render."""
+    server = FakeOpenAIServer(
+        latency=LatencyProfile(median_seconds=0.02, p95_seconds=0.08),
+        rate_limit_probability=0.01,
+    )
+    async with server:
+        _, server_stats = await _run_pipeline(articles, server, monkeypatch)
+
+    # Scoring + 4 summaries per article
+    assert server_stats["requests"]["scoring"] == articles
+    assert server_stats["requests"]["summary"] == 4 * articles
+
+
+@pytest.mark.asyncio
+async def test_pipeline_survives_rate_limiting(monkeypatch):
+    """Test injected 429s are retried and every article still gets scored."""
+    server = FakeOpenAIServer(rate_limit_probability=0.3, retry_after_seconds=0.01, seed=1)
+    async with server:
+        _, server_stats = await _run_pipeline(20, server, monkeypatch)
+
+    assert server_stats["requests"]["rate_limited"] > 0
@@ -11,7 +11,7 @@ import pytest
 import json
 import time
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, AsyncMock
 from sqlalchemy.orm import Session
 
 from src.models import DataSource, RawNews
@@ -64,9 +64,10 @@ class TestScoringPerformance:
         """Benchmark single news scoring performance."""
         from unittest.mock import patch
 
-        with patch("src.services.ai.scoring_service.OpenAI"):
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
             service = ScoringService(performance_settings, test_session)
             service.client = Mock()
+            service.client.chat.completions.create = AsyncMock()
 
             # Mock response
             mock_response = Mock()
@@ -102,10 +103,28 @@ class TestScoringPerformance:
             mock_summary_sci.usage.prompt_tokens = 200
             mock_summary_sci.usage.completion_tokens = 100
 
+            mock_summary_pro_en = Mock()
+            mock_summary_pro_en.choices = [Mock()]
+            mock_summary_pro_en.choices[0].message.content = json.dumps({
+                "summary_pro_en": "Professional summary for the performance benchmark test."
+            })
+            mock_summary_pro_en.usage.prompt_tokens = 200
+            mock_summary_pro_en.usage.completion_tokens = 100
+
+            mock_summary_sci_en = Mock()
+            mock_summary_sci_en.choices = [Mock()]
+            mock_summary_sci_en.choices[0].message.content = json.dumps({
+                "summary_sci_en": "Plain-language summary for the performance benchmark test."
+            })
+            mock_summary_sci_en.usage.prompt_tokens = 200
+            mock_summary_sci_en.usage.completion_tokens = 100
+
             service.client.chat.completions.create.side_effect = [
                 mock_response,
                 mock_summary_pro,
                 mock_summary_sci,
+                mock_summary_pro_en,
+                mock_summary_sci_en,
             ]
 
             # Measure execution time
@@ -137,9 +156,10 @@ class TestScoringPerformance:
         """Benchmark batch scoring performance with 50 items."""
         from unittest.mock import patch
 
-        with patch("src.services.ai.scoring_service.OpenAI"):
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
             service = ScoringService(performance_settings, test_session)
             service.client = Mock()
+            service.client.chat.completions.create = AsyncMock()
 
             # Create mock responses
             mock_scoring = Mock()
@@ -161,17 +181,17 @@ class TestScoringPerformance:
             mock_summary = Mock()
             mock_summary.choices = [Mock()]
             mock_summary.choices[0].message.content = json.dumps({
-                "summary_pro": "Batch performance test summary demonstrating key findings and analysis results. This test measures processing efficiency and cost metrics for large-scale news item evaluation and categorization."
+                key: "Batch performance test summary demonstrating key findings and analysis results. This test measures processing efficiency and cost metrics."
+                for key in ("summary_pro", "summary_sci", "summary_pro_en", "summary_sci_en")
             })
             mock_summary.usage.prompt_tokens = 200
             mock_summary.usage.completion_tokens = 100
 
-            # Prepare responses for batch
-            responses = []
-            for _ in range(len(large_news_batch)):
-                responses.extend([mock_scoring, mock_summary, mock_summary])
-
-            service.client.chat.completions.create.side_effect = responses
+            # Articles are scored concurrently, so answer by request type
+            # (scoring requests allow 1000 output tokens, summaries 300)
+            service.client.chat.completions.create.side_effect = (
+                lambda **kwargs: mock_scoring if kwargs["max_tokens"] == 1000 else mock_summary
+            )
 
             # Measure batch execution time
             start_time = time.time()
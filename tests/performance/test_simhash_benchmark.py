@@ -0,0 +1,64 @@
+"""Simhash throughput benchmark for ContentDeduplicator.
+
+Compares the original per-token, per-bit Python loop with the vectorized
+compute_simhash_many (md5 and blake2b) on article-sized documents. The 1k
+run is part of the normal suite; 10k and 100k are opt-in:
+    ENABLE_FULL_BENCHMARKS=1 pytest tests/performance/test_simhash_benchmark.py -s
+"""
+
+import random
+import time
+
+import pytest
+
+from src.services.collection.deduplication import ContentDeduplicator
+from tests.performance.test_pipeline_benchmark import FULL_BENCHMARK
+from tests.unit.services.collection.test_deduplication import reference_simhash
+
+
+def _documents(count):
+    """Roughly 1000-character documents over a 20k-word vocabulary."""
+    rng = random.Random(count)
+    return [
+        " ".join(f"term{rng.randrange(20000)}" for _ in range(120))
+        for _ in range(count)
+    ]
+
+
+def _timed(function, documents):
+    started = time.perf_counter()
+    result = function(documents)
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.parametrize(
+    "documents",
+    [1000, pytest.param(10000, marks=FULL_BENCHMARK), pytest.param(100000, marks=FULL_BENCHMARK)],
+)
+def test_simhash_throughput(documents):
+    """Benchmark reference loop vs compute_simhash / compute_simhash_many."""
+    texts = _documents(documents)
+    md5 = ContentDeduplicator()
+    blake2b = ContentDeduplicator(hash_algorithm="blake2b")
+
+    expected, reference_seconds = _timed(lambda d: [reference_simhash(t) for t in d], texts)
+    single, single_seconds = _timed(lambda d: [md5.compute_simhash(t) for t in d], texts)
+    batch, batch_seconds = _timed(md5.compute_simhash_many, texts)
+    _, blake2b_seconds = _timed(blake2b.compute_simhash_many, texts)
+
+    assert single == expected
+    assert batch == expected
+
+    print(f"\n\nSimhash benchmark ({documents} documents):")
+    for name, seconds in [
+        ("reference", reference_seconds),
+        ("compute_simhash", single_seconds),
+        ("many (md5)", batch_seconds),
+        ("many (blake2b)", blake2b_seconds),
+    ]:
+        print(
+            f"  {name:<18}{seconds:>8.2f}s {documents / seconds:>10.0f} docs/s "
+            f"{reference_seconds / seconds:>6.1f}x"
+        )
+
+    assert batch_seconds < reference_seconds
@@ -0,0 +1,70 @@
+"""Tests for the persistent LLM response cache."""
+
+import pytest
+
+from src.cache import ResponseCache, content_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a file-backed cache in a temporary directory."""
+    cache = ResponseCache(str(tmp_path / "llm.sqlite3"))
+    yield cache
+    cache.close()
+
+
+class TestResponseCache:
+    """Test ResponseCache class."""
+
+    def test_set_and_get(self, cache):
+        """Test storing and reading back a value."""
+        key = ResponseCache.make_key(provider="grok", model="grok-3", operation="scoring")
+        cache.set(key, {"score": 85, "keywords": ["AI"]})
+
+        assert cache.get(key) == {"score": 85, "keywords": ["AI"]}
+        assert cache.get("missing") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the store."""
+        path = str(tmp_path / "llm.sqlite3")
+        first = ResponseCache(path)
+        first.set("key", "summary text")
+        first.close()
+
+        second = ResponseCache(path)
+        assert second.get("key") == "summary text"
+        assert second.stats()["bytes"] > 0
+        second.close()
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries older than the TTL are not returned."""
+        cache = ResponseCache(str(tmp_path / "llm.sqlite3"), ttl_seconds=-1)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_size_based_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over budget."""
+        cache = ResponseCache(str(tmp_path / "llm.sqlite3"), max_bytes=1000)
+        for i in range(10):
+            cache.set(f"key{i}", "x" * 200)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 1000
+        assert cache.get("key9") is not None
+        assert cache.get("key0") is None
+
+    def test_make_key_is_order_independent(self):
+        """Test key parts are canonicalized."""
+        assert ResponseCache.make_key(a=1, b="x") == ResponseCache.make_key(b="x", a=1)
+        assert ResponseCache.make_key(a=1) != ResponseCache.make_key(a=2)
+
+    def test_content_hash_normalizes_whitespace(self):
+        """Test cross-posted text with different whitespace shares a hash."""
+        assert content_hash("Title", "Some  content\n here") == content_hash(
+            " Title ", "Some content here"
+        )
+        assert content_hash("Title", "a") != content_hash("Title", "b")
@@ -0,0 +1,87 @@
+"""Tests for token-budgeted content compaction."""
+
+from src.services.ai.content_compactor import (
+    GAP_MARKER,
+    ContentCompactor,
+    count_tokens,
+    strip_boilerplate,
+)
+
+
+LEAD = "OpenAI released GPT-5 today with 40% faster inference than GPT-4."
+KEY_FACT = "OpenAI said GPT-5 scored 92.5 on the reasoning benchmark."
+
+
+def _long_article(filler_sentences=400):
+    filler = " ".join(
+        f"The weather in the city was pleasant on day number {i} of the season."
+        for i in range(filler_sentences)
+    )
+    return "\n".join([
+        LEAD,
+        "Subscribe to our newsletter",
+        filler,
+        KEY_FACT,
+        "All rights reserved.",
+    ])
+
+
+def test_strip_boilerplate_removes_chrome_and_duplicates():
+    """Test page chrome, repeated lines and blank lines are dropped."""
+    content = "\n".join([
+        "Advertisement",
+        "Real   paragraph one.",
+        "Share this article",
+        "",
+        "Real paragraph one.",
+        "版权所有 © 2025 某某科技",
+        "第二段正文。",
+    ])
+
+    assert strip_boilerplate(content) == "Real paragraph one.\n\n第二段正文。"
+
+
+def test_short_content_is_kept_verbatim():
+    """Test content within budget is neither cleaned nor cut."""
+    content = "\n".join([LEAD, "Subscribe to our newsletter", "", KEY_FACT, KEY_FACT])
+    result = ContentCompactor(max_tokens=500).compact("Title", content)
+
+    assert result.text == content
+    assert not result.compacted
+    assert result.original_tokens == result.compacted_tokens == count_tokens(content)
+
+
+def test_long_content_fits_budget_and_keeps_key_sentences():
+    """Test long content is cut to budget keeping the lead and informative sentences."""
+    content = _long_article()
+    result = ContentCompactor(max_tokens=200).compact("OpenAI releases GPT-5", content)
+
+    assert result.compacted_tokens <= 200
+    assert result.original_tokens == count_tokens(content)
+    assert result.saved_tokens > 4000
+    assert result.text.startswith(LEAD)
+    assert KEY_FACT in result.text
+    assert GAP_MARKER in result.text
+    assert "newsletter" not in result.text
+
+
+def test_articles_about_subscriptions_and_privacy_are_kept():
+    """Test lines that only mention chrome words are article text, not chrome."""
+    for content in (
+        "OpenAI will let ChatGPT Plus users subscribe to custom GPT newsletters",
+        "Meta changes its privacy policy to train Llama",
+        "OpenAI 宣布 ChatGPT 订阅用户突破 1000 万",
+    ):
+        result = ContentCompactor().compact(content, content)
+
+        assert result.text == content
+        assert not result.compacted
+
+
+def test_oversized_sentence_is_truncated_not_dropped():
+    """Test a single sentence longer than the budget is cut to the budget."""
+    for content in ("a" * 100000, "a." * 50000):
+        result = ContentCompactor(max_tokens=200).compact("Title", content)
+
+        assert 0 < result.compacted_tokens <= 200
+        assert content.startswith(result.text)
@@ -0,0 +1,140 @@
+"""Tests for the local pre-scorer."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from src.models import ProcessedNews, RawNews  # noqa: E402
+from src.services.ai import PreScorer, ScoringService, prescorer_text  # noqa: E402
+
+
+RELEVANT = [
+    "OpenAI releases new large language model with reasoning benchmark gains",
+    "DeepMind publishes transformer research on protein folding",
+    "Anthropic announces model with longer context window for agents",
+    "New open source LLM beats GPT-4 on coding benchmark",
+    "Researchers train multimodal AI model on video and text",
+]
+IRRELEVANT = [
+    "Local bakery wins award for best sourdough bread",
+    "City council approves new parking regulations downtown",
+    "Football team signs striker ahead of the season",
+    "Celebrity couple announces engagement on holiday",
+    "Weather forecast predicts rain showers this weekend",
+]
+
+
+def _training_data(repeat=4):
+    texts, scores, categories = [], [], []
+    for i in range(repeat):
+        for title in RELEVANT:
+            texts.append(prescorer_text(f"{title} {i}", title))
+            scores.append(85.0)
+            categories.append("tech_breakthrough")
+        for title in IRRELEVANT:
+            texts.append(prescorer_text(f"{title} {i}", title))
+            scores.append(10.0)
+            categories.append("company_news")
+    return texts, scores, categories
+
+
+@pytest.fixture
+def trained_prescorer():
+    return PreScorer(n_features=2 ** 12).fit(*_training_data())
+
+
+def test_prescorer_separates_relevant_from_irrelevant(trained_prescorer):
+    """Relevant articles get a higher probability, score and matching category."""
+    relevant, irrelevant = trained_prescorer.predict([
+        prescorer_text("OpenAI model sets new reasoning benchmark", ""),
+        prescorer_text("Bakery council approves parking for football weekend", ""),
+    ])
+
+    assert relevant.probability > 0.5 > irrelevant.probability
+    assert relevant.predicted_score > irrelevant.predicted_score
+    assert relevant.category == "tech_breakthrough"
+    assert irrelevant.category == "company_news"
+
+
+def test_prescorer_requires_both_classes():
+    """Training on one-sided history is rejected."""
+    with pytest.raises(ValueError):
+        PreScorer(n_features=2 ** 12).fit(["a", "b"], [80, 90], ["x", "x"])
+
+
+def test_prescorer_evaluate_report(trained_prescorer):
+    """The report counts skips, precision and missed publishable articles."""
+    texts, scores, _ = _training_data(repeat=1)
+    report = trained_prescorer.evaluate(texts, scores, cutoffs=(0.0, 0.5, 1.01))
+
+    nothing, half, everything = report
+    assert nothing["skipped"] == 0 and nothing["precision"] == 1.0
+    assert half["precision"] == 1.0 and half["missed"] == 0
+    assert half["recall"] == 1.0
+    assert everything["skip_rate"] == 1.0
+    assert everything["missed"] == len(RELEVANT)
+
+
+def test_prescorer_save_and_load(trained_prescorer, tmp_path):
+    """A saved model predicts the same after loading."""
+    path = tmp_path / "models" / "prescorer.pkl"
+    trained_prescorer.save(str(path))
+    loaded = PreScorer.load(str(path))
+
+    text = [prescorer_text(RELEVANT[0], "")]
+    assert loaded.predict(text) == trained_prescorer.predict(text)
+    assert loaded.trained_on == trained_prescorer.trained_on
+
+
+@pytest.mark.asyncio
+async def test_prescreen_skips_and_saves_lightweight_records(
+    trained_prescorer, test_session, sample_data_source, make_settings
+):
+    """Confidently irrelevant articles are saved without any LLM call."""
+    articles = []
+    for i, title in enumerate([RELEVANT[0], IRRELEVANT[0]]):
+        article = RawNews(
+            source_id=sample_data_source.id,
+            title=title,
+            content=title,
+            url=f"https://example.com/prescreen/{i}",
+            hash=f"prescreen-{i}",
+            published_at=datetime(2025, 1, 1),
+            fetched_at=datetime(2025, 1, 1),
+            status="processing",
+        )
+        test_session.add(article)
+        articles.append(article)
+    test_session.commit()
+
+    with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+        service = ScoringService(
+            make_settings(prescorer_skip_probability=0.5), test_session, prescorer=trained_prescorer
+        )
+
+    to_score, skipped = service.prescreen(articles)
+    assert to_score == [articles[0]]
+    assert [raw_news for raw_news, _ in skipped] == [articles[1]]
+
+    records = await service.save_prescored_to_database(skipped)
+
+    record = test_session.query(ProcessedNews).filter_by(raw_news_id=articles[1].id).one()
+    assert records == [record]
+    assert record.score < trained_prescorer.threshold
+    assert record.ai_models_used == ["prescorer"]
+    assert record.cost == 0.0
+    assert record.summary_pro == ""
+    test_session.refresh(articles[1])
+    assert articles[1].status == "processed"
+
+
+def test_prescreen_without_model_scores_everything(make_settings):
+    """With no pre-scorer loaded every article goes to the LLM."""
+    with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+        service = ScoringService(make_settings())
+    articles = [Mock(spec=RawNews), Mock(spec=RawNews)]
+
+    assert service.prescreen(articles) == (articles, [])
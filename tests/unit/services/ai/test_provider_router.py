@@ -0,0 +1,225 @@
+"""Tests for provider routing, circuit breaking and hedging."""
+
+import asyncio
+import json
+import random
+from unittest.mock import Mock, AsyncMock, patch
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from src.services.ai import ScoringService
+from src.services.ai.provider_router import (
+    CircuitBreaker,
+    ProviderRouter,
+    request_queued,
+    request_sent,
+)
+
+
+class ProviderDown(Exception):
+    """Stand-in for a provider API error."""
+
+
+def _connection_error():
+    """Create a connection error as raised by the OpenAI client."""
+    return APIConnectionError(
+        request=httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+    )
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    def test_opens_on_error_rate(self):
+        """Test the circuit opens once the error rate crosses the threshold."""
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, min_calls=4, open_seconds=60)
+
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_opens_on_latency_spike(self):
+        """Test the circuit opens when p95 latency exceeds the threshold."""
+        breaker = CircuitBreaker(latency_threshold_seconds=5.0, min_calls=3)
+
+        for latency in (1.0, 1.0, 9.0):
+            breaker.record_success(latency)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_probe_decides(self):
+        """Test an expired open circuit lets a probe through and closes on success."""
+        breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        assert breaker.allow()
+        breaker.record_success(0.1)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestProviderRouter:
+    """Test ProviderRouter class."""
+
+    def test_weighted_selection(self):
+        """Test traffic splits by weight and zero-weight providers only back up."""
+        router = ProviderRouter({"grok": 3.0, "openai": 1.0}, rng=random.Random(0))
+        firsts = [router.candidates()[0] for _ in range(2000)]
+        assert 0.7 < firsts.count("grok") / len(firsts) < 0.8
+
+        router = ProviderRouter({"grok": 1.0, "openai": 0.0})
+        assert all(router.candidates() == ["grok", "openai"] for _ in range(50))
+
+    def test_open_circuit_is_skipped(self):
+        """Test a provider with an open circuit is moved out of rotation."""
+        router = ProviderRouter(
+            {"grok": 1.0, "openai": 0.0},
+            breakers={"grok": CircuitBreaker(min_calls=1, open_seconds=60)},
+        )
+        router.breakers["grok"].record_failure()
+
+        assert router.candidates() == ["openai"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_on_failure(self):
+        """Test a failed call moves on to the next provider and is recorded."""
+        router = ProviderRouter({"grok": 1.0, "openai": 0.0}, retry_on=(ProviderDown,))
+
+        async def attempt(name):
+            if name == "grok":
+                raise ProviderDown("grok is down")
+            return name
+
+        assert await router.call(attempt) == "openai"
+        stats = router.stats()
+        assert stats["grok"]["failures"] == 1
+        assert stats["openai"]["successes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self):
+        """Test errors outside retry_on are not retried on another provider."""
+        router = ProviderRouter({"grok": 1.0, "openai": 0.0}, retry_on=(ProviderDown,))
+        attempt = AsyncMock(side_effect=KeyError("bug"))
+
+        with pytest.raises(KeyError):
+            await router.call(attempt)
+        assert attempt.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_when_primary_is_slow(self):
+        """Test a slow primary triggers a hedge whose result is used."""
+        router = ProviderRouter(
+            {"grok": 1.0, "openai": 0.0},
+            hedge_min_delay_seconds=0.01,
+            hedge_min_samples=3,
+        )
+        router.provider_stats["grok"].latencies.extend([0.01, 0.01, 0.01])
+        cancelled = []
+
+        async def attempt(name):
+            if name == "grok":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            return name
+
+        assert await router.call(attempt, hedge=True) == "openai"
+        assert cancelled == ["grok"]
+        stats = router.stats()
+        assert stats["openai"]["hedges"] == 1
+        assert stats["openai"]["hedge_wins"] == 1
+        # The cancelled attempt is neither a success nor a failure
+        assert stats["grok"]["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_local_queueing_is_not_latency(self):
+        """Test time queued for a rate-limiter slot neither hedges nor counts as latency."""
+        router = ProviderRouter(
+            {"grok": 1.0, "openai": 0.0},
+            hedge_min_delay_seconds=0.01,
+            hedge_min_samples=3,
+        )
+        router.provider_stats["grok"].latencies.extend([0.01, 0.01, 0.01])
+        attempt_names = []
+
+        async def attempt(name):
+            attempt_names.append(name)
+            request_queued()
+            await asyncio.sleep(0.1)
+            request_sent()
+            return name
+
+        assert await router.call(attempt, hedge=True) == "grok"
+        assert attempt_names == ["grok"]
+        assert router.provider_stats["grok"].latencies[-1] < 0.05
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        """Test hedging waits until the provider has enough latency samples."""
+        router = ProviderRouter({"grok": 1.0, "openai": 0.0}, hedge_min_samples=3)
+        attempt = AsyncMock(return_value="ok")
+
+        assert await router.call(attempt, hedge=True) == "ok"
+        attempt.assert_awaited_once_with("grok")
+        assert router.stats()["openai"]["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_summary_falls_back_to_secondary_provider(make_settings):
+    """Test summary generation uses the fallback provider when grok fails."""
+    settings = make_settings(
+        ai_provider="grok",
+        xai_model="grok-3",
+        ai_rate_limit_retries=0,
+        ai_load_balancing=False,
+        ai_hedged_requests=False,
+    )
+
+    with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+        service = ScoringService(settings)
+
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = json.dumps({"summary_pro_en": "A" * 40})
+    response.usage.prompt_tokens = 200
+    response.usage.completion_tokens = 100
+
+    service.client = Mock()
+    service.client.chat.completions.create = AsyncMock(side_effect=_connection_error())
+    service.fallback_client = Mock()
+    service.fallback_client.chat.completions.create = AsyncMock(return_value=response)
+
+    scoring = Mock()
+    scoring.score = 80
+    scoring.category.value = "tech_breakthrough"
+    scoring.key_points = ["point"]
+    raw_news = Mock(id=1, title="Title", content="Content")
+
+    served = {}
+    summary, _ = await service._generate_summary(raw_news, scoring, "professional_en", served=served)
+
+    assert summary == "A" * 40
+    # Attributed to the provider that answered, not the primary
+    assert served == {"summary_pro_en": "openai"}
+    assert service._models_used(served) == ["gpt-4o"]
+    assert service._attribution(served) == ("openai", "gpt-4o")
+    assert service.fallback_client.chat.completions.create.call_args.kwargs["model"] == "gpt-4o"
+    stats = service.provider_stats()
+    assert stats["grok"]["failures"] == 1
+    assert stats["openai"]["successes"] == 1
+    assert "rate_limiter" in stats["openai"]
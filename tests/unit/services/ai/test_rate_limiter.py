@@ -0,0 +1,120 @@
+"""Tests for the adaptive LLM rate limiter."""
+
+import asyncio
+import json
+from unittest.mock import Mock, AsyncMock, patch
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from src.services.ai import ScoringService
+from src.services.ai.rate_limiter import AdaptiveRateLimiter
+
+
+def _rate_limit_error(retry_after="0"):
+    """Create a 429 error as raised by the OpenAI client."""
+    response = httpx.Response(
+        429,
+        headers={"retry-after": retry_after},
+        request=httpx.Request("POST", "https://api.example.com/v1/chat/completions"),
+    )
+    return RateLimitError("Rate limit exceeded", response=response, body=None)
+
+
+class TestAdaptiveRateLimiter:
+    """Test AdaptiveRateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_on_success(self):
+        """Test concurrency grows while calls succeed, up to the max."""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=4, initial_concurrency=1)
+
+        for _ in range(20):
+            async with limiter.slot():
+                pass
+
+        assert limiter.concurrency == 4
+        assert limiter.in_flight == 0
+
+    def test_multiplicative_decrease_on_rate_limit(self):
+        """Test a burst of 429s halves concurrency once and pauses requests."""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=8, initial_concurrency=8)
+
+        limiter.on_rate_limited(retry_after=5)
+        limiter.on_rate_limited(retry_after=5)
+
+        assert limiter.concurrency == 4
+        assert limiter.rate_limited_count == 2
+        assert limiter.stats()["rate_limited"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_is_enforced(self):
+        """Test no more than `concurrency` requests run at once."""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=2, initial_concurrency=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_budget(self):
+        """Test requests over the RPM budget wait for the window."""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=10, requests_per_minute=2)
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute_budget(self):
+        """Test requests over the TPM budget wait for the window."""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=10, tokens_per_minute=1000)
+
+        slot = await limiter.acquire(estimated_tokens=600)
+        slot.record_tokens(900)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(estimated_tokens=200), timeout=0.05)
+
+
+class TestScoringServiceRateLimiting:
+    """Test rate limiting inside ScoringService."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried(self, make_settings):
+        """Test a 429 backs off the limiter and the call is retried."""
+        limiter = AdaptiveRateLimiter("openai", max_concurrency=4, initial_concurrency=4)
+
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+            service = ScoringService(make_settings(ai_rate_limit_retries=2), rate_limiters={"openai": limiter})
+
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps({"summary_pro_en": "A" * 40})
+        response.usage.prompt_tokens = 200
+        response.usage.completion_tokens = 100
+
+        service.client = Mock()
+        service.client.chat.completions.create = AsyncMock(
+            side_effect=[_rate_limit_error(), response]
+        )
+
+        result = await service._create_completion(
+            "openai", service.client, "gpt-4o", messages=[], max_tokens=300
+        )
+
+        assert result is response
+        assert service.client.chat.completions.create.await_count == 2
+        assert limiter.concurrency == 2
+        assert limiter.stats()["requests_last_minute"] == 2
+        assert limiter.stats()["tokens_last_minute"] == 300
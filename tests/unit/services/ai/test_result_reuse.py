@@ -0,0 +1,149 @@
+"""Tests for reusing scoring results of near-duplicate articles."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from src.models import ProcessedNews, RawNews
+from src.services.ai import ScoringService
+from src.services.ai.result_reuse import find_reusable
+from src.services.collection.simhash_index import to_signed64
+
+
+ORIGINAL = 0x9E3779B97F4A7C15
+
+
+def _raw_news(session, source, name, simhash):
+    raw_news = RawNews(
+        source_id=source.id,
+        title=name,
+        content=name,
+        url=f"https://example.com/{name}",
+        hash=name,
+        content_simhash=str(simhash) if simhash is not None else None,
+        published_at=datetime.utcnow(),
+        fetched_at=datetime.utcnow(),
+        status="processing",
+    )
+    session.add(raw_news)
+    session.flush()
+    return raw_news
+
+
+def _processed_news(session, raw_news, **overrides):
+    fields = dict(
+        raw_news_id=raw_news.id,
+        score=82,
+        score_breakdown={"reasoning": "Major release", "key_points": ["K1", "K2", "K3"]},
+        category="tech_breakthrough",
+        summary_pro="OpenAI 发布新一代多模态模型。",
+        summary_sci="一款新的AI模型可以同时理解文字和图像。",
+        summary_pro_en="OpenAI ships a new multimodal model.",
+        summary_sci_en="A new AI model understands text and images.",
+        keywords=["OpenAI", "multimodal"],
+        ai_models_used=["grok-3"],
+        cost=0.02,
+        quality_score=0.8,
+    )
+    fields.update(overrides)
+    processed = ProcessedNews(**fields)
+    session.add(processed)
+    session.flush()
+    return processed
+
+
+def test_find_reusable_picks_nearest_full_result(test_session, sample_data_source):
+    """Test only close neighbours with a full LLM result are reused."""
+    original = _processed_news(
+        test_session, _raw_news(test_session, sample_data_source, "original", ORIGINAL)
+    )
+    _processed_news(
+        test_session,
+        _raw_news(test_session, sample_data_source, "prescored", ORIGINAL ^ 0b1),
+        quality_notes="prescored",
+    )
+    _processed_news(
+        test_session,
+        _raw_news(test_session, sample_data_source, "stale", ORIGINAL ^ 0b10),
+        created_at=datetime.now(timezone.utc) - timedelta(days=30),
+    )
+
+    repost = _raw_news(test_session, sample_data_source, "repost", ORIGINAL ^ 0b111)
+    # Beyond the duplicate threshold: likely an updated story, scored afresh
+    update = _raw_news(test_session, sample_data_source, "update", ORIGINAL ^ 0b11111)
+    rewrite = _raw_news(test_session, sample_data_source, "rewrite", ORIGINAL ^ 0xFFFF)
+    no_content = _raw_news(test_session, sample_data_source, "no-content", None)
+    test_session.commit()
+
+    to_score, matches = find_reusable(test_session, [repost, update, rewrite, no_content])
+
+    assert to_score == [update, rewrite, no_content]
+    assert [(m.raw_news, m.source, m.distance) for m in matches] == [(repost, original, 3)]
+
+
+def test_find_reusable_loads_only_matched_results(test_session, sample_data_source):
+    """Test the window is scanned by fingerprint and only matched records are loaded."""
+    original = _processed_news(
+        test_session, _raw_news(test_session, sample_data_source, "original", ORIGINAL)
+    )
+    original.raw_news.simhash_signed = to_signed64(ORIGINAL)
+    for index in range(5):
+        _processed_news(
+            test_session,
+            _raw_news(test_session, sample_data_source, f"unrelated-{index}", ORIGINAL ^ (0xFFFFFF << (8 * index))),
+        )
+    repost_id = _raw_news(test_session, sample_data_source, "repost", ORIGINAL ^ 0b11).id
+    test_session.commit()
+    original_id = original.id
+    test_session.expunge_all()
+
+    repost = test_session.get(RawNews, repost_id)
+    loaded = []
+
+    def on_load(target, context):
+        loaded.append(target.id)
+
+    event.listen(ProcessedNews, "load", on_load)
+    try:
+        _, matches = find_reusable(test_session, [repost])
+    finally:
+        event.remove(ProcessedNews, "load", on_load)
+
+    assert [m.source.id for m in matches] == [original_id]
+    assert loaded == [original_id]
+
+
+@pytest.mark.asyncio
+async def test_save_reused_clones_result_with_provenance(test_session, sample_data_source, make_settings):
+    """Test a reused result copies the neighbour and links to it via previous_id."""
+    original = _processed_news(
+        test_session, _raw_news(test_session, sample_data_source, "original", ORIGINAL)
+    )
+    repost = _raw_news(test_session, sample_data_source, "repost", ORIGINAL ^ 0b111000)
+    test_session.commit()
+
+    with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+        service = ScoringService(make_settings(ai_result_reuse=True, ai_result_reuse_max_distance=6), test_session)
+
+    to_score, matches = service.find_reusable([repost])
+    assert to_score == []
+
+    [record] = await service.save_reused_to_database(matches)
+
+    test_session.refresh(repost)
+    assert repost.status == "processed"
+    assert record.raw_news_id == repost.id
+    assert record.previous_id == original.id
+    assert record.score == original.score
+    assert record.summary_pro_en == original.summary_pro_en
+    assert record.cost == 0.0
+    assert record.score_breakdown["reused_from"] == original.id
+    assert record.score_breakdown["simhash_distance"] == 3
+
+    # A reused record is never itself a reuse source
+    second = _raw_news(test_session, sample_data_source, "second-repost", ORIGINAL ^ 0b111001)
+    test_session.commit()
+    _, matches = service.find_reusable([second])
+    assert matches[0].source == original
@@ -0,0 +1,107 @@
+"""Tests for the lease-based scoring work queue."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models import DataSource, RawNews, ProcessedNews
+from src.services.ai import ScoringQueue
+
+
+@pytest.fixture
+def queued_news(test_session: Session, sample_data_source: DataSource) -> list[RawNews]:
+    """Create five raw news items, newest first by index."""
+    news_items = []
+    for i in range(5):
+        raw_news = RawNews(
+            source_id=sample_data_source.id,
+            title=f"Queued News {i}",
+            url=f"https://example.com/queue/{i}",
+            content=f"Content {i}",
+            hash=f"queue_hash_{i}",
+            published_at=datetime.now() - timedelta(hours=i),
+            fetched_at=datetime.now(),
+            status="raw",
+        )
+        test_session.add(raw_news)
+        news_items.append(raw_news)
+    test_session.commit()
+    return news_items
+
+
+class TestScoringQueue:
+    """Test ScoringQueue class."""
+
+    def test_claim_leases_rows(self, test_session, queued_news):
+        """Test claimed rows are leased and not handed out twice."""
+        queue = ScoringQueue(test_session, lease_seconds=600)
+
+        first = queue.claim(3)
+        second = queue.claim(3)
+
+        assert [n.id for n in first] == [n.id for n in queued_news[:3]]
+        assert [n.id for n in second] == [n.id for n in queued_news[3:]]
+        assert all(n.status == "processing" for n in first + second)
+        assert all(n.next_retry_at is not None for n in first)
+        assert queue.claim(3) == []
+
+    def test_claim_skips_already_processed(self, test_session, queued_news):
+        """Test articles with a ProcessedNews row are never rescored."""
+        test_session.add(ProcessedNews(
+            raw_news_id=queued_news[0].id,
+            score=80,
+            category="company_news",
+            summary_pro="已处理",
+            summary_sci="已处理",
+        ))
+        test_session.commit()
+
+        claimed = ScoringQueue(test_session).claim(10)
+
+        assert queued_news[0].id not in [n.id for n in claimed]
+        assert len(claimed) == 4
+
+    def test_fail_schedules_exponential_backoff(self, test_session, queued_news):
+        """Test failures back off exponentially and end in `failed`."""
+        queue = ScoringQueue(test_session, max_retries=3, base_backoff_seconds=60)
+        raw_news = queue.claim(1)[0]
+
+        queue.fail(raw_news, "Failed to score news: timeout")
+        first_delay = raw_news.next_retry_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+        assert raw_news.status == "raw"
+        assert raw_news.retry_count == 1
+        assert timedelta(seconds=50) < first_delay <= timedelta(seconds=60)
+        # Not due yet
+        assert raw_news.id not in [n.id for n in queue.claim(10)]
+
+        queue.fail(raw_news, "timeout")
+        second_delay = raw_news.next_retry_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+        assert timedelta(seconds=110) < second_delay <= timedelta(seconds=120)
+
+        queue.fail(raw_news, "timeout")
+        assert raw_news.status == "failed"
+        assert raw_news.next_retry_at is None
+        assert raw_news.error_message == "timeout"
+
+    def test_expired_leases_are_reclaimed(self, test_session, queued_news):
+        """Test rows left behind by a dead worker are claimed again."""
+        crashed = ScoringQueue(test_session, lease_seconds=-1)
+        abandoned = crashed.claim(2)
+
+        assert ScoringQueue(test_session).stats()["expired_leases"] == 2
+
+        reclaimed = ScoringQueue(test_session).claim(10)
+
+        assert {n.id for n in abandoned} <= {n.id for n in reclaimed}
+        assert all(n.retry_count == 1 for n in abandoned)
+
+    def test_release_returns_claims_without_penalty(self, test_session, queued_news):
+        """Test released claims are immediately claimable again."""
+        queue = ScoringQueue(test_session)
+        claimed = queue.claim(2)
+
+        queue.release(claimed)
+
+        assert all(n.status == "raw" and n.retry_count == 0 for n in claimed)
+        assert queue.stats()["due"] == 5
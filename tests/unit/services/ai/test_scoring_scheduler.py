@@ -0,0 +1,106 @@
+"""Tests for the deadline-aware scoring scheduler."""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from src.models import DataSource, RawNews
+from src.services.ai import ScoringQueue, ScoringScheduler
+
+
+def _news(title, hours_old=0):
+    return RawNews(title=title, content=title, published_at=datetime.utcnow() - timedelta(hours=hours_old))
+
+
+class TestScoringScheduler:
+    """Test ScoringScheduler class."""
+
+    def test_rank_by_priority_and_freshness(self):
+        """Test priority counts, but two half-lives of age outweigh it."""
+        scheduler = ScoringScheduler(recency_half_life_hours=24)
+        low = _news("low priority")
+        high = _news("high priority")
+        stale = _news("high priority, two days old", hours_old=48)
+
+        ranked = scheduler.rank([(low, 3), (stale, 9), (high, 9)])
+
+        assert ranked == [high, low, stale]
+
+    def test_rank_uses_prescore(self):
+        """Test the pre-score outweighs a small priority difference."""
+        prescorer = Mock()
+        prescorer.predict_proba.return_value = [0.9, 0.05]
+        scheduler = ScoringScheduler(prescorer=prescorer)
+        relevant = _news("relevant")
+        irrelevant = _news("irrelevant")
+
+        assert scheduler.rank([(relevant, 6), (irrelevant, 8)]) == [relevant, irrelevant]
+
+    def test_deadline_stops_dispatch(self):
+        """Test no batch is dispatched that would overrun the deadline."""
+        scheduler = ScoringScheduler(deadline=time.monotonic() + 100, safety_margin_seconds=10)
+        assert scheduler.can_dispatch()
+
+        scheduler.record_batch(95)
+        assert not scheduler.can_dispatch()
+
+        assert ScoringScheduler().can_dispatch()
+
+    def test_batch_estimate_rises_fast_and_decays_slowly(self):
+        """Test one slow batch raises the estimate immediately."""
+        scheduler = ScoringScheduler()
+        scheduler.record_batch(10)
+        scheduler.record_batch(50)
+        assert scheduler.batch_seconds == 50
+
+        scheduler.record_batch(10)
+        assert scheduler.batch_seconds == 42
+
+
+def test_claim_orders_by_expected_value(test_session, sample_data_source):
+    """Test the queue claims the best candidates first."""
+    important = DataSource(name="Important", type="rss", url="https://example.com/important", priority=9)
+    minor = DataSource(name="Minor", type="rss", url="https://example.com/minor", priority=2)
+    test_session.add_all([important, minor])
+    test_session.commit()
+
+    for i, (source, hours_old) in enumerate([(minor, 0), (important, 1), (minor, 2), (important, 200)]):
+        test_session.add(RawNews(
+            source_id=source.id,
+            title=f"Scheduled {i}",
+            url=f"https://example.com/scheduled/{i}",
+            hash=f"scheduled_{i}",
+            published_at=datetime.utcnow() - timedelta(hours=hours_old),
+            fetched_at=datetime.utcnow(),
+            status="raw",
+        ))
+    test_session.commit()
+
+    claimed = ScoringQueue(test_session).claim(2, ScoringScheduler(candidate_factor=3))
+
+    assert [n.title for n in claimed] == ["Scheduled 1", "Scheduled 0"]
+    assert all(n.status == "processing" for n in claimed)
+
+
+def test_claim_candidates_are_not_preselected_by_priority(test_session, sample_data_source):
+    """Test a fresh article from a low-priority source competes with a stale high-priority backlog."""
+    important = DataSource(name="Important", type="rss", url="https://example.com/important", priority=9)
+    minor = DataSource(name="Minor", type="rss", url="https://example.com/minor", priority=2)
+    test_session.add_all([important, minor])
+    test_session.commit()
+
+    for i, (source, hours_old) in enumerate([(important, 300), (important, 301), (important, 302), (minor, 0)]):
+        test_session.add(RawNews(
+            source_id=source.id,
+            title=f"Backlog {i}",
+            url=f"https://example.com/backlog/{i}",
+            hash=f"backlog_{i}",
+            published_at=datetime.utcnow() - timedelta(hours=hours_old),
+            fetched_at=datetime.utcnow(),
+            status="raw",
+        ))
+    test_session.commit()
+
+    claimed = ScoringQueue(test_session).claim(1, ScoringScheduler(candidate_factor=2))
+
+    assert [n.title for n in claimed] == ["Backlog 3"]
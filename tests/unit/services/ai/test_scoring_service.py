@@ -1,5 +1,6 @@
 """Tests for AI scoring service."""
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -13,15 +14,14 @@ from src.services.ai import (
     CategoryEnum,
 )
 from src.models import RawNews, ProcessedNews, DataSource
+from src.services.workflow.lazy_summaries import fill_article_summaries
+from src.cache import ResponseCache
 
 
 @pytest.fixture
-def mock_settings():
-    """Create mock settings."""
-    settings = Mock()
-    settings.openai_api_key = "test-key"
-    settings.openai_model = "gpt-4o"
-    return settings
+def mock_settings(make_settings):
+    """Create test settings."""
+    return make_settings(ai_content_max_tokens=2000)
 
 
 @pytest.fixture
@@ -50,12 +50,23 @@ def mock_raw_news():
     return news
 
 
+def _mock_summary_response(key, text):
+    """Create a mock chat completion that returns a single summary field."""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = json.dumps({key: text})
+    response.usage.prompt_tokens = 200
+    response.usage.completion_tokens = 100
+    return response
+
+
 @pytest.fixture
 def scoring_service(mock_settings, mock_db_session):
     """Create scoring service with mocked dependencies."""
-    with patch("src.services.ai.scoring_service.OpenAI"):
+    with patch("src.services.ai.scoring_service.AsyncOpenAI"):
         service = ScoringService(mock_settings, mock_db_session)
         service.client = Mock()
+        service.client.chat.completions.create = AsyncMock()
         return service
 
 
@@ -94,7 +105,7 @@ class TestScoringService:
         mock_summary_pro = Mock()
         mock_summary_pro.choices = [Mock()]
         mock_summary_pro.choices[0].message.content = json.dumps({
-            "summary_pro": "GPT-4o is a major multimodal breakthrough offering 50% faster performance and lower costs than GPT-4. It enables simultaneous processing of text, speech, and visual data. This achievement represents a significant milestone in AI development with broad implications."
+            "summary_pro": "GPT-4o is a major multimodal breakthrough offering 50% faster performance and lower costs than GPT-4. It enables simultaneous processing of text, speech, and visual data."
         })
         mock_summary_pro.usage.prompt_tokens = 200
         mock_summary_pro.usage.completion_tokens = 100
@@ -103,16 +114,25 @@ class TestScoringService:
         mock_summary_sci = Mock()
         mock_summary_sci.choices = [Mock()]
         mock_summary_sci.choices[0].message.content = json.dumps({
-            "summary_sci": "GPT-4o is an advanced AI model that understands text, images, and audio together. It works faster and costs less than previous versions. This breakthrough makes powerful AI technology more accessible for solving real-world problems."
+            "summary_sci": "GPT-4o is an advanced AI model that understands text, images, and audio together. It works faster and costs less than previous versions. It makes powerful AI more accessible."
         })
         mock_summary_sci.usage.prompt_tokens = 200
         mock_summary_sci.usage.completion_tokens = 100
 
+        mock_summary_pro_en = _mock_summary_response(
+            "summary_pro_en", "GPT-4o: multimodal model, 50% faster and cheaper than GPT-4."
+        )
+        mock_summary_sci_en = _mock_summary_response(
+            "summary_sci_en", "A new AI model that understands text, images and sound at once."
+        )
+
         # Set up side effects to return different responses
         scoring_service.client.chat.completions.create.side_effect = [
             mock_scoring_response,
             mock_summary_pro,  # Professional summary
             mock_summary_sci,  # Scientific summary
+            mock_summary_pro_en,  # Professional summary (English)
+            mock_summary_sci_en,  # Scientific summary (English)
         ]
 
         # Execute
@@ -142,6 +162,198 @@ class TestScoringService:
         with pytest.raises(ValueError, match="API returned invalid JSON"):
             await scoring_service.score_news(mock_raw_news)
 
+    @pytest.mark.asyncio
+    async def test_score_news_combined(self, scoring_service, mock_raw_news):
+        """Test combined mode scores and summarizes in a single request."""
+        scoring_service.combined_scoring = True
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({
+            "score": 85,
+            "score_reasoning": "Major AI model release",
+            "category": "tech_breakthrough",
+            "sub_categories": ["model_release"],
+            "confidence": 0.95,
+            "key_points": ["Multimodal", "50% faster", "Lower cost"],
+            "keywords": ["GPT-4o", "OpenAI", "AI", "multimodal", "model"],
+            "entities": {"companies": ["OpenAI"], "technologies": ["GPT-4o"], "people": []},
+            "impact_analysis": "Raises the bar for multimodal models",
+            "summary_pro": "OpenAI发布GPT-4o多模态模型，推理速度提升50%，成本显著下降。",
+            "summary_sci": "OpenAI推出新AI模型，能同时理解文字、图片和声音。",
+            "summary_pro_en": "GPT-4o: multimodal model, 50% faster and cheaper than GPT-4.",
+            "summary_sci_en": "A new AI model that understands text, images and sound at once.",
+        })
+        mock_response.usage.prompt_tokens = 800
+        mock_response.usage.completion_tokens = 500
+        scoring_service.client.chat.completions.create.return_value = mock_response
+
+        result = await scoring_service.score_news(mock_raw_news)
+
+        assert scoring_service.client.chat.completions.create.await_count == 1
+        call_kwargs = scoring_service.client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+        assert result.scoring.score == 85
+        assert result.summaries.summary_sci_en.startswith("A new AI model")
+        assert list(result.metadata.cost_breakdown) == ["combined"]
+
+    @pytest.mark.asyncio
+    async def test_score_news_compacts_long_content(self, scoring_service, mock_raw_news):
+        """Test long content is compacted to the token budget before prompting."""
+        scoring_service.combined_scoring = True
+        scoring_service.content_compactor.max_tokens = 200
+        mock_raw_news.content = "\n".join(
+            f"Paragraph {i} repeats background material about the AI industry."
+            for i in range(500)
+        )
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({
+            "score": 70,
+            "score_reasoning": "Industry background",
+            "category": "market_trends",
+            "confidence": 0.8,
+            "key_points": ["Industry background", "Recent developments", "No new release"],
+            "keywords": ["AI", "industry", "background", "trends"],
+            "entities": {"companies": [], "technologies": [], "people": []},
+            "impact_analysis": "Limited",
+            "summary_pro": "AI行业背景资料汇总，涵盖近期主要发展动态。",
+            "summary_sci": "这篇文章介绍了人工智能行业的一些背景知识。",
+            "summary_pro_en": "Background overview of recent AI industry developments.",
+            "summary_sci_en": "An overview of what has been happening in AI lately.",
+        })
+        mock_response.usage.prompt_tokens = 800
+        mock_response.usage.completion_tokens = 500
+        scoring_service.client.chat.completions.create.return_value = mock_response
+
+        result = await scoring_service.score_news(mock_raw_news)
+
+        prompt = scoring_service.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "Paragraph 0 " in prompt
+        assert "Paragraph 499 " not in prompt
+        assert result.metadata.content_tokens <= 200
+        assert result.metadata.content_tokens_saved > 3000
+
+    @pytest.mark.asyncio
+    async def test_score_news_combined_regenerates_invalid_summary(
+        self, scoring_service, mock_raw_news
+    ):
+        """Test combined mode falls back per field for invalid summaries."""
+        scoring_service.combined_scoring = True
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({
+            "score": 70,
+            "score_reasoning": "Solid product update",
+            "category": "applications",
+            "sub_categories": [],
+            "confidence": 0.8,
+            "key_points": ["Point 1", "Point 2", "Point 3"],
+            "keywords": ["ai", "model", "release", "openai", "update"],
+            "entities": {"companies": [], "technologies": [], "people": []},
+            "impact_analysis": "Moderate impact",
+            "summary_pro": "OpenAI发布GPT-4o多模态模型，推理速度提升50%。",
+            "summary_sci": "OpenAI推出新AI模型，能同时理解文字、图片和声音。",
+            "summary_pro_en": "x" * 500,  # Too long, fails validation
+        })
+        mock_response.usage.prompt_tokens = 800
+        mock_response.usage.completion_tokens = 400
+
+        scoring_service.client.chat.completions.create.side_effect = [
+            mock_response,
+            _mock_summary_response(
+                "summary_pro_en", "GPT-4o: multimodal model, 50% faster than GPT-4."
+            ),
+            _mock_summary_response(
+                "summary_sci_en", "A new AI model that understands text, images and sound."
+            ),
+        ]
+
+        result = await scoring_service.score_news(mock_raw_news)
+
+        assert scoring_service.client.chat.completions.create.await_count == 3
+        assert result.summaries.summary_pro.startswith("OpenAI发布")
+        assert result.summaries.summary_pro_en == "GPT-4o: multimodal model, 50% faster than GPT-4."
+        assert set(result.metadata.cost_breakdown) == {
+            "combined", "summary_pro_en", "summary_sci_en"
+        }
+
+    @pytest.mark.asyncio
+    async def test_score_news_cache_hit(self, scoring_service, mock_raw_news):
+        """Test re-scoring identical content is served from the response cache."""
+        scoring_service.cache = ResponseCache(":memory:")
+
+        mock_scoring_response = Mock()
+        mock_scoring_response.choices = [Mock()]
+        mock_scoring_response.choices[0].message.content = json.dumps({
+            "score": 80,
+            "score_reasoning": "Notable model release",
+            "category": "tech_breakthrough",
+            "sub_categories": [],
+            "confidence": 0.9,
+            "key_points": ["Point 1", "Point 2", "Point 3"],
+            "keywords": ["GPT-4o", "OpenAI", "AI", "model", "release"],
+            "entities": {"companies": ["OpenAI"], "technologies": [], "people": []},
+            "impact_analysis": "Significant impact",
+        })
+        mock_scoring_response.usage.prompt_tokens = 500
+        mock_scoring_response.usage.completion_tokens = 300
+
+        scoring_service.client.chat.completions.create.side_effect = [
+            mock_scoring_response,
+            _mock_summary_response("summary_pro", "OpenAI发布GPT-4o多模态模型，推理速度提升50%。"),
+            _mock_summary_response("summary_sci", "OpenAI推出新AI模型，能同时理解文字、图片和声音。"),
+            _mock_summary_response("summary_pro_en", "GPT-4o: multimodal model, 50% faster."),
+            _mock_summary_response("summary_sci_en", "A new AI model that understands images."),
+        ]
+
+        first = await scoring_service.score_news(mock_raw_news)
+        second = await scoring_service.score_news(mock_raw_news)
+
+        assert scoring_service.client.chat.completions.create.await_count == 5
+        assert first.metadata.cost > 0
+        assert first.metadata.cache_hits == []
+        assert second.metadata.cost == 0
+        assert second.metadata.cache_hits == list(second.metadata.cost_breakdown)
+        assert second.scoring == first.scoring
+        assert second.summaries == first.summaries
+
+    @pytest.mark.asyncio
+    async def test_free_call_is_not_a_cache_hit(self, scoring_service, mock_raw_news):
+        """Test a zero-cost API answer is not reported as served from the cache."""
+        scoring_service.cache = ResponseCache(":memory:")
+
+        mock_scoring_response = Mock()
+        mock_scoring_response.choices = [Mock()]
+        mock_scoring_response.choices[0].message.content = json.dumps({
+            "score": 80,
+            "score_reasoning": "Notable model release",
+            "category": "tech_breakthrough",
+            "sub_categories": [],
+            "confidence": 0.9,
+            "key_points": ["Point 1", "Point 2", "Point 3"],
+            "keywords": ["GPT-4o", "OpenAI", "AI", "model", "release"],
+            "entities": {"companies": ["OpenAI"], "technologies": [], "people": []},
+            "impact_analysis": "Significant impact",
+        })
+        mock_scoring_response.usage.prompt_tokens = 0
+        mock_scoring_response.usage.completion_tokens = 0
+
+        scoring_service.client.chat.completions.create.side_effect = [
+            mock_scoring_response,
+            _mock_summary_response("summary_pro", "OpenAI发布GPT-4o多模态模型，推理速度提升50%。"),
+            _mock_summary_response("summary_sci", "OpenAI推出新AI模型，能同时理解文字、图片和声音。"),
+            _mock_summary_response("summary_pro_en", "GPT-4o: multimodal model, 50% faster."),
+            _mock_summary_response("summary_sci_en", "A new AI model that understands images."),
+        ]
+
+        result = await scoring_service.score_news(mock_raw_news)
+
+        assert result.metadata.cost_breakdown["scoring"] == 0.0
+        assert "scoring" not in result.metadata.cache_hits
+
     @pytest.mark.asyncio
     async def test_batch_score(self, scoring_service, mock_raw_news):
         """Test batch scoring of multiple articles."""
@@ -173,7 +385,7 @@ class TestScoringService:
         mock_summary_pro = Mock()
         mock_summary_pro.choices = [Mock()]
         mock_summary_pro.choices[0].message.content = json.dumps({
-            "summary_pro": "Technical summary highlighting key developments and strategic implications for industry decision makers. Details the impact on technology advancement and competitive landscape. Suitable for professional understanding of importance."
+            "summary_pro": "Technical summary highlighting key developments and strategic implications for industry decision makers. Details the impact on technology advancement and competitive landscape."
         })
         mock_summary_pro.usage.prompt_tokens = 200
         mock_summary_pro.usage.completion_tokens = 100
@@ -186,15 +398,28 @@ class TestScoringService:
         mock_summary_sci.usage.prompt_tokens = 200
         mock_summary_sci.usage.completion_tokens = 100
 
-        # Set up to return responses in sequence: scoring, summary_pro, summary_sci (repeated for each news)
+        mock_summary_pro_en = _mock_summary_response(
+            "summary_pro_en", "GPT-4o: multimodal model, 50% faster and cheaper than GPT-4."
+        )
+        mock_summary_sci_en = _mock_summary_response(
+            "summary_sci_en", "A new AI model that understands text, images and sound at once."
+        )
+
+        # Set up to return responses in sequence: scoring, then the four summaries (repeated for each news)
         responses = []
         for _ in range(len(news_list)):
-            responses.extend([mock_scoring_response, mock_summary_pro, mock_summary_sci])
+            responses.extend([
+                mock_scoring_response,
+                mock_summary_pro,
+                mock_summary_sci,
+                mock_summary_pro_en,
+                mock_summary_sci_en,
+            ])
 
         scoring_service.client.chat.completions.create.side_effect = responses
 
-        # Execute
-        results, errors = await scoring_service.batch_score(news_list)
+        # Execute (one article at a time so responses arrive in sequence)
+        results, errors = await scoring_service.batch_score(news_list, max_concurrency=1)
 
         # Verify
         assert len(results) == 3
@@ -244,12 +469,21 @@ class TestScoringService:
         mock_summary_sci.usage.prompt_tokens = 200
         mock_summary_sci.usage.completion_tokens = 100
 
+        mock_summary_pro_en = _mock_summary_response(
+            "summary_pro_en", "GPT-4o: multimodal model, 50% faster and cheaper than GPT-4."
+        )
+        mock_summary_sci_en = _mock_summary_response(
+            "summary_sci_en", "A new AI model that understands text, images and sound at once."
+        )
+
         # First news item fails on first call, second succeeds
         scoring_service.client.chat.completions.create.side_effect = [
             Exception("API Error"),
             mock_scoring_response,  # Second news: scoring
             mock_summary_pro,  # Second news: summary_pro
             mock_summary_sci,  # Second news: summary_sci
+            mock_summary_pro_en,  # Second news: summary_pro_en
+            mock_summary_sci_en,  # Second news: summary_sci_en
         ]
 
         # Execute
@@ -262,6 +496,58 @@ class TestScoringService:
         assert len(errors) == 1
         assert "API Error" in errors[0]["error"]
 
+    @pytest.mark.asyncio
+    async def test_batch_score_stream_yields_in_completion_order(self, scoring_service):
+        """Test streaming yields items as they finish, with progress counters."""
+        news_list = [Mock(spec=RawNews, id=i, title=f"News {i}") for i in range(3)]
+        delays = {0: 0.03, 1: 0.01, 2: 0.02}
+
+        async def fake_score_news(raw_news):
+            await asyncio.sleep(delays[raw_news.id])
+            if raw_news.id == 2:
+                raise ValueError("Failed to score news: boom")
+            return f"result-{raw_news.id}"
+
+        scoring_service.score_news = fake_score_news
+
+        events = [event async for event in scoring_service.batch_score_stream(news_list)]
+
+        assert [event.index for event in events] == [1, 2, 0]
+        assert [event.completed for event in events] == [1, 2, 3]
+        assert events[1].ok is False
+        assert events[1].error_info()["raw_news_id"] == 2
+        assert (events[-1].succeeded, events[-1].failed, events[-1].total) == (2, 1, 3)
+
+        # batch_score is built on the stream but keeps input order
+        results, errors = await scoring_service.batch_score(news_list)
+        assert results == ["result-0", "result-1"]
+        assert errors == [{"raw_news_id": 2, "title": "News 2", "error": "Failed to score news: boom"}]
+
+    @pytest.mark.asyncio
+    async def test_batch_score_stream_limits_in_flight_items(self, scoring_service):
+        """Test only max_concurrency items are scored at once."""
+        news_list = [Mock(spec=RawNews, id=i, title=f"News {i}") for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_score_news(raw_news):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return raw_news.id
+
+        scoring_service.score_news = fake_score_news
+
+        events = [
+            event async for event in
+            scoring_service.batch_score_stream(news_list, max_concurrency=2)
+        ]
+
+        assert len(events) == 6
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_save_to_database(
         self, scoring_service, mock_raw_news, mock_db_session
@@ -306,10 +592,19 @@ class TestScoringService:
         mock_summary_sci.usage.prompt_tokens = 200
         mock_summary_sci.usage.completion_tokens = 100
 
+        mock_summary_pro_en = _mock_summary_response(
+            "summary_pro_en", "GPT-4o: multimodal model, 50% faster and cheaper than GPT-4."
+        )
+        mock_summary_sci_en = _mock_summary_response(
+            "summary_sci_en", "A new AI model that understands text, images and sound at once."
+        )
+
         scoring_service.client.chat.completions.create.side_effect = [
             mock_scoring_response,
             mock_summary_pro,  # Professional summary
             mock_summary_sci,  # Scientific summary
+            mock_summary_pro_en,  # Professional summary (English)
+            mock_summary_sci_en,  # Scientific summary (English)
         ]
 
         # Create scoring result
@@ -323,6 +618,134 @@ class TestScoringService:
         assert mock_db_session.commit.called
         assert mock_raw_news.status == "processed"
 
+    @pytest.mark.asyncio
+    async def test_score_news_lazy_summaries(self, scoring_service, mock_raw_news):
+        """Test lazy mode makes the scoring call only and stores no summaries."""
+        scoring_service.lazy_summaries = True
+        response = Mock()
+        response.choices = [Mock()]
+        response.usage.prompt_tokens = 500
+        response.usage.completion_tokens = 300
+        response.choices[0].message.content = json.dumps({
+            "score": 72,
+            "score_reasoning": "Solid product update",
+            "category": "company_news",
+            "confidence": 0.8,
+            "key_points": ["K1", "K2", "K3"],
+            "keywords": ["kw1", "kw2", "kw3", "kw4"],
+            "entities": {"companies": ["OpenAI"], "technologies": [], "people": []},
+            "impact_analysis": "Moderate",
+        })
+        scoring_service.client.chat.completions.create.return_value = response
+
+        result = await scoring_service.score_news(mock_raw_news)
+        processed = scoring_service._build_processed_news(mock_raw_news, result)
+
+        assert scoring_service.client.chat.completions.create.await_count == 1
+        assert result.summaries is None
+        assert list(result.metadata.cost_breakdown) == ["scoring"]
+        assert processed.summary_pro is None
+        assert processed.score_breakdown["key_points"] == ["K1", "K2", "K3"]
+
+    @pytest.mark.asyncio
+    async def test_ensure_summaries_generates_missing_once(
+        self, scoring_service, test_session, sample_data_source
+    ):
+        """Test lazy summaries are generated for missing versions and memoized."""
+        raw_news = RawNews(
+            source_id=sample_data_source.id,
+            title="OpenAI releases GPT-4o",
+            content="OpenAI today announced GPT-4o.",
+            url="https://example.com/gpt-4o",
+            hash="lazy_summary_hash",
+            published_at=datetime.utcnow(),
+            fetched_at=datetime.utcnow(),
+            status="processed",
+        )
+        test_session.add(raw_news)
+        test_session.flush()
+        processed = ProcessedNews(
+            raw_news_id=raw_news.id,
+            score=80,
+            score_breakdown={"key_points": ["K1", "K2", "K3"]},
+            category="tech_breakthrough",
+            cost=0.01,
+            cost_breakdown={"scoring": 0.01},
+        )
+        test_session.add(processed)
+        test_session.commit()
+
+        scoring_service.db_session = test_session
+        scoring_service.client.chat.completions.create.side_effect = [
+            _mock_summary_response("summary_pro", "GPT-4o 是一款多模态模型，速度提升50%。"),
+            _mock_summary_response("summary_pro_en", "API error: upstream timeout"),
+        ]
+
+        generated = await scoring_service.ensure_summaries(
+            processed, ["professional", "professional_en"]
+        )
+
+        assert list(generated) == ["summary_pro"]
+        assert processed.summary_pro.startswith("GPT-4o")
+        assert processed.summary_sci is None
+        # The placeholder for a failed call is not memoized
+        assert processed.summary_pro_en is None
+        assert processed.cost > 0.01
+        assert "summary_pro" in processed.cost_breakdown
+
+        # Already generated versions are not requested again
+        scoring_service.client.chat.completions.create.side_effect = [
+            _mock_summary_response("summary_pro_en", "GPT-4o: a multimodal model, 50% faster."),
+        ]
+        generated = await scoring_service.ensure_summaries(
+            processed, ["professional", "professional_en"]
+        )
+
+        assert list(generated) == ["summary_pro_en"]
+        assert scoring_service.client.chat.completions.create.await_count == 3
+        test_session.refresh(processed)
+        assert processed.summary_pro_en == "GPT-4o: a multimodal model, 50% faster."
+
+    @pytest.mark.asyncio
+    async def test_publishing_fills_lazy_summaries(self, mock_settings, test_session, sample_data_source):
+        """Test the publishing workflows generate summaries missing in lazy mode."""
+        raw_news = RawNews(
+            source_id=sample_data_source.id,
+            title="OpenAI releases GPT-4o",
+            content=None,
+            url="https://example.com/gpt-4o-publish",
+            hash="lazy_publish_hash",
+            published_at=datetime.utcnow(),
+            fetched_at=datetime.utcnow(),
+            status="processed",
+        )
+        test_session.add(raw_news)
+        test_session.flush()
+        processed = ProcessedNews(
+            raw_news_id=raw_news.id,
+            score=80,
+            score_breakdown={"key_points": ["K1", "K2", "K3"]},
+            category="tech_breakthrough",
+        )
+        test_session.add(processed)
+        test_session.commit()
+        articles = [{"id": processed.id, "summary": None, "content": None}]
+
+        mock_settings.ai_lazy_summaries = True
+        client = Mock()
+        client.chat.completions.create = AsyncMock(
+            return_value=_mock_summary_response("summary_pro", "GPT-4o 是一款多模态模型，速度提升50%。")
+        )
+        with patch("src.services.ai.scoring_service.AsyncOpenAI", return_value=client), \
+                patch("src.services.ai.scoring_service.get_settings", return_value=mock_settings):
+            generated = await fill_article_summaries(test_session, articles)
+
+        assert generated == 1
+        assert articles[0]["summary"].startswith("GPT-4o")
+        assert articles[0]["content"] == articles[0]["summary"]
+        test_session.refresh(processed)
+        assert processed.summary_pro == articles[0]["summary"]
+
     def test_calculate_quality_score(self, scoring_service):
         """Test quality score calculation."""
         # Create mock scoring response
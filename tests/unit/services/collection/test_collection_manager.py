@@ -1,12 +1,17 @@
 """Tests for collection manager."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from pytz import UTC
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from src.models import DataSource, RawNews
-from src.services.collection import CollectionManager
+from src.services.collection import CollectionHttpClient, CollectionManager
+from src.services.collection.simhash_index import simhash_columns
 
 
 class TestCollectionManager:
@@ -90,3 +95,165 @@ class TestCollectionManager:
 
         collector = manager._get_collector(source)
         assert collector is None
+
+    @pytest.mark.parametrize("mode", ["database", "in_memory_index", "snapshot"])
+    def test_find_similar_content_uses_recent_window(
+        self, test_session: Session, sample_data_source: DataSource, mode: str, tmp_path
+    ):
+        """Test near-duplicate lookup matches recent articles within 3 bits."""
+        now = datetime.now(UTC)
+        for name, simhash, age in [
+            ("near", 0xABCD ^ 0b111, timedelta(days=1)),
+            ("far", 0xABCD ^ 0b1111, timedelta(days=1)),
+            ("old", 0xABCD, timedelta(days=8)),
+            ("high-bits", 0xFEDCBA9876543210, timedelta(days=1)),
+        ]:
+            test_session.add(RawNews(
+                source_id=sample_data_source.id,
+                title=name,
+                url=f"https://example.com/{name}",
+                hash=name,
+                content_simhash=str(simhash),
+                **simhash_columns(simhash),
+                published_at=now - age,
+                fetched_at=now - age,
+            ))
+        test_session.commit()
+
+        if mode == "snapshot":
+            snapshot_path = str(tmp_path / "simhash.snapshot")
+            assert CollectionManager(test_session).export_simhash_snapshot(
+                snapshot_path, time_window_days=30
+            ) == 4
+            manager = CollectionManager(test_session, snapshot_path=snapshot_path)
+        else:
+            manager = CollectionManager(test_session, in_memory_index=mode == "in_memory_index")
+        assert manager._find_similar_content(0xABCD) == ["near"]
+        assert manager._find_similar_content(0xABCD, time_window_days=10) == ["near", "old"]
+        assert manager._find_similar_content(0xFEDCBA9876543210 ^ (1 << 63)) == ["high-bits"]
+
+        # Articles saved earlier in the same run match before any flush
+        manager._get_simhash_index().insert(0x5555, "this-run", now)
+        assert manager._find_similar_content(0x5554) == ["this-run"]
+
+    @pytest.mark.asyncio
+    async def test_collect_from_source_dedupes_batch_with_one_lookup(
+        self, test_session: Session, sample_data_source: DataSource, sample_raw_news: RawNews
+    ):
+        """Test exact duplicates are resolved by one hash query and within the batch."""
+        manager = CollectionManager(test_session)
+        sample_raw_news.hash = manager.deduplicator.compute_url_title_hash(
+            sample_raw_news.title, sample_raw_news.url
+        )
+        test_session.commit()
+
+        published = datetime.now(UTC)
+        content = " ".join(f"word{i}" for i in range(200))
+        articles = [
+            {"title": sample_raw_news.title, "url": sample_raw_news.url, "published_at": published},
+            {"title": "New", "url": "https://example.com/new", "content": content, "published_at": published},
+            {"title": "New", "url": "https://example.com/new", "content": content, "published_at": published},
+            {"title": "Repost", "url": "https://example.com/repost", "content": content + " (AP)",
+             "published_at": published},
+            {"title": "Other", "url": "https://example.com/other", "published_at": published},
+        ]
+        collector = Mock(spec=["collect"])
+        collector.collect = AsyncMock(return_value=articles)
+
+        hash_lookups = []
+        engine = test_session.get_bind()
+
+        def count_lookups(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT") and "raw_news.hash IN" in statement:
+                hash_lookups.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_lookups)
+        try:
+            with patch.object(manager, "_get_collector", return_value=collector):
+                collected, new, duplicates = await manager._collect_from_source(sample_data_source)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_lookups)
+
+        assert (collected, new, duplicates) == (5, 2, 3)
+        assert len(hash_lookups) == 1
+        assert {r.title for r in test_session.query(RawNews).filter(RawNews.id != sample_raw_news.id)} == {
+            "New",
+            "Other",
+        }
+
+    @pytest.mark.asyncio
+    async def test_collect_from_source_appends_snapshot_without_reloading(
+        self, test_session: Session, sample_data_source: DataSource, tmp_path
+    ):
+        """Test new fingerprints go to the shared snapshot without re-reading saved rows."""
+        snapshot_path = str(tmp_path / "simhash.snapshot")
+        CollectionManager(test_session).export_simhash_snapshot(snapshot_path)
+        manager = CollectionManager(test_session, snapshot_path=snapshot_path)
+
+        published = datetime.now(UTC)
+        articles = [
+            {"title": f"Story {i}", "url": f"https://example.com/story/{i}",
+             "content": " ".join(f"topic{i}word{n}" for n in range(200)), "published_at": published}
+            for i in range(2)
+        ]
+        collector = Mock(spec=["collect"])
+        collector.collect = AsyncMock(return_value=articles)
+
+        reloads = []
+        engine = test_session.get_bind()
+
+        def count_reloads(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT") and "WHERE raw_news.id =" in statement:
+                reloads.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_reloads)
+        try:
+            with patch.object(manager, "_get_collector", return_value=collector):
+                _, new, _ = await manager._collect_from_source(sample_data_source)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_reloads)
+
+        assert new == 2
+        assert reloads == []
+        snapshot = manager._get_snapshot()
+        snapshot.refresh()
+        for raw_news in test_session.query(RawNews):
+            assert (raw_news.id, 0) in snapshot.query(int(raw_news.content_simhash), 0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("honors_etag", [True, False])
+    async def test_collect_from_source_skips_unchanged_feed(
+        self, test_session: Session, sample_data_source: DataSource, honors_etag: bool
+    ):
+        """Test an unchanged feed (304 or same body) is not parsed again."""
+        feed = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+            "<item><title>Launch</title><link>https://example.com/launch</link>"
+            f"<description>{'Launch details. ' * 40}</description></item>"
+            "</channel></rss>"
+        )
+        requests = []
+
+        async def serve_feed(request):
+            requests.append(request.headers.get("If-None-Match"))
+            if honors_etag and request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(text=feed, content_type="application/rss+xml", headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/feed.xml", serve_feed)
+        async with TestServer(app) as server:
+            sample_data_source.url = str(server.make_url("/feed.xml"))
+            async with CollectionHttpClient() as client:
+                manager = CollectionManager(test_session, http_client=client)
+                first = await manager._collect_from_source(sample_data_source)
+                with patch("src.services.collection.rss_collector.feedparser.parse") as parse:
+                    second = await manager._collect_from_source(sample_data_source)
+
+        assert first == (1, 1, 0)
+        assert second == (0, 0, 0)
+        parse.assert_not_called()
+        assert requests == [None, '"v1"']
+        assert sample_data_source.feed_etag == '"v1"'
+        assert sample_data_source.feed_body_hash is not None
+        assert sample_data_source.last_success_at is not None
@@ -0,0 +1,78 @@
+"""Tests for Simhash content deduplication."""
+
+import hashlib
+import random
+
+import pytest
+
+from src.services.collection import deduplication
+from src.services.collection.deduplication import ContentDeduplicator
+
+
+def reference_simhash(text, hash_bits=64):
+    """The original per-token, per-bit loop the vectorized version replaces."""
+    if not text:
+        return 0
+    v = [0] * hash_bits
+    for token in ContentDeduplicator._tokenize(text):
+        token_hash = int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16)
+        for i in range(hash_bits):
+            v[i] += 1 if token_hash & (1 << i) else -1
+    return sum(1 << i for i in range(hash_bits) if v[i] > 0)
+
+
+def _texts():
+    rng = random.Random(7)
+    texts = [
+        " ".join(f"word{rng.randrange(400)}" for _ in range(rng.randrange(1, 250)))
+        for _ in range(200)
+    ]
+    return texts + [
+        "",
+        "a an of",  # Only short tokens and stopwords
+        "OpenAI releases GPT-5 with improved reasoning, coding and agents",
+        "OpenAI releases GPT-5 with improved reasoning, coding and agents today",
+        "Mistral 发布 新模型 Mistral-Large mixture experts",
+    ]
+
+
+@pytest.mark.parametrize("hash_bits", [64, 32, 128])
+def test_simhash_matches_reference(hash_bits):
+    """Test fingerprints are identical to the original implementation."""
+    deduplicator = ContentDeduplicator(hash_bits=hash_bits)
+    texts = _texts()
+
+    assert deduplicator.compute_simhash_many(texts, chunk_size=17) == [
+        reference_simhash(text, hash_bits) for text in texts
+    ]
+    assert deduplicator.compute_simhash(texts[-2]) == reference_simhash(texts[-2], hash_bits)
+
+
+def test_simhash_without_numpy(monkeypatch):
+    """Test the pure Python fallback gives the same fingerprints."""
+    texts = _texts()
+    expected = ContentDeduplicator().compute_simhash_many(texts)
+
+    monkeypatch.setattr(deduplication, "np", None)
+
+    assert ContentDeduplicator().compute_simhash_many(texts) == expected
+
+
+def test_simhash_blake2b_mode():
+    """Test blake2b fingerprints are stable and still detect near duplicates."""
+    deduplicator = ContentDeduplicator(hash_algorithm="blake2b")
+    texts = _texts()
+
+    fingerprints = deduplicator.compute_simhash_many(texts)
+    singles = [deduplicator.compute_simhash(text) for text in texts]
+    assert fingerprints == singles
+    assert fingerprints[-3] != reference_simhash(texts[-3])
+
+    article = " ".join(f"token{i}" for i in range(150))
+    repost = deduplicator.compute_simhash(article + " (Reuters)")
+    assert deduplicator.is_duplicate(deduplicator.compute_simhash(article), repost)
+
+    with pytest.raises(ValueError):
+        ContentDeduplicator(hash_algorithm="sha1")
+    with pytest.raises(ValueError):
+        ContentDeduplicator(hash_bits=128, hash_algorithm="blake2b")
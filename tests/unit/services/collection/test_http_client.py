@@ -0,0 +1,126 @@
+"""Tests for the shared collection HTTP client."""
+
+import asyncio
+import gzip
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.models import DataSource
+from src.services.collection import RSSCollector
+from src.services.collection.http_client import CollectionHttpClient, ResponseTooLargeError
+
+GBK_PAGE = '<html><head><meta charset="gb2312"></head><body>人工智能新闻：模型发布</body></html>'
+LATIN1_PAGE = (
+    '<html><head><meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1"></head>'
+    "<body>Café naïve résumé</body></html>"
+)
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>First</title><link>https://example.com/1</link>
+<description>%s</description></item>
+</channel></rss>""" % ("Long enough body. " * 40)
+
+
+def _app(state):
+    async def gzipped(request):
+        return web.Response(
+            body=gzip.compress(b"hello " * 100),
+            headers={"Content-Encoding": "gzip", "Content-Type": "text/plain; charset=utf-8"},
+        )
+
+    async def big(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(8):
+            await response.write(b"x" * 1024)
+        return response
+
+    async def slow(request):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.05)
+        state["in_flight"] -= 1
+        return web.Response(text="ok")
+
+    async def feed(request):
+        return web.Response(text=FEED, content_type="application/rss+xml")
+
+    async def gbk(request):
+        return web.Response(body=GBK_PAGE.encode("gbk"), content_type="text/html")
+
+    async def latin1(request):
+        return web.Response(body=LATIN1_PAGE.encode("latin-1"), content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/gzip", gzipped)
+    app.router.add_get("/gbk", gbk)
+    app.router.add_get("/latin1", latin1)
+    app.router.add_get("/big", big)
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/feed.xml", feed)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_decompresses_and_caps_response_size():
+    """Test gzip bodies are decoded and oversized streamed bodies are rejected."""
+    async with TestServer(_app({})) as server:
+        async with CollectionHttpClient(max_response_bytes=4096) as client:
+            assert await client.get_text(str(server.make_url("/gzip"))) == "hello " * 100
+            with pytest.raises(ResponseTooLargeError):
+                await client.get_bytes(str(server.make_url("/big")))
+
+
+@pytest.mark.asyncio
+async def test_limits_requests_in_flight_across_callers():
+    """Test the global concurrency cap holds for many concurrent requests."""
+    state = {"in_flight": 0, "peak": 0}
+    async with TestServer(_app(state)) as server:
+        async with CollectionHttpClient(max_concurrency=3, limit_per_host=10) as client:
+            url = str(server.make_url("/slow"))
+            results = await asyncio.gather(*(client.get_text(url) for _ in range(12)))
+
+    assert results == ["ok"] * 12
+    assert state["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_collectors_share_injected_client():
+    """Test a collector uses the injected client and leaves it open."""
+    async with TestServer(_app({})) as server:
+        async with CollectionHttpClient() as client:
+            source = DataSource(id=1, name="Feed", type="rss", url=str(server.make_url("/feed.xml")))
+            collector = RSSCollector(source, http_client=client)
+
+            articles = await collector.collect()
+
+            assert [article["title"] for article in articles] == ["First"]
+            assert collector.http_client is client
+            assert not client.session.closed
+
+
+@pytest.mark.asyncio
+async def test_decodes_with_declared_charset_when_header_has_none():
+    """Test pages without a Content-Type charset are decoded by their <meta> charset."""
+    async with TestServer(_app({})) as server:
+        async with CollectionHttpClient() as client:
+            assert await client.get_text(str(server.make_url("/gbk"))) == GBK_PAGE
+            assert await client.get_text(str(server.make_url("/latin1"))) == LATIN1_PAGE
+
+
+@pytest.mark.asyncio
+async def test_slow_server_times_out():
+    """Test the default per-request timeout applies when no override is given."""
+    async def stall(request):
+        await asyncio.sleep(5)
+        return web.Response(text="late")
+
+    app = web.Application()
+    app.router.add_get("/stall", stall)
+    async with TestServer(app) as server:
+        async with CollectionHttpClient(timeout_seconds=0.2) as client:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get_text(str(server.make_url("/stall")))
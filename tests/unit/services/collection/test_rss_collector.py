@@ -0,0 +1,96 @@
+"""Tests for the RSS collector."""
+
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.models import DataSource
+from src.services.collection import CollectionHttpClient, RSSCollector
+from src.services.collection.process_pool import get_process_pool, shutdown_process_pool
+
+ENTRIES = 6
+
+
+def _extract_paragraphs(url, html):
+    """Stand-in for the newspaper3k parse step."""
+    return {"text": " ".join(re.findall(r"<p>(.*?)</p>", html)), "html": html}
+
+
+@pytest.mark.asyncio
+async def test_fetches_full_articles_concurrently_in_feed_order():
+    """Test short entries are fetched concurrently, bounded, and kept in feed order."""
+    state = {"in_flight": 0, "peak": 0}
+
+    async def article(request):
+        index = int(request.match_info["index"])
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        # Earlier entries answer last
+        await asyncio.sleep(0.02 * (ENTRIES - index))
+        state["in_flight"] -= 1
+        paragraphs = "".join(
+            f"<p>Paragraph {n} of article {index} explains the release in some detail.</p>" for n in range(20)
+        )
+        return web.Response(
+            text=f"<html><head><title>Article {index}</title></head><body><article>{paragraphs}</article></body></html>",
+            content_type="text/html",
+        )
+
+    async def feed(request):
+        items = "".join(
+            f"<item><title>Article {index}</title><link>{request.url.origin()}/article/{index}</link>"
+            f"<description>Short summary of article {index}.</description></item>"
+            for index in range(ENTRIES)
+        )
+        return web.Response(
+            text=f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>',
+            content_type="application/rss+xml",
+        )
+
+    app = web.Application()
+    app.router.add_get("/feed.xml", feed)
+    app.router.add_get("/article/{index}", article)
+    async with TestServer(app) as server:
+        async with CollectionHttpClient() as client:
+            source = DataSource(id=1, name="Feed", type="rss", url=str(server.make_url("/feed.xml")))
+            collector = RSSCollector(source, http_client=client)
+            collector.entry_concurrency = 3
+
+            with patch("src.services.collection.rss_collector.NewspaperArticle", object), patch.object(
+                RSSCollector, "_extract_with_newspaper", staticmethod(_extract_paragraphs)
+            ):
+                articles = await collector.collect()
+
+    assert [a["title"] for a in articles] == [f"Article {index}" for index in range(ENTRIES)]
+    assert all(a["content_source"] == "fetched" for a in articles)
+    assert state["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_process_pool_gives_same_articles_as_thread_pool():
+    """Test feed parsing and language detection in worker processes match the thread pool."""
+    items = "".join(
+        f"<item><title>Entry {index}</title><link>https://example.com/{index}</link>"
+        f"<author>writer{index}@example.com (Writer {index})</author>"
+        f"<pubDate>Mon, 0{index + 1} Sep 2025 10:00:00 GMT</pubDate>"
+        f"<description><![CDATA[<p>{'Model release notes and benchmark results. ' * 15}</p>]]></description></item>"
+        for index in range(3)
+    )
+    feed = f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'.encode()
+    source = DataSource(id=1, name="Feed", type="rss", url="https://example.com/feed.xml")
+
+    try:
+        results = []
+        for executor in (None, get_process_pool(2)):
+            collector = RSSCollector(source, cpu_executor=executor)
+            results.append(await collector._parse_feed(feed))
+    finally:
+        shutdown_process_pool()
+
+    assert len(results[0]) == 3
+    assert results[1] == results[0]
+    assert {article["language"] for article in results[1]} == {"en"}
@@ -0,0 +1,66 @@
+"""Tests for the pre-fetch seen-entry gate."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models import DataSource, RawNews
+from src.services.collection import RSSCollector
+from src.services.collection.deduplication import ContentDeduplicator
+from src.services.collection.seen_filter import SeenFilter
+
+
+def _store(session, source, title, url):
+    session.add(RawNews(
+        source_id=source.id,
+        title=title,
+        url=url,
+        hash=ContentDeduplicator().compute_url_title_hash(title, url),
+        published_at=datetime.utcnow(),
+        fetched_at=datetime.utcnow(),
+    ))
+    session.commit()
+
+
+def test_seen_matches_hash_url_guid_and_batch(test_session: Session, sample_data_source: DataSource):
+    """Test entries are seen by URL/title hash, URL, permalink GUID or an earlier batch entry."""
+    _store(test_session, sample_data_source, "Stored", "https://example.com/stored")
+    _store(test_session, sample_data_source, "Old title", "https://example.com/retitled")
+    _store(test_session, sample_data_source, "Via guid", "https://example.com/permalink")
+
+    flags = SeenFilter(test_session).seen([
+        {"title": "Stored", "url": "https://example.com/stored?utm_source=rss"},
+        {"title": "New title", "url": "https://example.com/retitled"},
+        {"title": "Via guid", "url": "https://feeds.example.com/r/123", "guid": "https://example.com/permalink"},
+        {"title": "Fresh", "url": "https://example.com/fresh", "guid": "tag:example.com,2025:1"},
+        {"title": "Fresh", "url": "https://example.com/fresh/"},
+    ])
+
+    assert flags == [True, True, True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_skips_seen_entries_before_fetching(
+    test_session: Session, sample_data_source: DataSource
+):
+    """Test stored entries never reach the full-article fetch."""
+    _store(test_session, sample_data_source, "Stored", "https://example.com/stored")
+    items = "".join(
+        f"<item><title>{title}</title><link>https://example.com/{slug}</link>"
+        f"<description>Short summary of the {slug} article.</description></item>"
+        for title, slug in [("Stored", "stored"), ("Fresh", "fresh")]
+    )
+    feed = f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+
+    collector = RSSCollector(sample_data_source, seen_filter=SeenFilter(test_session))
+    fetch = AsyncMock(side_effect=lambda url, content, html: {
+        "content": content, "html_content": html, "is_full_text": False, "content_source": "rss",
+    })
+    with patch.object(collector, "_fetch_full_article", fetch):
+        articles = await collector._parse_feed(feed)
+
+    assert [a["title"] for a in articles] == ["Fresh"]
+    assert collector.skipped_seen == 1
+    assert [call.args[0] for call in fetch.await_args_list] == ["https://example.com/fresh"]
@@ -0,0 +1,68 @@
+"""Tests for the in-memory Simhash index."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.collection.simhash_index import SimhashIndex
+
+
+def _near(rng, fingerprint, distance, bits=64):
+    for bit in rng.sample(range(bits), distance):
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+@pytest.mark.parametrize("max_distance,blocks", [(3, 4), (6, 8)])
+def test_query_matches_linear_scan(max_distance, blocks):
+    """Test lookups return exactly what a linear scan returns."""
+    rng = random.Random(max_distance)
+    index = SimhashIndex(max_distance=max_distance)
+    assert index.blocks == blocks
+
+    fingerprints = []
+    for i in range(2000):
+        base = rng.choice(fingerprints) if fingerprints and i % 3 else rng.getrandbits(64)
+        fingerprints.append(_near(rng, base, rng.randrange(0, 9)))
+        index.insert(fingerprints[-1], i)
+
+    for _ in range(300):
+        query = _near(rng, rng.choice(fingerprints), rng.randrange(0, 9))
+        expected = [
+            (i, (query ^ fingerprint).bit_count())
+            for i, fingerprint in enumerate(fingerprints)
+            if (query ^ fingerprint).bit_count() <= max_distance
+        ]
+        assert index.query(query) == expected
+
+
+def test_expire_remove_and_time_window():
+    """Test entries leave the index by expiry, removal and the since filter."""
+    now = datetime.now(timezone.utc)
+    index = SimhashIndex()
+    old = index.insert(0xFFFF, "old", now - timedelta(days=8))
+    recent = index.insert(0xFFFE, "recent", now - timedelta(days=1))
+    index.insert(0xFFFD, "no-timestamp")
+
+    assert [p for p, _ in index.query(0xFFFF)] == ["old", "recent", "no-timestamp"]
+    assert [p for p, _ in index.query(0xFFFF, since=now - timedelta(days=7))] == [
+        "recent",
+        "no-timestamp",
+    ]
+
+    assert index.expire(now - timedelta(days=7)) == 1
+    assert not index.remove(old)
+    assert index.remove(recent)
+    assert index.query(0xFFFF) == [("no-timestamp", 1)]
+    assert len(index) == 1
+
+
+def test_invalid_configuration():
+    """Test distances the block layout cannot guarantee are rejected."""
+    with pytest.raises(ValueError):
+        SimhashIndex(max_distance=4, blocks=4)
+    with pytest.raises(ValueError):
+        SimhashIndex(blocks=5)
+    with pytest.raises(ValueError):
+        SimhashIndex().query(0, max_distance=4)
@@ -0,0 +1,99 @@
+"""Tests for the memory-mapped simhash snapshot."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.collection.deduplication import ContentDeduplicator
+from src.services.collection.simhash_snapshot import SimhashSnapshot
+
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _entries(count, seed=0):
+    rng = random.Random(seed)
+    entries = []
+    for row_id in range(1, count + 1):
+        simhash = rng.choice(entries)[1] if entries and row_id % 3 else rng.getrandbits(64)
+        for bit in rng.sample(range(64), rng.randrange(0, 7)):
+            simhash ^= 1 << bit
+        entries.append((row_id, simhash, NOW - timedelta(days=rng.randrange(10))))
+    return entries
+
+
+def test_snapshot_query_matches_linear_scan(tmp_path):
+    """Test snapshot lookups return exactly what a linear scan returns."""
+    path = str(tmp_path / "simhash.snapshot")
+    entries = _entries(3000)
+    deduplicator = ContentDeduplicator()
+    assert deduplicator.export_snapshot(path, entries) == 3000
+
+    rng = random.Random(1)
+    since = NOW - timedelta(days=7)
+    with deduplicator.load_snapshot(path) as snapshot:
+        assert len(snapshot) == 3000
+        for _ in range(200):
+            query = rng.choice(entries)[1] ^ (1 << rng.randrange(64))
+            expected = [
+                (row_id, (query ^ simhash).bit_count())
+                for row_id, simhash, timestamp in sorted(entries, key=lambda e: e[1])
+                if (query ^ simhash).bit_count() <= 3 and timestamp >= since
+            ]
+            assert sorted(snapshot.query(query, 3, since=since)) == sorted(expected)
+
+
+def test_append_log_and_rebuild_are_seen_by_other_readers(tmp_path):
+    """Test a second mapping sees appended inserts and remaps a rebuilt snapshot."""
+    path = str(tmp_path / "simhash.snapshot")
+    SimhashSnapshot.write(path, [(1, 0xAAAA, NOW)])
+    writer = SimhashSnapshot(path)
+    reader = SimhashSnapshot(path)
+
+    assert writer.append([(2, 0x5555, NOW)]) == 1
+    assert reader.query(0x5554) == []
+    reader.refresh()
+    assert reader.query(0x5554) == [(2, 1)]
+
+    SimhashSnapshot.write(path, [(1, 0xAAAA, NOW), (2, 0x5555, NOW), (3, 0xF0F0, NOW)])
+    reader.refresh()
+    assert reader.generation == 2
+    assert len(reader) == 3
+    assert reader.query(0x5554) == [(2, 1)]
+    assert not (tmp_path / "simhash.snapshot.1.log").exists()
+
+    writer.close()
+    reader.close()
+
+
+def test_append_after_rebuild_by_another_process(tmp_path):
+    """Test a mapping opened before a rebuild appends to the new generation's log."""
+    path = str(tmp_path / "simhash.snapshot")
+    SimhashSnapshot.write(path, [(1, 0xAAAA, NOW)])
+    stale = SimhashSnapshot(path)
+
+    SimhashSnapshot.write(path, [(1, 0xAAAA, NOW)])
+    assert stale.generation == 1
+    assert stale.append([(2, 0x5555, NOW)]) == 1
+
+    assert not (tmp_path / "simhash.snapshot.1.log").exists()
+    with SimhashSnapshot(path) as reader:
+        reader.refresh()
+        assert reader.generation == 2
+        assert reader.query(0x5554) == [(2, 1)]
+    stale.close()
+
+
+def test_invalid_snapshot(tmp_path):
+    """Test files that are not snapshots and too wide distances are rejected."""
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        SimhashSnapshot(str(path))
+
+    SimhashSnapshot.write(str(path), [])
+    with SimhashSnapshot(str(path)) as snapshot:
+        assert snapshot.query(0x1234) == []
+        with pytest.raises(ValueError):
+            snapshot.query(0x1234, max_distance=4)
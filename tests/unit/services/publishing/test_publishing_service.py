@@ -0,0 +1,87 @@
+"""Tests for publishing service lazy summary generation."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.models import PublishedContent
+from src.services.publishing.publishing_service import PublishingService
+
+
+@pytest.fixture
+def published_content(test_session, sample_processed_news):
+    """Create content scheduled for WeChat."""
+    content = PublishedContent(
+        processed_news_id=sample_processed_news.id,
+        raw_news_id=sample_processed_news.raw_news_id,
+        channels=["wechat"],
+    )
+    test_session.add(content)
+    test_session.commit()
+    return content
+
+
+@pytest.fixture
+def service(test_session):
+    """Publishing service with a stub WeChat publisher."""
+    service = PublishingService(test_session)
+    service.wechat_publisher = Mock()
+    service.wechat_publisher.publish_article.return_value = {"success": True, "media_id": "m1"}
+    return service
+
+
+def _publish(service, published_content, make_settings, **overrides):
+    with patch(
+        "src.services.publishing.publishing_service.get_settings",
+        return_value=make_settings(**overrides),
+    ), patch(
+        "src.services.publishing.publishing_service.ensure_publishable_summaries",
+        new_callable=AsyncMock,
+    ) as ensure:
+        service.publish_to_wechat(published_content.id)
+    return ensure
+
+
+def test_lazy_summaries_off_skips_generation(
+    service, published_content, sample_processed_news, make_settings
+):
+    """Without lazy summaries nothing is generated at publish time."""
+    sample_processed_news.summary_pro = None
+
+    ensure = _publish(service, published_content, make_settings, ai_lazy_summaries=False)
+
+    ensure.assert_not_called()
+
+
+def test_existing_summaries_skip_generation(service, published_content, make_settings):
+    """Summaries already stored are published as they are."""
+    ensure = _publish(service, published_content, make_settings, ai_lazy_summaries=True)
+
+    ensure.assert_not_called()
+    assert service.wechat_publisher.publish_article.call_args.kwargs["content"] == (
+        "Professional summary of the news"
+    )
+
+
+def test_missing_summaries_are_generated(
+    service, published_content, sample_processed_news, make_settings
+):
+    """Lazy mode generates the summaries an article is missing."""
+    sample_processed_news.summary_sci = None
+
+    ensure = _publish(service, published_content, make_settings, ai_lazy_summaries=True)
+
+    ensure.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_running_loop_publishes_without_generation(
+    service, published_content, sample_processed_news, make_settings
+):
+    """Inside an event loop, publishing does not call asyncio.run."""
+    sample_processed_news.summary_sci = None
+
+    ensure = _publish(service, published_content, make_settings, ai_lazy_summaries=True)
+
+    ensure.assert_not_called()
+    service.wechat_publisher.publish_article.assert_called_once()
@@ -0,0 +1,172 @@
+"""Tests for horizontally scalable scoring workers."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.base import Base
+from src.models import DataSource, RawNews, ProcessedNews
+from src.services.ai import (
+    ScoringService,
+    ScoringResponse,
+    SummaryResponse,
+    ProcessingMetadata,
+    FullScoringResult,
+)
+from src.tasks import run_score_workers
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory over one shared in-memory database."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def queued_news(session_factory):
+    """Create a data source with 12 raw news items."""
+    session = session_factory()
+    source = DataSource(name="Worker Source", type="rss", url="https://example.com/rss")
+    session.add(source)
+    session.commit()
+    for i in range(12):
+        session.add(RawNews(
+            source_id=source.id,
+            title=f"Worker News {i}",
+            url=f"https://example.com/worker/{i}",
+            content=f"Content {i}",
+            hash=f"worker_hash_{i}",
+            published_at=datetime.now(),
+            fetched_at=datetime.now(),
+            status="raw",
+        ))
+    session.commit()
+    session.close()
+
+
+def _scoring_result(raw_news):
+    """Minimal valid scoring result for a raw news item."""
+    return FullScoringResult(
+        raw_news_id=raw_news.id,
+        scoring=ScoringResponse(
+            score=70,
+            score_reasoning="Solid update",
+            category="company_news",
+            confidence=0.8,
+            key_points=["P1", "P2", "P3"],
+            keywords=["a", "b", "c", "d", "e"],
+            entities={"companies": [], "technologies": [], "people": []},
+            impact_analysis="Moderate impact",
+        ),
+        summaries=SummaryResponse(
+            summary_pro="公司发布新产品，提升模型推理效率。",
+            summary_sci="一家公司推出了更快的AI产品。",
+            summary_pro_en="Company ships a product with faster inference.",
+            summary_sci_en="A company released a faster AI product.",
+        ),
+        metadata=ProcessingMetadata(processing_time_ms=10, cost=0.01),
+        quality_score=0.7,
+    )
+
+
+class TestScoreWorkers:
+    """Test run_score_workers."""
+
+    @pytest.mark.asyncio
+    async def test_workers_drain_queue_without_double_scoring(
+        self, session_factory, queued_news, make_settings
+    ):
+        """Test workers split the queue and every article is scored once."""
+        scored_ids = []
+
+        async def fake_score_news(self, raw_news):
+            await asyncio.sleep(0.001)
+            if raw_news.title == "Worker News 5":
+                raise ValueError("Failed to score news: boom")
+            scored_ids.append(raw_news.id)
+            return _scoring_result(raw_news)
+
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"), \
+                patch.object(ScoringService, "score_news", fake_score_news):
+            stats = await run_score_workers(
+                make_settings(), session_factory, workers=3, batch_size=2
+            )
+
+        assert len(stats) == 3
+        assert sum(s.scored for s in stats) == 11
+        assert sum(s.failed for s in stats) == 1
+        assert all(s.claimed > 0 for s in stats)
+        assert len(scored_ids) == len(set(scored_ids)) == 11
+
+        session = session_factory()
+        assert session.query(ProcessedNews).count() == 11
+        failed = session.query(RawNews).filter(RawNews.title == "Worker News 5").one()
+        assert failed.status == "raw"
+        assert failed.retry_count == 1
+        session.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_released_and_workers_continue(self, session_factory, queued_news, make_settings):
+        """Test a batch whose save fails goes back to the queue without stopping any worker."""
+        original_save = ScoringService.save_batch_to_database
+        calls = []
+
+        async def flaky_save(self, scored, batch_size=10):
+            calls.append(len(scored))
+            if len(calls) == 1:
+                raise RuntimeError("database connection lost")
+            return await original_save(self, scored, batch_size=batch_size)
+
+        async def fake_score_news(self, raw_news):
+            return _scoring_result(raw_news)
+
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"), \
+                patch.object(ScoringService, "score_news", fake_score_news), \
+                patch.object(ScoringService, "save_batch_to_database", flaky_save):
+            stats = await run_score_workers(
+                make_settings(), session_factory, workers=3, batch_size=2
+            )
+
+        assert len(stats) == 3
+        assert sum(s.scored for s in stats) == 12
+
+        session = session_factory()
+        assert session.query(ProcessedNews).count() == 12
+        assert session.query(RawNews).filter(RawNews.status == "processing").count() == 0
+        session.close()
+
+    @pytest.mark.asyncio
+    async def test_max_articles_budget(self, session_factory, queued_news, make_settings):
+        """Test a process stops claiming once its article budget is used."""
+
+        async def fake_score_news(self, raw_news):
+            raise ValueError("Failed to score news: boom")
+
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"), \
+                patch.object(ScoringService, "score_news", fake_score_news):
+            stats = await run_score_workers(
+                make_settings(), session_factory, workers=2, batch_size=4, max_articles=5
+            )
+
+        assert sum(s.claimed for s in stats) == 5
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_dispatch(self, session_factory, queued_news, make_settings):
+        """Test no batch is dispatched when it cannot finish before the deadline."""
+        with patch("src.services.ai.scoring_service.AsyncOpenAI"):
+            stats = await run_score_workers(
+                make_settings(), session_factory, workers=2, batch_size=4, deadline_seconds=1
+            )
+
+        assert sum(s.claimed for s in stats) == 0